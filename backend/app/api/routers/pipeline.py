@@ -1,19 +1,27 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import time
 from uuid import uuid4
 
 from fastapi import APIRouter, HTTPException, Query, Request
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import PlainTextResponse, Response
 
-from app.api.contracts import CoverageComputeRequest, GenerateFullDraftRequest, GenerateSectionRequest
+from app.api.contracts import (
+    CoverageComputeRequest,
+    ExportContext,
+    GenerateFullDraftRequest,
+    GenerateSectionRequest,
+)
 from app.api.services.exporting import (
     append_export_warning,
     assemble_export_bundle_for_project,
+    build_export_etag,
     build_hackathon_markdown_report,
     collect_export_context,
     collect_missing_evidence,
     collect_unresolved_coverage_items,
+    etag_matches,
     extract_draft_paragraphs,
     extract_markdown_files,
     looks_like_export_bundle,
@@ -27,10 +35,12 @@ from app.api.services.runtime import (
     generate_validated_section_draft,
     parse_requested_sections,
     resolve_project_upload_batch,
+    resolve_requirements_artifact,
     run_requirements_extraction_for_batch,
     serialize_artifact_reference,
 )
 from app.api.services.tracing import RunTraceRecorder, evaluate_full_draft_run
+from app.config import settings
 from app.db import (
     create_coverage_artifact,
     create_draft_artifact,
@@ -148,6 +158,7 @@ def build_pipeline_router(
         payload: CoverageComputeRequest,
         document_scope: str = Query(default="latest", pattern="^(latest|all)$"),
         upload_batch_id: str | None = Query(default=None),
+        requirements_artifact_id: str | None = Query(default=None),
     ) -> dict[str, object]:
         _, selected_batch_id = resolve_project_upload_batch(
             project_id=project_id,
@@ -155,7 +166,11 @@ def build_pipeline_router(
             upload_batch_id=upload_batch_id,
         )
 
-        requirements_artifact = get_latest_requirements_artifact(project_id, upload_batch_id=selected_batch_id)
+        requirements_artifact = resolve_requirements_artifact(
+            project_id=project_id,
+            selected_batch_id=selected_batch_id,
+            requirements_artifact_id=requirements_artifact_id,
+        )
         if requirements_artifact is None:
             raise HTTPException(status_code=404, detail="No requirements artifact found for project")
 
@@ -294,27 +309,13 @@ def build_pipeline_router(
         drafting_ms_total = 0.0
         section_coverage_ms_total = 0.0
 
-        for target in section_targets:
+        def run_section(target: dict[str, object]) -> dict[str, object]:
             section_started = time.perf_counter()
-            section_key = str(target["section_key"])
-            prompt = str(target["prompt"])
-            requirement_id = str(target["requirement_id"])
-            trace.emit(
-                phase="section_drafting",
-                event_type="started",
-                payload={
-                    "section_key": section_key,
-                    "requirement_id": requirement_id,
-                    "top_k_requested": payload.top_k,
-                },
-            )
-
-            draft_started = time.perf_counter()
             draft_result = generate_validated_section_draft(
                 project_id=project_id,
                 selected_batch_id=selected_batch_id,
-                section_key=section_key,
-                query_text=prompt,
+                section_key=str(target["section_key"]),
+                query_text=str(target["prompt"]),
                 requested_top_k=payload.top_k,
                 max_revision_rounds=payload.max_revision_rounds,
                 force_retry=True,
@@ -325,86 +326,123 @@ def build_pipeline_router(
                 get_embedding_service=get_embedding_service,
                 orchestrator=runner,
             )
-            draft_ms = round((time.perf_counter() - draft_started) * 1000, 2)
-            drafting_ms_total += draft_ms
-            draft_payload = draft_result["draft"]
-            draft_payloads_by_section[section_key] = draft_payload
-            section_warnings = draft_result.get("warnings")
-            if isinstance(section_warnings, list):
-                run_warnings.extend([warning for warning in section_warnings if isinstance(warning, dict)])
-            paragraph_count = len(draft_payload.get("paragraphs", [])) if isinstance(draft_payload, dict) else 0
-            trace.emit(
-                phase="section_drafting",
-                event_type="completed",
-                payload={
-                    "section_key": section_key,
-                    "timing_ms": draft_ms,
-                    "top_k_used": draft_result.get("top_k_used"),
-                    "attempt_count": len(draft_result.get("attempts", []))
-                    if isinstance(draft_result.get("attempts"), list)
-                    else 0,
-                    "paragraph_count": paragraph_count,
-                    "warning_count": len(section_warnings) if isinstance(section_warnings, list) else 0,
-                },
-            )
-
-            artifact_meta = create_draft_artifact(
-                project_id=project_id,
-                section_key=section_key,
-                payload=draft_payload,
-                source="nova-agents-v1",
-                upload_batch_id=selected_batch_id,
-            )
+            draft_ms = round((time.perf_counter() - section_started) * 1000, 2)
 
             section_coverage_started = time.perf_counter()
-            section_coverage, section_repaired, section_validation_errors = compute_validated_coverage_payload(
+            coverage_result = compute_validated_coverage_payload(
                 requirements_payload=requirements_payload,
-                draft_payload=draft_payload,
+                draft_payload=draft_result["draft"],
                 get_nova_orchestrator=get_nova_orchestrator,
                 orchestrator=runner,
             )
             section_coverage_ms = round((time.perf_counter() - section_coverage_started) * 1000, 2)
-            section_coverage_ms_total += section_coverage_ms
-            coverage_items = section_coverage.get("items")
-            coverage_item_count = len(coverage_items) if isinstance(coverage_items, list) else 0
+            return {
+                "draft_result": draft_result,
+                "coverage_result": coverage_result,
+                "draft_ms": draft_ms,
+                "coverage_ms": section_coverage_ms,
+                "total_ms": round((time.perf_counter() - section_started) * 1000, 2),
+            }
+
+        for target in section_targets:
             trace.emit(
-                phase="section_coverage",
-                event_type="completed",
+                phase="section_drafting",
+                event_type="started",
                 payload={
-                    "section_key": section_key,
-                    "timing_ms": section_coverage_ms,
-                    "coverage_items": coverage_item_count,
-                    "validation_repaired": section_repaired,
-                    "validation_error_count": len(section_validation_errors),
+                    "section_key": str(target["section_key"]),
+                    "requirement_id": str(target["requirement_id"]),
+                    "top_k_requested": payload.top_k,
                 },
             )
 
-            combined_paragraphs.extend(extract_draft_paragraphs(draft_payload))
-
-            section_runs.append(
-                {
-                    "requirement_id": requirement_id,
-                    "section_key": section_key,
-                    "prompt": prompt,
-                    "retrieval": draft_result["retrieval"],
-                    "draft": draft_payload,
-                    "draft_artifact": artifact_meta,
-                    "grounding": draft_result["grounding"],
-                    "coverage": section_coverage,
-                    "coverage_validation": {
-                        "repaired": section_repaired,
-                        "errors": section_validation_errors,
+        # Sections are independent Bedrock round-trips, so they are drafted and covered
+        # concurrently. Trace events and artifact writes stay on this thread, in section order.
+        section_workers = max(1, min(len(section_targets), settings.full_draft_section_workers))
+        sections_started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=section_workers) as executor:
+            for target, section_result in zip(section_targets, executor.map(run_section, section_targets)):
+                section_key = str(target["section_key"])
+                prompt = str(target["prompt"])
+                requirement_id = str(target["requirement_id"])
+                draft_result = section_result["draft_result"]
+                draft_ms = section_result["draft_ms"]
+                drafting_ms_total += draft_ms
+                draft_payload = draft_result["draft"]
+                draft_payloads_by_section[section_key] = draft_payload
+                section_warnings = draft_result.get("warnings")
+                if isinstance(section_warnings, list):
+                    run_warnings.extend([warning for warning in section_warnings if isinstance(warning, dict)])
+                paragraph_count = len(draft_payload.get("paragraphs", [])) if isinstance(draft_payload, dict) else 0
+                trace.emit(
+                    phase="section_drafting",
+                    event_type="completed",
+                    payload={
+                        "section_key": section_key,
+                        "timing_ms": draft_ms,
+                        "top_k_used": draft_result.get("top_k_used"),
+                        "attempt_count": len(draft_result.get("attempts", []))
+                        if isinstance(draft_result.get("attempts"), list)
+                        else 0,
+                        "paragraph_count": paragraph_count,
+                        "warning_count": len(section_warnings) if isinstance(section_warnings, list) else 0,
                     },
-                    "attempts": draft_result["attempts"],
-                    "top_k_used": draft_result["top_k_used"],
-                    "warnings": draft_result["warnings"],
-                    "timings_ms": {
-                        "draft": draft_ms,
-                        "coverage": section_coverage_ms,
-                        "total": round((time.perf_counter() - section_started) * 1000, 2),
+                )
+
+                artifact_meta = create_draft_artifact(
+                    project_id=project_id,
+                    section_key=section_key,
+                    payload=draft_payload,
+                    source="nova-agents-v1",
+                    upload_batch_id=selected_batch_id,
+                )
+
+                section_coverage, section_repaired, section_validation_errors = section_result["coverage_result"]
+                section_coverage_ms = section_result["coverage_ms"]
+                section_coverage_ms_total += section_coverage_ms
+                coverage_items = section_coverage.get("items")
+                coverage_item_count = len(coverage_items) if isinstance(coverage_items, list) else 0
+                trace.emit(
+                    phase="section_coverage",
+                    event_type="completed",
+                    payload={
+                        "section_key": section_key,
+                        "timing_ms": section_coverage_ms,
+                        "coverage_items": coverage_item_count,
+                        "validation_repaired": section_repaired,
+                        "validation_error_count": len(section_validation_errors),
                     },
-                }
-            )
+                )
+
+                combined_paragraphs.extend(extract_draft_paragraphs(draft_payload))
+
+                section_runs.append(
+                    {
+                        "requirement_id": requirement_id,
+                        "section_key": section_key,
+                        "prompt": prompt,
+                        "retrieval": draft_result["retrieval"],
+                        "draft": draft_payload,
+                        "draft_artifact": artifact_meta,
+                        "grounding": draft_result["grounding"],
+                        "coverage": section_coverage,
+                        "coverage_validation": {
+                            "repaired": section_repaired,
+                            "errors": section_validation_errors,
+                        },
+                        "attempts": draft_result["attempts"],
+                        "top_k_used": draft_result["top_k_used"],
+                        "warnings": draft_result["warnings"],
+                        "timings_ms": {
+                            "draft": draft_ms,
+                            "coverage": section_coverage_ms,
+                            "total": section_result["total_ms"],
+                        },
+                    }
+                )
+
+        # Sections overlap, so run_summary reports the fan-out's wall-clock time; the per-section
+        # sums are kept separately and can exceed the run total.
+        sections_ms = round((time.perf_counter() - sections_started) * 1000, 2)
 
         combined_missing_evidence = collect_missing_evidence(draft_payloads_by_section)
         combined_draft_payload = {
@@ -429,7 +467,6 @@ def build_pipeline_router(
             orchestrator=runner,
         )
         final_coverage_ms = round((time.perf_counter() - coverage_started) * 1000, 2)
-        coverage_ms_total = round(section_coverage_ms_total + final_coverage_ms, 2)
         coverage_artifact = create_coverage_artifact(
             project_id=project_id,
             payload=final_coverage_payload,
@@ -447,7 +484,7 @@ def build_pipeline_router(
             phase="coverage_aggregate",
             event_type="completed",
             payload={
-                "timing_ms": coverage_ms_total,
+                "timing_ms": final_coverage_ms,
                 "coverage_counts": final_counts,
                 "validation_repaired": coverage_repaired,
                 "validation_error_count": len(coverage_validation_errors),
@@ -582,10 +619,14 @@ def build_pipeline_router(
                 "judge_quality_gate": judge_eval_gate if isinstance(judge_eval_gate, dict) else {},
                 "timings_ms": {
                     "extraction": extraction_ms,
-                    "drafting": round(drafting_ms_total, 2),
-                    "coverage": coverage_ms_total,
+                    "drafting": sections_ms,
+                    "coverage": final_coverage_ms,
                     "export": export_ms,
                     "total": total_ms,
+                    "section_sums": {
+                        "drafting": round(drafting_ms_total, 2),
+                        "coverage": round(section_coverage_ms_total, 2),
+                    },
                 },
             },
         }
@@ -651,6 +692,7 @@ def build_pipeline_router(
         use_agent: bool = Query(default=True),
         document_scope: str = Query(default="latest", pattern="^(latest|all)$"),
         upload_batch_id: str | None = Query(default=None),
+        requirements_artifact_id: str | None = Query(default=None),
     ):
         project, selected_batch_id = resolve_project_upload_batch(
             project_id=project_id,
@@ -666,6 +708,7 @@ def build_pipeline_router(
                 project_id=project_id,
                 selected_batch_id=selected_batch_id,
                 requested_sections=requested_sections,
+                requirements_artifact_id=requirements_artifact_id,
             )
             drafts = context["drafts"]
             requirements_payload = context["requirements_payload"]
@@ -699,6 +742,31 @@ def build_pipeline_router(
                 headers={"X-Export-Report-Path": str(report_path)},
             )
 
+        export_context: ExportContext | None = None
+        export_etag: str | None = None
+        if requested_format == "markdown":
+            export_context = collect_export_context(
+                project_id=project_id,
+                selected_batch_id=selected_batch_id,
+                requested_sections=requested_sections,
+                requirements_artifact_id=requirements_artifact_id,
+            )
+            export_etag = build_export_etag(
+                project_id=project_id,
+                context=export_context,
+                variant={
+                    "format": requested_format,
+                    "profile": profile,
+                    "include_debug": include_debug,
+                    "sections": requested_sections,
+                    "output_filename_base": output_filename_base,
+                    "use_agent": use_agent,
+                    "upload_batch_id": selected_batch_id,
+                },
+            )
+            if etag_matches(request.headers.get("if-none-match"), export_etag):
+                return Response(status_code=304, headers={"ETag": export_etag})
+
         export_bundle = assemble_export_bundle_for_project(
             request=request,
             project_id=project_id,
@@ -710,12 +778,14 @@ def build_pipeline_router(
             output_filename_base=output_filename_base,
             use_agent=use_agent,
             get_nova_orchestrator=get_nova_orchestrator,
+            requirements_artifact_id=requirements_artifact_id,
+            context=export_context,
         )
         markdown_files = extract_markdown_files(export_bundle)
 
-        if requested_format == "markdown":
+        if requested_format == "markdown" and export_etag is not None:
             markdown_content = combine_markdown_files(markdown_files)
-            return PlainTextResponse(markdown_content, media_type="text/markdown")
+            return PlainTextResponse(markdown_content, media_type="text/markdown", headers={"ETag": export_etag})
         return export_bundle
 
     @router.get("/projects/{project_id}/requirements/latest")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contextlib import ExitStack
 from pathlib import Path
 from uuid import uuid4
 
@@ -15,15 +16,34 @@ from app.api.services.runtime import (
 )
 from app.config import settings
 from app.db import (
-    create_chunks,
+    create_chunks_for_documents,
     create_document,
     create_project,
     delete_chunks,
     list_chunks,
     list_documents,
 )
-from app.retrieval import build_parse_report, chunk_pages, extract_text_pages
-from app.storage import StorageError, load_document_bytes, save_document_bytes
+from app.retrieval import (
+    ChunkPayload,
+    build_parse_report,
+    chunk_pages,
+    extract_text_pages,
+    extract_text_pages_many,
+)
+from app.storage import StorageError, open_document_buffer, save_document_bytes
+
+
+def _chunk_rows(chunks: list[ChunkPayload]) -> list[dict[str, object]]:
+    return [
+        {
+            "chunk_index": chunk.chunk_index,
+            "page": chunk.page,
+            "text": chunk.text,
+            "embedding": chunk.embedding,
+            "embedding_provider": chunk.embedding_provider,
+        }
+        for chunk in chunks
+    ]
 
 
 def build_projects_router(*, get_embedding_service: EmbeddingServiceGetter) -> APIRouter:
@@ -68,76 +88,73 @@ def build_projects_router(*, get_embedding_service: EmbeddingServiceGetter) -> A
                 )
             buffered_uploads.append((upload, safe_name, content))
 
-        for upload, safe_name, content in buffered_uploads:
-            content_type = upload.content_type or "application/octet-stream"
-            try:
-                storage_path = save_document_bytes(
-                    settings=settings,
+        extractions = await extract_text_pages_many(
+            [
+                (content, upload.content_type or "application/octet-stream", safe_name)
+                for upload, safe_name, content in buffered_uploads
+            ],
+            max_workers=settings.upload_parse_workers,
+        )
+
+        # Chunks for the whole batch are written with one executemany once every document is
+        # processed; the finally block still flushes finished documents if a later one fails.
+        pending_chunks: list[tuple[str, str, list[dict[str, object]]]] = []
+        try:
+            for (upload, safe_name, content), extraction in zip(buffered_uploads, extractions):
+                content_type = upload.content_type or "application/octet-stream"
+                try:
+                    storage_path = save_document_bytes(
+                        settings=settings,
+                        project_id=project_id,
+                        upload_batch_id=upload_batch_id,
+                        file_name=safe_name,
+                        content_type=content_type,
+                        content=content,
+                    )
+                except StorageError as exc:
+                    raise HTTPException(
+                        status_code=502, detail=f"Failed to persist upload '{safe_name}': {exc}"
+                    ) from exc
+
+                document = create_document(
                     project_id=project_id,
-                    upload_batch_id=upload_batch_id,
                     file_name=safe_name,
                     content_type=content_type,
+                    storage_path=storage_path,
+                    size_bytes=len(content),
+                    upload_batch_id=upload_batch_id,
+                )
+                chunks = chunk_pages(
+                    pages=extraction.pages,
+                    chunk_size_chars=settings.chunk_size_chars,
+                    chunk_overlap_chars=settings.chunk_overlap_chars,
+                    embedding_dim=settings.embedding_dim,
+                    embedding_service=embedding_service,
+                    embedding_warnings=embedding_warnings,
+                )
+                parse_report = build_parse_report(
                     content=content,
+                    content_type=str(document["content_type"]),
+                    file_name=safe_name,
+                    extraction=extraction,
+                    chunks=chunks,
                 )
-            except StorageError as exc:
-                raise HTTPException(status_code=502, detail=f"Failed to persist upload '{safe_name}': {exc}") from exc
-
-            document = create_document(
-                project_id=project_id,
-                file_name=safe_name,
-                content_type=content_type,
-                storage_path=storage_path,
-                size_bytes=len(content),
-                upload_batch_id=upload_batch_id,
-            )
-            extraction = extract_text_pages(
-                content=content,
-                content_type=str(document["content_type"]),
-                file_name=safe_name,
-            )
-            chunks = chunk_pages(
-                pages=extraction.pages,
-                chunk_size_chars=settings.chunk_size_chars,
-                chunk_overlap_chars=settings.chunk_overlap_chars,
-                embedding_dim=settings.embedding_dim,
-                embedding_service=embedding_service,
-                embedding_warnings=embedding_warnings,
-            )
-            parse_report = build_parse_report(
-                content=content,
-                content_type=str(document["content_type"]),
-                file_name=safe_name,
-                extraction=extraction,
-                chunks=chunks,
-            )
-            quality = str(parse_report.get("quality", "none"))
-            if quality not in quality_counts:
-                quality = "none"
-            quality_counts[quality] += 1
-            create_chunks(
-                project_id=project_id,
-                document_id=str(document["id"]),
-                upload_batch_id=upload_batch_id,
-                chunks=[
+                quality = str(parse_report.get("quality", "none"))
+                if quality not in quality_counts:
+                    quality = "none"
+                quality_counts[quality] += 1
+                pending_chunks.append((str(document["id"]), upload_batch_id, _chunk_rows(chunks)))
+                public_document = serialize_document_for_api(document)
+                saved_documents.append(
                     {
-                        "chunk_index": chunk.chunk_index,
-                        "page": chunk.page,
-                        "text": chunk.text,
-                        "embedding": chunk.embedding,
-                        "embedding_provider": chunk.embedding_provider,
+                        **public_document,
+                        "pages_extracted": len(extraction.pages),
+                        "chunks_indexed": len(chunks),
+                        "parse_report": parse_report,
                     }
-                    for chunk in chunks
-                ],
-            )
-            public_document = serialize_document_for_api(document)
-            saved_documents.append(
-                {
-                    **public_document,
-                    "pages_extracted": len(extraction.pages),
-                    "chunks_indexed": len(chunks),
-                    "parse_report": parse_report,
-                }
-            )
+                )
+        finally:
+            create_chunks_for_documents(project_id, pending_chunks)
 
         return {
             "project_id": project_id,
@@ -230,67 +247,60 @@ def build_projects_router(*, get_embedding_service: EmbeddingServiceGetter) -> A
         reindexed_documents: list[dict[str, object]] = []
         chunks_indexed_total = 0
 
-        for document in documents:
-            file_name = str(document.get("file_name") or "").strip()
-            content_type = str(document.get("content_type") or "application/octet-stream")
-            storage_path = str(document.get("storage_path") or "").strip()
-            if not storage_path:
-                raise HTTPException(status_code=422, detail=f"Missing storage path for document '{file_name}'.")
+        pending_chunks: list[tuple[str, str, list[dict[str, object]]]] = []
+        try:
+            for document in documents:
+                file_name = str(document.get("file_name") or "").strip()
+                content_type = str(document.get("content_type") or "application/octet-stream")
+                storage_path = str(document.get("storage_path") or "").strip()
+                if not storage_path:
+                    raise HTTPException(status_code=422, detail=f"Missing storage path for document '{file_name}'.")
 
-            try:
-                content = load_document_bytes(settings=settings, storage_path=storage_path)
-            except StorageError as exc:
-                raise HTTPException(
-                    status_code=422,
-                    detail=f"Stored file for document '{file_name}' could not be loaded ({exc}).",
-                ) from exc
-            extraction = extract_text_pages(content=content, content_type=content_type, file_name=file_name)
-            chunks = chunk_pages(
-                pages=extraction.pages,
-                chunk_size_chars=settings.chunk_size_chars,
-                chunk_overlap_chars=settings.chunk_overlap_chars,
-                embedding_dim=settings.embedding_dim,
-                embedding_service=embedding_service,
-                embedding_warnings=embedding_warnings,
-            )
-            parse_report = build_parse_report(
-                content=content,
-                content_type=content_type,
-                file_name=file_name,
-                extraction=extraction,
-                chunks=chunks,
-            )
-            quality = str(parse_report.get("quality", "none"))
-            if quality not in quality_counts:
-                quality = "none"
-            quality_counts[quality] += 1
+                with ExitStack() as document_stack:
+                    try:
+                        content = document_stack.enter_context(
+                            open_document_buffer(settings=settings, storage_path=storage_path)
+                        )
+                    except StorageError as exc:
+                        raise HTTPException(
+                            status_code=422,
+                            detail=f"Stored file for document '{file_name}' could not be loaded ({exc}).",
+                        ) from exc
+                    extraction = extract_text_pages(content=content, content_type=content_type, file_name=file_name)
+                    chunks = chunk_pages(
+                        pages=extraction.pages,
+                        chunk_size_chars=settings.chunk_size_chars,
+                        chunk_overlap_chars=settings.chunk_overlap_chars,
+                        embedding_dim=settings.embedding_dim,
+                        embedding_service=embedding_service,
+                        embedding_warnings=embedding_warnings,
+                    )
+                    parse_report = build_parse_report(
+                        content=content,
+                        content_type=content_type,
+                        file_name=file_name,
+                        extraction=extraction,
+                        chunks=chunks,
+                    )
+                quality = str(parse_report.get("quality", "none"))
+                if quality not in quality_counts:
+                    quality = "none"
+                quality_counts[quality] += 1
 
-            document_upload_batch_id = selected_batch_id or str(document.get("upload_batch_id") or "legacy")
-            create_chunks(
-                project_id=project_id,
-                document_id=str(document["id"]),
-                upload_batch_id=document_upload_batch_id,
-                chunks=[
+                document_upload_batch_id = selected_batch_id or str(document.get("upload_batch_id") or "legacy")
+                pending_chunks.append((str(document["id"]), document_upload_batch_id, _chunk_rows(chunks)))
+                chunks_indexed_total += len(chunks)
+                public_document = serialize_document_for_api(document)
+                reindexed_documents.append(
                     {
-                        "chunk_index": chunk.chunk_index,
-                        "page": chunk.page,
-                        "text": chunk.text,
-                        "embedding": chunk.embedding,
-                        "embedding_provider": chunk.embedding_provider,
+                        **public_document,
+                        "pages_extracted": len(extraction.pages),
+                        "chunks_indexed": len(chunks),
+                        "parse_report": parse_report,
                     }
-                    for chunk in chunks
-                ],
-            )
-            chunks_indexed_total += len(chunks)
-            public_document = serialize_document_for_api(document)
-            reindexed_documents.append(
-                {
-                    **public_document,
-                    "pages_extracted": len(extraction.pages),
-                    "chunks_indexed": len(chunks),
-                    "parse_report": parse_report,
-                }
-            )
+                )
+        finally:
+            create_chunks_for_documents(project_id, pending_chunks)
 
         return {
             "project_id": project_id,
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import os
 from pathlib import Path
@@ -10,6 +12,7 @@ from fastapi import Request
 from app.api.contracts import ExportContext
 from app.api.services.runtime import (
     NovaOrchestratorGetter,
+    resolve_requirements_artifact,
     select_primary_rfp_document,
     select_requirement_chunks,
     serialize_document_for_api,
@@ -18,7 +21,6 @@ from app.config import settings
 from app.db import (
     get_latest_coverage_artifact,
     get_latest_draft_artifact,
-    get_latest_requirements_artifact,
     list_chunks,
     list_documents,
     list_latest_draft_artifacts,
@@ -157,7 +159,7 @@ def write_markdown_export_files(project_id: str, markdown_files: list[dict[str,
         relative_path = sanitize_relative_export_path(raw_path)
         destination = exports_root / relative_path
         destination.parent.mkdir(parents=True, exist_ok=True)
-        destination.write_text(content, encoding="utf-8")
+        destination.write_bytes(content.encode("utf-8"))
         written_files.append(str(relative_path))
 
     return written_files
@@ -168,8 +170,13 @@ def collect_export_context(
     project_id: str,
     selected_batch_id: str | None,
     requested_sections: list[str],
+    requirements_artifact_id: str | None = None,
 ) -> ExportContext:
-    requirements_artifact = get_latest_requirements_artifact(project_id, upload_batch_id=selected_batch_id)
+    requirements_artifact = resolve_requirements_artifact(
+        project_id=project_id,
+        selected_batch_id=selected_batch_id,
+        requirements_artifact_id=requirements_artifact_id,
+    )
     draft_artifacts = list_latest_draft_artifacts(project_id, upload_batch_id=selected_batch_id)
     coverage_artifact = get_latest_coverage_artifact(project_id, upload_batch_id=selected_batch_id)
     documents = list_documents(project_id, upload_batch_id=selected_batch_id)
@@ -231,6 +238,28 @@ def collect_export_context(
     }
 
 
+def build_export_etag(
+    *,
+    project_id: str,
+    context: ExportContext,
+    variant: Mapping[str, object],
+) -> str:
+    parts = [project_id, json.dumps(dict(variant), sort_keys=True, separators=(",", ":"))]
+    parts.extend(f"{artifact['type']}:{artifact['id']}" for artifact in context["artifacts_used"])
+    parts.extend(
+        f"document:{document.get('id')}:{document.get('page_count')}" for document in context["documents_payload"]
+    )
+    digest = hashlib.blake2b("|".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
 def extract_draft_payloads(drafts: dict[str, dict[str, object]]) -> dict[str, dict[str, object]]:
     payloads: dict[str, dict[str, object]] = {}
     for section_name, entry in drafts.items():
@@ -333,7 +362,7 @@ def build_hackathon_markdown_report(
 def write_hackathon_report(project_id: str, markdown_report: str, request: Request) -> Path:
     report_path = Path("docs/exports") / project_id / "report.md"
     report_path.parent.mkdir(parents=True, exist_ok=True)
-    report_path.write_text(markdown_report, encoding="utf-8")
+    report_path.write_bytes(markdown_report.encode("utf-8"))
 
     logger.info(
         "export_report_written",
@@ -389,12 +418,16 @@ def assemble_export_bundle_for_project(
     output_filename_base: str | None,
     use_agent: bool,
     get_nova_orchestrator: NovaOrchestratorGetter,
+    requirements_artifact_id: str | None = None,
+    context: ExportContext | None = None,
 ) -> dict[str, object]:
-    context: ExportContext = collect_export_context(
-        project_id=project_id,
-        selected_batch_id=selected_batch_id,
-        requested_sections=requested_sections,
-    )
+    if context is None:
+        context = collect_export_context(
+            project_id=project_id,
+            selected_batch_id=selected_batch_id,
+            requested_sections=requested_sections,
+            requirements_artifact_id=requirements_artifact_id,
+        )
     drafts = context["drafts"]
     requirements_payload = context["requirements_payload"]
     coverage_payload = context["coverage_payload"]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import heapq
 import logging
 import re
 from typing import Callable, Mapping
@@ -9,12 +10,15 @@ from fastapi import HTTPException
 from app.config import settings
 from app.coverage import (
     normalize_coverage_payload,
+    split_locally_decided_coverage,
     validate_with_repair as validate_coverage_with_repair,
 )
 from app.db import (
     create_requirements_artifact,
+    get_latest_requirements_artifact,
     get_latest_upload_batch_id,
     get_project,
+    get_requirements_artifact,
     list_chunks,
     upload_batch_exists,
 )
@@ -34,7 +38,8 @@ from app.requirements import (
 from app.retrieval import (
     EmbeddingProviderError,
     EmbeddingService,
-    cosine_similarity,
+    sparse_dot,
+    sparse_terms,
 )
 
 logger = logging.getLogger("nebula.api")
@@ -143,23 +148,17 @@ def rank_chunks_by_query(
             },
         )
 
-    scored_results: list[dict[str, object]] = []
+    # Hash query vectors touch only a handful of slots, so score against the query's non-zero terms.
+    query_terms = sparse_terms(query_embedding)
+    # Score every eligible chunk first and only materialize result payloads for the top_k winners.
+    scored_indexes: list[tuple[float, int]] = []
     skipped_chunks = 0
-    for chunk in chunks:
+    for index, chunk in enumerate(chunks):
         embedding = chunk.get("embedding")
         if not isinstance(embedding, list) or len(embedding) != target_dim:
             skipped_chunks += 1
             continue
-        scored_results.append(
-            {
-                "chunk_id": chunk["id"],
-                "document_id": chunk["document_id"],
-                "file_name": chunk["file_name"],
-                "page": chunk["page"],
-                "text": chunk["text"],
-                "score": cosine_similarity(query_embedding, embedding),
-            }
-        )
+        scored_indexes.append((sparse_dot(query_terms, embedding), index))
     if skipped_chunks > 0:
         logger.warning(
             "embedding_dim_chunks_skipped",
@@ -182,8 +181,22 @@ def rank_chunks_by_query(
                 "total_chunks": len(chunks),
             },
         )
-    scored_results.sort(key=lambda item: float(item["score"]), reverse=True)
-    return scored_results[:top_k], warnings
+    # nlargest is equivalent to a stable descending sort + slice, so ties keep chunk order.
+    top_scored = heapq.nlargest(top_k, scored_indexes, key=lambda item: item[0])
+    scored_results: list[dict[str, object]] = []
+    for score, index in top_scored:
+        chunk = chunks[index]
+        scored_results.append(
+            {
+                "chunk_id": chunk["id"],
+                "document_id": chunk["document_id"],
+                "file_name": chunk["file_name"],
+                "page": chunk["page"],
+                "text": chunk["text"],
+                "score": score,
+            }
+        )
+    return scored_results, warnings
 
 
 def select_requirement_chunks(chunks: list[dict[str, object]]) -> list[dict[str, object]]:
@@ -274,6 +287,20 @@ def resolve_project_upload_batch(
     return project, selected_batch_id
 
 
+def resolve_requirements_artifact(
+    *,
+    project_id: str,
+    selected_batch_id: str | None,
+    requirements_artifact_id: str | None,
+) -> dict[str, object] | None:
+    if requirements_artifact_id:
+        artifact = get_requirements_artifact(project_id, requirements_artifact_id.strip())
+        if artifact is None:
+            raise HTTPException(status_code=404, detail="Requested requirements artifact not found for project")
+        return artifact
+    return get_latest_requirements_artifact(project_id, upload_batch_id=selected_batch_id)
+
+
 def serialize_artifact_reference(artifact: Mapping[str, object]) -> dict[str, object]:
     return {
         "id": artifact["id"],
@@ -485,16 +512,41 @@ def compute_validated_coverage_payload(
     orchestrator: BedrockNovaOrchestrator | None = None,
 ) -> tuple[dict[str, object], bool, list[str]]:
     runner = orchestrator or get_nova_orchestrator()
-    try:
-        coverage_payload = runner.compute_coverage(
-            requirements=requirements_payload,
-            draft=draft_payload,
+    decided_items: list[dict[str, object]] = []
+    review_requirements = requirements_payload
+    if settings.coverage_local_prefilter:
+        decided_items, review_requirements = split_locally_decided_coverage(requirements_payload, draft_payload)
+
+    model_skipped = bool(decided_items) and not review_requirements.get("questions") and not review_requirements.get(
+        "required_attachments"
+    )
+    if settings.coverage_local_prefilter:
+        logger.info(
+            "coverage_shortcircuit",
+            extra={
+                "event": "coverage_shortcircuit",
+                "coverage_shortcircuit_count": len(decided_items),
+                "model_review_skipped": model_skipped,
+            },
         )
-    except NovaRuntimeError as exc:
-        raise HTTPException(
-            status_code=502,
-            detail={"message": "Nova coverage computation failed.", "error": str(exc)},
-        ) from exc
+    if model_skipped:
+        coverage_payload: dict[str, object] = {"items": decided_items}
+    else:
+        try:
+            coverage_payload = runner.compute_coverage(
+                requirements=review_requirements,
+                draft=draft_payload,
+            )
+        except NovaRuntimeError as exc:
+            raise HTTPException(
+                status_code=502,
+                detail={"message": "Nova coverage computation failed.", "error": str(exc)},
+            ) from exc
+        if decided_items:
+            model_items = coverage_payload.get("items") if isinstance(coverage_payload, dict) else None
+            coverage_payload = {
+                "items": [*decided_items, *(model_items if isinstance(model_items, list) else [])]
+            }
     coverage_payload = normalize_coverage_payload(
         requirements=requirements_payload,
         payload=coverage_payload,
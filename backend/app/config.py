@@ -23,9 +23,13 @@ class Settings(BaseSettings):
     bedrock_lite_model_id: str = "amazon.nova-lite-v1:0"
     bedrock_validate_model_ids_on_startup: bool = False
     bedrock_embedding_model_id: str = "amazon.titan-embed-text-v2:0"
+    # Mark stable prompt prefixes with Converse cachePoint blocks; needs a model with prompt caching.
+    bedrock_prompt_caching: bool = False
     embedding_mode: str = "hash"
     agent_temperature: float = 0.1
     agent_max_tokens: int = 2048
+    # Identical Nova requests reuse the previous response from an in-process LRU of this size (0 = off).
+    nova_response_cache_size: int = 0
     enable_agentic_orchestration_pilot: bool = False
     storage_backend: str = "local"  # local|s3
     s3_bucket: str = "nebula-dev"
@@ -33,10 +37,18 @@ class Settings(BaseSettings):
     vector_store: str = "local"
     # MVP default is sqlite; production should use RDS Postgres (e.g. postgresql://...).
     database_url: str = "sqlite:///./nebula.db"
+    # File-backed sqlite tuning; ignored for in-memory and postgres URLs.
+    sqlite_journal_mode: str = "wal"
+    sqlite_synchronous: str = "normal"
+    sqlite_cache_size_kib: int = 64000
     storage_root: str = "data/uploads"
     chunk_size_chars: int = 1200
     chunk_overlap_chars: int = 200
     embedding_dim: int = 128
+    # Chunk embedding persistence: "float32" JSON components or "int8" codes with a per-vector scale.
+    embedding_storage: str = "float32"
+    # Concurrent Bedrock embedding calls per chunk batch; 1 embeds one chunk at a time.
+    embedding_batch_workers: int = 4
     retrieval_top_k_default: int = 5
     extraction_context_max_chunks: int = 20
     extraction_context_max_chars_per_chunk: int = 600
@@ -44,12 +56,20 @@ class Settings(BaseSettings):
     extraction_window_size_chunks: int = 14
     extraction_window_overlap_chunks: int = 4
     extraction_window_max_passes: int = 4
+    # Extraction windows sent to Bedrock concurrently; 1 restores one-at-a-time calls.
+    extraction_window_workers: int = 4
     judge_eval_min_overall_score: float = 0.65
     judge_eval_min_dimension_score: float = 0.55
     judge_eval_block_on_fail: bool = False
+    # Decide clear-cut coverage (well-covered or uncited drafts) locally and send only the rest to Nova.
+    coverage_local_prefilter: bool = False
     max_upload_files: int = 20
     max_upload_file_bytes: int = 10 * 1024 * 1024
     max_upload_batch_bytes: int = 25 * 1024 * 1024
+    # Process-pool size for parsing multi-file uploads; 1 keeps parsing in the API process.
+    upload_parse_workers: int = 1
+    # Sections drafted concurrently by /generate-full-draft; each is an independent Bedrock round-trip.
+    full_draft_section_workers: int = 4
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
@@ -195,11 +195,7 @@ def normalize_coverage_payload(
         if status not in {"met", "partial", "missing"}:
             status = "missing"
 
-        existing_index = next(
-            (index for index, existing in enumerate(normalized_items) if existing["requirement_id"] == requirement_id),
-            None,
-        )
-        if existing_index is not None:
+        if requirement_id in seen_ids:
             continue
 
         normalized_items.append(
@@ -231,16 +227,11 @@ def normalize_coverage_payload(
     return {"items": normalized_items}
 
 
-def _tokens(text: str) -> set[str]:
-    return set(re.findall(r"[a-z0-9]+", text.lower()))
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
 
 
-def _overlap_score(requirement_text: str, paragraph_text: str) -> float:
-    req_tokens = _tokens(requirement_text)
-    para_tokens = _tokens(paragraph_text)
-    if not req_tokens:
-        return 0.0
-    return len(req_tokens & para_tokens) / len(req_tokens)
+def _tokens(text: str) -> set[str]:
+    return set(_TOKEN_PATTERN.findall(text.lower()))
 
 
 def _evidence_refs(paragraph: dict[str, object]) -> list[str]:
@@ -255,6 +246,141 @@ def _evidence_refs(paragraph: dict[str, object]) -> list[str]:
     return refs
 
 
+def _paragraph_token_sets(paragraphs: list[object]) -> list[tuple[set[str], dict[str, object]]]:
+    """Tokenize each draft paragraph once so every requirement scores against the same sets."""
+
+    return [
+        (_tokens(str(paragraph.get("text", ""))), paragraph) for paragraph in paragraphs if isinstance(paragraph, dict)
+    ]
+
+
+def _best_paragraph_match(
+    prompt: str, paragraph_tokens: list[tuple[set[str], dict[str, object]]]
+) -> tuple[float, list[str]]:
+    req_tokens = _tokens(prompt)
+    if not req_tokens:
+        return 0.0, []
+    best_score = 0.0
+    best_paragraph: dict[str, object] | None = None
+    for para_tokens, paragraph in paragraph_tokens:
+        score = len(req_tokens & para_tokens) / len(req_tokens)
+        if score > best_score:
+            best_score = score
+            best_paragraph = paragraph
+    return best_score, _evidence_refs(best_paragraph) if best_paragraph is not None else []
+
+
+# Token overlap a cited paragraph needs before a question is marked met without a model review.
+LOCAL_COVERAGE_MET_THRESHOLD = 0.7
+
+
+def _cited_paragraph_naming(requirement_text: str, paragraphs: list[object]) -> list[str] | None:
+    needle = _normalize_text(requirement_text)
+    if not needle:
+        return None
+    for paragraph in paragraphs:
+        if not isinstance(paragraph, dict):
+            continue
+        refs = _evidence_refs(paragraph)
+        if refs and f" {needle} " in f" {_normalize_text(str(paragraph.get('text', '')))} ":
+            return refs
+    return None
+
+
+def split_locally_decided_coverage(
+    requirements: dict[str, object], draft: dict[str, object]
+) -> tuple[list[dict[str, object]], dict[str, object]]:
+    """Decide clear-cut requirements locally and return the requirements still needing a model review.
+
+    A question is met when a cited paragraph repeats most of its terms, and an attachment when a
+    cited paragraph names it verbatim; anything is missing when the draft has no cited paragraph at
+    all. Everything else is left for review.
+    """
+    questions = requirements.get("questions", [])
+    paragraphs = draft.get("paragraphs", [])
+    if not isinstance(questions, list):
+        questions = []
+    if not isinstance(paragraphs, list):
+        paragraphs = []
+    # Id-less questions are numbered by position, so a filtered subset would renumber them.
+    if any(
+        isinstance(question, dict) and not str(question.get("internal_id") or question.get("id") or "").strip()
+        for question in questions
+    ):
+        return [], requirements
+    has_cited_paragraph = any(
+        isinstance(paragraph, dict) and _evidence_refs(paragraph) for paragraph in paragraphs
+    )
+    paragraph_tokens = _paragraph_token_sets(paragraphs)
+
+    decided: list[dict[str, object]] = []
+    undecided_questions: list[object] = []
+    for question in questions:
+        if not isinstance(question, dict):
+            continue
+        prompt = str(question.get("prompt", "")).strip()
+        req_id = str(question.get("internal_id") or question.get("id") or "").strip()
+        if not prompt:
+            undecided_questions.append(question)
+            continue
+
+        best_score, best_refs = _best_paragraph_match(prompt, paragraph_tokens)
+        if best_score >= LOCAL_COVERAGE_MET_THRESHOLD and best_refs:
+            status: CoverageStatus = "met"
+            notes = "Requirement appears fully addressed with cited evidence."
+        elif not has_cited_paragraph:
+            status = "missing"
+            notes = "No meaningful evidence-backed coverage found in draft."
+        else:
+            undecided_questions.append(question)
+            continue
+
+        decided.append(
+            {
+                "requirement_id": req_id,
+                "internal_id": req_id,
+                "original_id": _normalize_optional_id(question.get("original_id")),
+                "status": status,
+                "notes": notes,
+                "evidence_refs": best_refs,
+            }
+        )
+
+    # Attachments are also numbered by position (A1, A2, ...), so they only skip the review when
+    # every one of them is decided here; otherwise the whole list goes to the model unchanged.
+    review_requirements = {**requirements, "questions": undecided_questions}
+    attachments = requirements.get("required_attachments")
+    if isinstance(attachments, list) and attachments:
+        attachment_items: list[dict[str, object]] = []
+        for attachment in attachments:
+            attachment_text = str(attachment).strip()
+            if not attachment_text:
+                continue
+            identifier = f"A{len(attachment_items) + 1}"
+            refs = _cited_paragraph_naming(attachment_text, paragraphs)
+            if refs:
+                status, notes = "met", "Attachment is named verbatim in a cited draft paragraph."
+            elif not has_cited_paragraph:
+                status, notes = "missing", "No meaningful evidence-backed coverage found in draft."
+            else:
+                break
+            attachment_items.append(
+                {
+                    "requirement_id": identifier,
+                    "internal_id": identifier,
+                    "original_id": None,
+                    "status": status,
+                    "notes": notes,
+                    "evidence_refs": refs or [],
+                }
+            )
+        else:
+            decided.extend(attachment_items)
+            review_requirements["required_attachments"] = []
+
+    return decided, review_requirements
+
+
 def build_coverage_payload(requirements: dict[str, object], draft: dict[str, object]) -> dict[str, object]:
     questions = requirements.get("questions", [])
     paragraphs = draft.get("paragraphs", [])
@@ -265,6 +391,7 @@ def build_coverage_payload(requirements: dict[str, object], draft: dict[str, obj
     if not isinstance(paragraphs, list):
         paragraphs = []
 
+    paragraph_tokens = _paragraph_token_sets(paragraphs)
     for question in questions:
         if not isinstance(question, dict):
             continue
@@ -274,16 +401,7 @@ def build_coverage_payload(requirements: dict[str, object], draft: dict[str, obj
         if not prompt:
             continue
 
-        best_score = 0.0
-        best_refs: list[str] = []
-        for paragraph in paragraphs:
-            if not isinstance(paragraph, dict):
-                continue
-            score = _overlap_score(prompt, str(paragraph.get("text", "")))
-            if score > best_score:
-                best_score = score
-                best_refs = _evidence_refs(paragraph)
-
+        best_score, best_refs = _best_paragraph_match(prompt, paragraph_tokens)
         if best_score >= 0.2 and best_refs:
             status: CoverageStatus = "met"
             notes = "Requirement appears fully addressed with cited evidence."
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
+from array import array
+import base64
 from contextlib import contextmanager
 from datetime import datetime, timezone
 import hashlib
@@ -11,6 +14,11 @@ from uuid import uuid4
 
 from app.config import settings
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional accelerator
+    orjson = None
+
 
 def _normalized_database_url() -> str:
     return str(settings.database_url or "").strip()
@@ -35,6 +43,72 @@ def _sqlite_database_path() -> Path:
     return Path(url[len(prefix) :])
 
 
+# In-memory databases live exactly as long as a connection to them is open, so each memory
+# URI gets one process-wide connection that every get_conn() call reuses (the raw-sqlite3
+# equivalent of a StaticPool). The lock serializes access from FastAPI's worker threads.
+_SQLITE_MEMORY_CONNECTIONS: dict[str, tuple[sqlite3.Connection, threading.RLock]] = {}
+_SQLITE_MEMORY_CONNECTIONS_LOCK = threading.Lock()
+
+
+def _sqlite_uri_target() -> str | None:
+    """Return the SQLite URI filename for sqlite:///file:... URLs, else None."""
+
+    target = str(_sqlite_database_path())
+    if not target.startswith("file:"):
+        return None
+    return target
+
+
+def _is_sqlite_memory_uri(target: str) -> bool:
+    return "mode=memory" in target or target.startswith("file::memory:")
+
+
+def _shared_sqlite_memory_connection(uri_target: str) -> tuple[sqlite3.Connection, threading.RLock]:
+    with _SQLITE_MEMORY_CONNECTIONS_LOCK:
+        shared = _SQLITE_MEMORY_CONNECTIONS.get(uri_target)
+        if shared is None:
+            conn = sqlite3.connect(uri_target, uri=True, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA foreign_keys = ON")
+            shared = _SQLITE_MEMORY_CONNECTIONS[uri_target] = (conn, threading.RLock())
+        return shared
+
+
+_SQLITE_JOURNAL_MODES = {"delete", "truncate", "persist", "memory", "wal", "off"}
+_SQLITE_SYNCHRONOUS_MODES = {"off", "normal", "full", "extra"}
+
+
+def _sqlite_pragma_choice(setting_name: str, value: str, allowed: set[str]) -> str:
+    normalized = str(value or "").strip().lower()
+    if normalized not in allowed:
+        raise RuntimeError(f"Unsupported {setting_name.upper()} '{value}'. Supported: {', '.join(sorted(allowed))}.")
+    return normalized
+
+
+def _apply_sqlite_file_pragmas(conn: sqlite3.Connection) -> None:
+    # synchronous/temp_store/cache_size are per-connection. init_db() persists WAL in the file header,
+    # but every other journal mode only lasts for the connection that set it.
+    journal_mode = _sqlite_pragma_choice("sqlite_journal_mode", settings.sqlite_journal_mode, _SQLITE_JOURNAL_MODES)
+    if journal_mode != "wal":
+        conn.execute(f"PRAGMA journal_mode = {journal_mode}")
+    synchronous = _sqlite_pragma_choice("sqlite_synchronous", settings.sqlite_synchronous, _SQLITE_SYNCHRONOUS_MODES)
+    conn.execute(f"PRAGMA synchronous = {synchronous}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute(f"PRAGMA cache_size = -{max(0, int(settings.sqlite_cache_size_kib))}")
+
+
+def _connect_sqlite() -> sqlite3.Connection:
+    uri_target = _sqlite_uri_target()
+    if uri_target is None:
+        db_path = _sqlite_database_path()
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(db_path)
+    else:
+        conn = sqlite3.connect(uri_target, uri=True)
+    _apply_sqlite_file_pragmas(conn)
+    return conn
+
+
 def _sql(sqlite_sql: str) -> str:
     """Translate sqlite-style SQL (qmark placeholders) to the active backend."""
 
@@ -48,6 +122,70 @@ def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+# orjson reads integers wider than 64 bits as floats; any 20-digit run sends the row to json.loads.
+# Folding digits to "0" and doing a substring check is several times cheaper than a \d{20} regex scan.
+_DIGIT_FOLD_TABLE = str.maketrans("123456789", "000000000")
+_WIDE_INTEGER_MARKER = "0" * 20
+
+
+def _load_payload_json(raw: str) -> object:
+    """Decode a stored artifact/trace payload, with orjson when it is installed.
+
+    Payloads are written by json.dumps, which also emits NaN/Infinity and lone surrogate escapes;
+    orjson rejects those, so such rows fall back to the stdlib decoder as well.
+    """
+
+    if orjson is not None and _WIDE_INTEGER_MARKER not in raw.translate(_DIGIT_FOLD_TABLE):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+# Embedding components are persisted at float32 precision (7 decimals, compact separators):
+# Bedrock returns float32 vectors anyway, and full float64 reprs roughly double the stored
+# JSON and the json.loads cost on every retrieval.
+_EMBEDDING_STORAGE_DECIMALS = 7
+
+
+# With EMBEDDING_STORAGE=int8 each vector is stored as symmetric int8 codes plus one per-vector
+# scale (max |component| / 127), about 1.3 bytes per component instead of ~10 as JSON floats.
+_INT8_EMBEDDING_KEY = "q8"
+_EMBEDDING_STORAGE_FORMATS = {"float32", "int8"}
+
+
+def _quantize_embedding(vector: list[object]) -> dict[str, object]:
+    values = [float(value) for value in vector]
+    peak = max((abs(value) for value in values), default=0.0)
+    scale = peak / 127 if peak > 0 else 1.0
+    codes = array("b", [round(value / scale) for value in values])
+    return {_INT8_EMBEDDING_KEY: base64.b64encode(codes.tobytes()).decode("ascii"), "scale": scale}
+
+
+def _encode_embedding(vector: object) -> str:
+    if not isinstance(vector, list):
+        return json.dumps(vector)
+    storage = str(settings.embedding_storage or "").strip().lower()
+    if storage not in _EMBEDDING_STORAGE_FORMATS:
+        raise RuntimeError(
+            f"Unsupported EMBEDDING_STORAGE '{settings.embedding_storage}'. "
+            f"Supported: {', '.join(sorted(_EMBEDDING_STORAGE_FORMATS))}."
+        )
+    if storage == "int8":
+        return json.dumps(_quantize_embedding(vector), separators=(",", ":"))
+    return json.dumps([round(float(value), _EMBEDDING_STORAGE_DECIMALS) for value in vector], separators=(",", ":"))
+
+
+def _decode_embedding(raw: str) -> object:
+    decoded = json.loads(raw)
+    if isinstance(decoded, dict) and _INT8_EMBEDDING_KEY in decoded:
+        scale = float(decoded["scale"])
+        codes = array("b", base64.b64decode(decoded[_INT8_EMBEDDING_KEY]))
+        return [code * scale for code in codes]
+    return decoded
+
+
 def init_db() -> None:
     schema_sql = """
             CREATE TABLE IF NOT EXISTS projects (
@@ -177,10 +315,13 @@ def init_db() -> None:
 
     backend = _database_backend()
     if backend == "sqlite":
-        db_path = _sqlite_database_path()
-        db_path.parent.mkdir(parents=True, exist_ok=True)
-        with sqlite3.connect(db_path) as conn:
-            conn.execute("PRAGMA foreign_keys = ON")
+        with get_conn() as conn:
+            uri_target = _sqlite_uri_target()
+            if uri_target is None or not _is_sqlite_memory_uri(uri_target):
+                journal_mode = _sqlite_pragma_choice(
+                    "sqlite_journal_mode", settings.sqlite_journal_mode, _SQLITE_JOURNAL_MODES
+                )
+                conn.execute(f"PRAGMA journal_mode = {journal_mode}")
             conn.executescript(schema_sql)
             _ensure_column(conn, "documents", "upload_batch_id", "TEXT")
             _ensure_column(conn, "chunks", "upload_batch_id", "TEXT")
@@ -319,7 +460,19 @@ class _PostgresConn:
 def get_conn() -> Iterator[sqlite3.Connection | _PostgresConn]:
     backend = _database_backend()
     if backend == "sqlite":
-        conn = sqlite3.connect(_sqlite_database_path())
+        uri_target = _sqlite_uri_target()
+        if uri_target is not None and _is_sqlite_memory_uri(uri_target):
+            shared_conn, lock = _shared_sqlite_memory_connection(uri_target)
+            with lock:
+                try:
+                    yield shared_conn
+                    shared_conn.commit()
+                except BaseException:
+                    shared_conn.rollback()
+                    raise
+            return
+
+        conn = _connect_sqlite()
         conn.row_factory = sqlite3.Row
         try:
             conn.execute("PRAGMA foreign_keys = ON")
@@ -344,17 +497,18 @@ def get_conn() -> Iterator[sqlite3.Connection | _PostgresConn]:
 
 
 def create_project(name: str) -> dict[str, str]:
-    project = {
-        "id": str(uuid4()),
-        "name": name,
-        "created_at": _utc_now_iso(),
-    }
+    return create_projects([name])[0]
+
+
+def create_projects(names: list[str]) -> list[dict[str, str]]:
+    created_at = _utc_now_iso()
+    projects = [{"id": str(uuid4()), "name": name, "created_at": created_at} for name in names]
     with get_conn() as conn:
-        conn.execute(
+        conn.executemany(
             "INSERT INTO projects (id, name, created_at) VALUES (?, ?, ?)",
-            (project["id"], project["name"], project["created_at"]),
+            [(project["id"], project["name"], project["created_at"]) for project in projects],
         )
-    return project
+    return projects
 
 
 def get_project(project_id: str) -> dict[str, str] | None:
@@ -462,37 +616,50 @@ def create_chunks(
     chunks: list[dict[str, object]],
     upload_batch_id: str,
 ) -> list[dict[str, object]]:
+    return create_chunks_for_documents(project_id, [(document_id, upload_batch_id, chunks)])
+
+
+def create_chunks_for_documents(
+    project_id: str,
+    documents: list[tuple[str, str, list[dict[str, object]]]],
+) -> list[dict[str, object]]:
+    """Insert the chunks of several documents with one executemany in a single transaction.
+
+    ``documents`` holds ``(document_id, upload_batch_id, chunks)`` entries.
+    """
+
     now = _utc_now_iso()
     rows: list[dict[str, object]] = []
     param_rows: list[tuple[object, ...]] = []
-    for chunk in chunks:
-        row = {
-            "id": str(uuid4()),
-            "project_id": project_id,
-            "document_id": document_id,
-            "chunk_index": int(chunk["chunk_index"]),
-            "page": int(chunk["page"]),
-            "text": str(chunk["text"]),
-            "embedding_json": json.dumps(chunk["embedding"]),
-            "embedding_provider": str(chunk.get("embedding_provider") or "hash"),
-            "upload_batch_id": upload_batch_id,
-            "created_at": now,
-        }
-        rows.append(row)
-        param_rows.append(
-            (
-                row["id"],
-                row["project_id"],
-                row["document_id"],
-                row["chunk_index"],
-                row["page"],
-                row["text"],
-                row["embedding_json"],
-                row["embedding_provider"],
-                row["upload_batch_id"],
-                row["created_at"],
+    for document_id, upload_batch_id, chunks in documents:
+        for chunk in chunks:
+            row = {
+                "id": str(uuid4()),
+                "project_id": project_id,
+                "document_id": document_id,
+                "chunk_index": int(chunk["chunk_index"]),
+                "page": int(chunk["page"]),
+                "text": str(chunk["text"]),
+                "embedding_json": _encode_embedding(chunk["embedding"]),
+                "embedding_provider": str(chunk.get("embedding_provider") or "hash"),
+                "upload_batch_id": upload_batch_id,
+                "created_at": now,
+            }
+            rows.append(row)
+            param_rows.append(
+                (
+                    row["id"],
+                    row["project_id"],
+                    row["document_id"],
+                    row["chunk_index"],
+                    row["page"],
+                    row["text"],
+                    row["embedding_json"],
+                    row["embedding_provider"],
+                    row["upload_batch_id"],
+                    row["created_at"],
+                )
             )
-        )
 
     if not rows:
         return []
@@ -539,7 +706,7 @@ def list_chunks(project_id: str, upload_batch_id: str | None = None) -> list[dic
     parsed: list[dict[str, object]] = []
     for row in rows:
         item = dict(row)
-        item["embedding"] = json.loads(item.pop("embedding_json"))
+        item["embedding"] = _decode_embedding(item.pop("embedding_json"))
         parsed.append(item)
     return parsed
 
@@ -610,7 +777,24 @@ def get_latest_requirements_artifact(project_id: str, upload_batch_id: str | Non
     if row is None:
         return None
     parsed = dict(row)
-    parsed["payload"] = json.loads(parsed.pop("payload_json"))
+    parsed["payload"] = _load_payload_json(parsed.pop("payload_json"))
+    return parsed
+
+
+def get_requirements_artifact(project_id: str, artifact_id: str) -> dict[str, object] | None:
+    with get_conn() as conn:
+        row = conn.execute(
+            """
+            SELECT id, project_id, payload_json, upload_batch_id, source, created_at
+            FROM requirements_artifacts
+            WHERE project_id = ? AND id = ?
+            """,
+            (project_id, artifact_id),
+        ).fetchone()
+    if row is None:
+        return None
+    parsed = dict(row)
+    parsed["payload"] = _load_payload_json(parsed.pop("payload_json"))
     return parsed
 
 
@@ -676,7 +860,7 @@ def get_latest_draft_artifact(
     if row is None:
         return None
     parsed = dict(row)
-    parsed["payload"] = json.loads(parsed.pop("payload_json"))
+    parsed["payload"] = _load_payload_json(parsed.pop("payload_json"))
     return parsed
 
 
@@ -712,7 +896,7 @@ def list_latest_draft_artifacts(project_id: str, upload_batch_id: str | None = N
     parsed_rows: list[dict[str, object]] = []
     for row in rows:
         parsed = dict(row)
-        parsed["payload"] = json.loads(parsed.pop("payload_json"))
+        parsed["payload"] = _load_payload_json(parsed.pop("payload_json"))
         parsed_rows.append(parsed)
     return parsed_rows
 
@@ -771,7 +955,7 @@ def get_latest_coverage_artifact(project_id: str, upload_batch_id: str | None =
     if row is None:
         return None
     parsed = dict(row)
-    parsed["payload"] = json.loads(parsed.pop("payload_json"))
+    parsed["payload"] = _load_payload_json(parsed.pop("payload_json"))
     return parsed
 
 
@@ -824,7 +1008,7 @@ def get_latest_template_recommendation_artifact(project_id: str) -> dict[str, ob
     if row is None:
         return None
     parsed = dict(row)
-    parsed["payload"] = json.loads(parsed.pop("payload_json"))
+    parsed["payload"] = _load_payload_json(parsed.pop("payload_json"))
     return parsed
 
 
@@ -930,7 +1114,7 @@ def list_run_trace_events(
     parsed_rows: list[dict[str, object]] = []
     for row in rows:
         parsed = dict(row)
-        parsed["payload"] = json.loads(parsed.pop("payload_json"))
+        parsed["payload"] = _load_payload_json(parsed.pop("payload_json"))
         parsed_rows.append(parsed)
     return parsed_rows
 
@@ -1031,6 +1215,6 @@ def list_judge_eval_artifacts(
     parsed_rows: list[dict[str, object]] = []
     for row in rows:
         parsed = dict(row)
-        parsed["payload"] = json.loads(parsed.pop("payload_json"))
+        parsed["payload"] = _load_payload_json(parsed.pop("payload_json"))
         parsed_rows.append(parsed)
     return parsed_rows
@@ -20,8 +20,9 @@ from app.observability import (
     reset_request_id,
     sanitize_for_logging,
     set_request_id,
+    shutdown_logging,
 )
-from app.retrieval import EmbeddingService
+from app.retrieval import EmbeddingService, shutdown_parse_pool
 from app.version import APP_VERSION
 
 logger = logging.getLogger("nebula.api")
@@ -42,6 +43,7 @@ def _cached_embedding_service() -> EmbeddingService:
         mode=settings.embedding_mode,
         aws_region=settings.aws_region,
         bedrock_model_id=settings.bedrock_embedding_model_id,
+        batch_workers=settings.embedding_batch_workers,
     )
 
 
@@ -59,7 +61,9 @@ async def lifespan(_: FastAPI):
     if str(settings.storage_backend or "").strip().lower() in {"", "local", "filesystem", "fs"}:
         Path(settings.storage_root).mkdir(parents=True, exist_ok=True)
     yield
+    shutdown_parse_pool()
     logger.info("application_shutdown", extra={"event": "application_shutdown"})
+    shutdown_logging()
 
 
 def create_app() -> FastAPI:
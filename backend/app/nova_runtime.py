@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import copy
+from dataclasses import dataclass
+import hashlib
 import json
 import logging
 import re
+import threading
 import time
 from typing import Any
 
@@ -11,19 +17,135 @@ from app.requirements import merge_requirements_payload, repair_requirements_pay
 
 logger = logging.getLogger("nebula.nova")
 
+_JSON_FENCE_PATTERN = re.compile(r"```(?:json)?\s*(.*?)\s*```", flags=re.IGNORECASE | re.DOTALL)
+_JSON_STRUCTURAL_PATTERN = re.compile(r'[{}"\\]')
+
+# boto3 clients are thread-safe and expensive to build (botocore loader, endpoint resolution), so one
+# bedrock-runtime client per region is shared by every orchestrator in the process.
+_BEDROCK_CLIENTS: dict[str, Any] = {}
+_BEDROCK_CLIENTS_LOCK = threading.Lock()
+
+
+def _find_json_object_span(text: str) -> tuple[int, int] | None:
+    """Locate the first balanced ``{...}`` object, ignoring braces inside string literals.
+
+    Only structural characters are visited, so prose around the object and long string values
+    are skipped in C by the regex engine.
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+    depth = 0
+    in_string = False
+    escaped_index = -1
+    for match in _JSON_STRUCTURAL_PATTERN.finditer(text, start):
+        index = match.start()
+        if index == escaped_index:
+            continue
+        char = match.group()
+        if in_string:
+            if char == "\\":
+                escaped_index = index + 1
+            elif char == '"':
+                in_string = False
+            continue
+        if char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return start, index + 1
+    return None
+
+
+def _select_windows(total_chunks: int, window_size: int, overlap: int, max_passes: int) -> list[tuple[int, int]]:
+    """Return ``(start, end)`` chunk ranges for adaptive extraction, computed arithmetically.
+
+    Windows advance by ``window_size - overlap`` until one reaches the last chunk or the pass budget
+    runs out; a spare pass is spent on a tail window aligned to the end of the document.
+    """
+    if total_chunks <= 0:
+        return []
+    step = max(1, window_size - overlap)
+    # Index of the first window whose end reaches the last chunk (ceiling division).
+    last_needed = -(-max(0, total_chunks - window_size) // step)
+    starts = range(0, min(max_passes, last_needed + 1) * step, step)
+    windows = [(start, min(total_chunks, start + window_size)) for start in starts]
+    if len(windows) < max_passes:
+        tail_start = max(0, total_chunks - window_size)
+        if tail_start not in starts:
+            windows.append((tail_start, total_chunks))
+    return windows
+
+
+@dataclass(frozen=True)
+class _ChunkColumns:
+    """Column-wise view of extraction chunks, built once so windowing never revisits the dicts."""
+
+    file_names: list[object]
+    pages: list[object]
+    texts: list[str]
+    char_lens: list[int]
+
+    @classmethod
+    def from_chunks(cls, chunks: list[dict[str, object]]) -> _ChunkColumns:
+        texts = [" ".join(str(chunk.get("text", "")).split()) for chunk in chunks]
+        return cls(
+            file_names=[chunk.get("file_name") for chunk in chunks],
+            pages=[chunk.get("page") for chunk in chunks],
+            texts=texts,
+            char_lens=[len(text) for text in texts],
+        )
+
+
+# Section drafting prompts share everything except the section key, application context and
+# evidence, so the fixed part is built once and leads the prompt as a Bedrock cache prefix.
+_SECTION_SYSTEM_PROMPT = (
+    "You are a grant writer. Produce strict JSON only. "
+    "Every paragraph must include at least one citation grounded in provided evidence."
+)
+_SECTION_INSTRUCTIONS = (
+    "Return a JSON object with keys: section_key, paragraphs, missing_evidence. "
+    "paragraphs must be an array of objects with keys text, citations, confidence. "
+    "citations must be objects with keys doc_id, page, snippet. "
+    "If evidence is insufficient, return an empty paragraphs array and one missing_evidence item.\n\n"
+)
+
 
 class NovaRuntimeError(RuntimeError):
     """Raised when Nova invocation fails or returns invalid output."""
 
 
+def _get_default_client(aws_region: str) -> Any:
+    client = _BEDROCK_CLIENTS.get(aws_region)
+    if client is not None:
+        return client
+    with _BEDROCK_CLIENTS_LOCK:
+        client = _BEDROCK_CLIENTS.get(aws_region)
+        if client is None:
+            try:
+                import boto3  # type: ignore
+            except ImportError as exc:
+                raise NovaRuntimeError("boto3 is required for Bedrock Nova runtime.") from exc
+
+            client = boto3.client("bedrock-runtime", region_name=aws_region)
+            _BEDROCK_CLIENTS[aws_region] = client
+        return client
+
+
 class BedrockNovaOrchestrator:
     def __init__(self, settings: Settings, client: Any | None = None) -> None:
         self._settings = settings
-        self._client = client or self._create_bedrock_client()
+        self._client = client or _get_default_client(self._settings.aws_region)
+        # Exact-match response cache keyed by the fully rendered request; disabled when the size is 0.
+        self._response_cache: OrderedDict[bytes, dict[str, object]] = OrderedDict()
+        self._response_cache_lock = threading.Lock()
 
     def extract_requirements(self, chunks: list[dict[str, object]]) -> dict[str, object]:
-        windows, planner_diagnostics = self._plan_requirement_windows(chunks)
-        payloads: list[dict[str, object]] = []
+        columns = _ChunkColumns.from_chunks(chunks)
+        windows, planner_diagnostics = self._plan_requirement_windows(columns)
         context_chars_by_window: list[int] = []
         window_chunk_counts: list[int] = []
 
@@ -31,26 +153,49 @@ class BedrockNovaOrchestrator:
             "You are an RFP analyst. Extract requirements into strict JSON only. "
             "Do not include markdown or prose."
         )
+        # The instruction block is identical for every window, so it leads the prompt and can be
+        # served from Bedrock's prompt cache; only the window header and context change per pass.
+        instruction_prefix = (
+            "Return a JSON object with keys: "
+            "funder, deadline, eligibility, questions, required_attachments, rubric, disallowed_costs. "
+            "questions must be an array of objects with keys id, prompt, limit where limit has keys type and value. "
+            "limit.type must be one of words, chars, none.\n\n"
+        )
 
-        for window_index, window_chunks in enumerate(windows, start=1):
+        user_prompts: list[str] = []
+        for window_index, (start, end) in enumerate(windows, start=1):
             context = self._render_chunk_context(
-                window_chunks,
+                columns,
+                start,
+                end,
                 max_chunks=self._settings.extraction_context_max_chunks,
                 max_chars_per_chunk=self._settings.extraction_context_max_chars_per_chunk,
                 max_total_chars=self._settings.extraction_context_max_total_chars,
             )
             context_chars_by_window.append(len(context))
-            window_chunk_counts.append(len(window_chunks))
-            user_prompt = (
-                "Return a JSON object with keys: "
-                "funder, deadline, eligibility, questions, required_attachments, rubric, disallowed_costs. "
-                "questions must be an array of objects with keys id, prompt, limit where limit has keys type and value. "
-                "limit.type must be one of words, chars, none.\n\n"
+            window_chunk_counts.append(end - start)
+            user_prompts.append(
                 f"Extraction window {window_index} of {len(windows)}.\n"
                 f"RFP context:\n{context}"
             )
-            payload = self._invoke_json_model(self._settings.bedrock_model_id, system_prompt, user_prompt)
-            payloads.append(payload if isinstance(payload, dict) else {})
+
+        def invoke_window(user_prompt: str) -> dict[str, object]:
+            payload = self._invoke_json_model(
+                self._settings.bedrock_model_id,
+                system_prompt,
+                user_prompt,
+                cacheable_prefix=instruction_prefix,
+            )
+            return payload if isinstance(payload, dict) else {}
+
+        # Windows are independent Bedrock round-trips merged afterwards, so they run concurrently;
+        # map() yields payloads in window order, keeping the merge deterministic.
+        window_workers = max(1, min(len(user_prompts), self._settings.extraction_window_workers))
+        if window_workers == 1:
+            payloads = [invoke_window(user_prompt) for user_prompt in user_prompts]
+        else:
+            with ThreadPoolExecutor(max_workers=window_workers) as executor:
+                payloads = list(executor.map(invoke_window, user_prompts))
 
         merged_payload, merge_diagnostics = self._merge_requirement_payloads(payloads)
         diagnostics = {
@@ -113,25 +258,22 @@ class BedrockNovaOrchestrator:
             max_chars_per_chunk=700,
             max_total_chars=3600,
         )
-        system_prompt = (
-            "You are a grant writer. Produce strict JSON only. "
-            "Every paragraph must include at least one citation grounded in provided evidence."
-        )
         context_block = (
             f"Application context:\n{json.dumps(prompt_context, ensure_ascii=True)}\n\n"
             if prompt_context
             else ""
         )
         user_prompt = (
-            "Return a JSON object with keys: section_key, paragraphs, missing_evidence. "
-            "paragraphs must be an array of objects with keys text, citations, confidence. "
-            "citations must be objects with keys doc_id, page, snippet. "
-            "If evidence is insufficient, return an empty paragraphs array and one missing_evidence item.\n\n"
             f"Target section: {section_key}\n\n"
             f"{context_block}"
             f"Evidence:\n{context}"
         )
-        return self._invoke_json_model(self._settings.bedrock_model_id, system_prompt, user_prompt)
+        return self._invoke_json_model(
+            self._settings.bedrock_model_id,
+            _SECTION_SYSTEM_PROMPT,
+            user_prompt,
+            cacheable_prefix=_SECTION_INSTRUCTIONS,
+        )
 
     def compute_coverage(self, requirements: dict[str, object], draft: dict[str, object]) -> dict[str, object]:
         system_prompt = (
@@ -168,24 +310,42 @@ class BedrockNovaOrchestrator:
         )
         return self._invoke_json_model(self._settings.bedrock_model_id, system_prompt, user_prompt)
 
-    def _create_bedrock_client(self) -> Any:
-        try:
-            import boto3  # type: ignore
-        except ImportError as exc:
-            raise NovaRuntimeError("boto3 is required for Bedrock Nova runtime.") from exc
-
-        return boto3.client("bedrock-runtime", region_name=self._settings.aws_region)
-
-    def _invoke_json_model(self, model_id: str, system_prompt: str, user_prompt: str) -> dict[str, object]:
+    def _invoke_json_model(
+        self,
+        model_id: str,
+        system_prompt: str,
+        user_prompt: str,
+        *,
+        cacheable_prefix: str = "",
+    ) -> dict[str, object]:
         if not model_id:
             raise NovaRuntimeError("Bedrock model ID is not configured.")
 
+        cache_key = self._response_cache_key(model_id, system_prompt, cacheable_prefix + user_prompt)
+        cached_payload = self._get_cached_response(cache_key)
+        if cached_payload is not None:
+            logger.info(
+                "nova_invoke_cache_hit",
+                extra={"event": "nova_invoke_cache_hit", "model_id": model_id},
+            )
+            return cached_payload
+
+        system_blocks: list[dict[str, object]] = [{"text": system_prompt}]
+        user_blocks: list[dict[str, object]] = [{"text": cacheable_prefix + user_prompt}]
+        if cacheable_prefix and self._settings.bedrock_prompt_caching:
+            system_blocks.append({"cachePoint": {"type": "default"}})
+            user_blocks = [
+                {"text": cacheable_prefix},
+                {"cachePoint": {"type": "default"}},
+                {"text": user_prompt},
+            ]
+
         started = time.perf_counter()
         try:
             response = self._client.converse(
                 modelId=model_id,
-                system=[{"text": system_prompt}],
-                messages=[{"role": "user", "content": [{"text": user_prompt}]}],
+                system=system_blocks,
+                messages=[{"role": "user", "content": user_blocks}],
                 inferenceConfig={
                     "temperature": self._settings.agent_temperature,
                     "maxTokens": self._settings.agent_max_tokens,
@@ -262,12 +422,48 @@ class BedrockNovaOrchestrator:
                 "model_id": model_id,
                 "duration_ms": duration_ms,
                 "system_prompt_chars": len(system_prompt),
-                "user_prompt_chars": len(user_prompt),
+                "user_prompt_chars": len(cacheable_prefix) + len(user_prompt),
                 "response_chars": len(text),
             },
         )
+        self._store_cached_response(cache_key, payload)
         return payload
 
+    def _response_cache_key(self, model_id: str, system_prompt: str, user_prompt: str) -> bytes | None:
+        if self._settings.nova_response_cache_size <= 0:
+            return None
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (
+            model_id,
+            str(self._settings.agent_temperature),
+            str(self._settings.agent_max_tokens),
+            system_prompt,
+            user_prompt,
+        ):
+            encoded = part.encode("utf-8")
+            digest.update(len(encoded).to_bytes(8, "big"))
+            digest.update(encoded)
+        return digest.digest()
+
+    def _get_cached_response(self, cache_key: bytes | None) -> dict[str, object] | None:
+        if cache_key is None:
+            return None
+        with self._response_cache_lock:
+            cached = self._response_cache.get(cache_key)
+            if cached is None:
+                return None
+            self._response_cache.move_to_end(cache_key)
+        return copy.deepcopy(cached)
+
+    def _store_cached_response(self, cache_key: bytes | None, payload: dict[str, object]) -> None:
+        if cache_key is None:
+            return
+        with self._response_cache_lock:
+            self._response_cache[cache_key] = copy.deepcopy(payload)
+            self._response_cache.move_to_end(cache_key)
+            while len(self._response_cache) > self._settings.nova_response_cache_size:
+                self._response_cache.popitem(last=False)
+
     @staticmethod
     def _extract_text(response: Any) -> str:
         outputs = response.get("output", {}).get("message", {}).get("content", [])
@@ -288,18 +484,18 @@ class BedrockNovaOrchestrator:
         except json.JSONDecodeError:
             pass
 
-        fenced = re.search(r"```(?:json)?\s*(.*?)\s*```", candidate, flags=re.IGNORECASE | re.DOTALL)
+        fenced = _JSON_FENCE_PATTERN.search(candidate)
         if fenced:
             try:
                 return json.loads(fenced.group(1))
             except json.JSONDecodeError:
                 pass
 
-        start = candidate.find("{")
-        end = candidate.rfind("}")
-        if start != -1 and end != -1 and end > start:
+        span = _find_json_object_span(candidate)
+        if span is not None:
+            start, end = span
             try:
-                return json.loads(candidate[start : end + 1])
+                return json.loads(candidate[start:end])
             except json.JSONDecodeError as exc:
                 raise NovaRuntimeError("Nova response contained malformed JSON content.") from exc
 
@@ -307,7 +503,9 @@ class BedrockNovaOrchestrator:
 
     @staticmethod
     def _render_chunk_context(
-        chunks: list[dict[str, object]],
+        columns: _ChunkColumns,
+        start: int,
+        end: int,
         *,
         max_chunks: int,
         max_chars_per_chunk: int,
@@ -316,16 +514,17 @@ class BedrockNovaOrchestrator:
         lines: list[str] = []
         used_chars = 0
         seen_text: set[str] = set()
-        for chunk in chunks[:max_chunks]:
+        texts = columns.texts
+        for index in range(start, end)[:max_chunks]:
             available = max_total_chars - used_chars
             if available < 80:
                 break
             chunk_limit = min(max_chars_per_chunk, max(40, available - 40))
-            text = BedrockNovaOrchestrator._truncate(str(chunk.get("text", "")), chunk_limit)
-            text_key = " ".join(text.lower().split())
+            text = BedrockNovaOrchestrator._clip(texts[index], chunk_limit)
+            text_key = text.lower()
             if text_key in seen_text:
                 continue
-            line = f"- doc={chunk.get('file_name')} page={chunk.get('page')} text={text}"
+            line = f"- doc={columns.file_names[index]} page={columns.pages[index]} text={text}"
             lines.append(line)
             used_chars += len(line)
             seen_text.add(text_key)
@@ -333,17 +532,17 @@ class BedrockNovaOrchestrator:
 
     def _plan_requirement_windows(
         self,
-        chunks: list[dict[str, object]],
-    ) -> tuple[list[list[dict[str, object]]], dict[str, object]]:
-        total_chunks = len(chunks)
-        estimated_chars = sum(len(self._normalize_text(str(chunk.get("text", "")))) for chunk in chunks)
+        columns: _ChunkColumns,
+    ) -> tuple[list[tuple[int, int]], dict[str, object]]:
+        total_chunks = len(columns.texts)
+        estimated_chars = sum(columns.char_lens)
 
         single_pass = (
             total_chunks <= self._settings.extraction_context_max_chunks
             and estimated_chars <= self._settings.extraction_context_max_total_chars
         )
         if single_pass:
-            return [chunks], {
+            return [(0, total_chunks)], {
                 "mode": "single_pass",
                 "window_count": 1,
                 "chunks_total": total_chunks,
@@ -354,28 +553,7 @@ class BedrockNovaOrchestrator:
         window_size = max(1, self._settings.extraction_window_size_chunks)
         overlap = max(0, min(window_size - 1, self._settings.extraction_window_overlap_chunks))
         max_passes = max(1, self._settings.extraction_window_max_passes)
-        step = max(1, window_size - overlap)
-
-        windows: list[list[dict[str, object]]] = []
-        starts: list[int] = []
-        for start in range(0, total_chunks, step):
-            if len(windows) >= max_passes:
-                break
-            end = min(total_chunks, start + window_size)
-            windows.append(chunks[start:end])
-            starts.append(start)
-            if end >= total_chunks:
-                break
-
-        if windows and len(windows) < max_passes:
-            tail_start = max(0, total_chunks - window_size)
-            if tail_start not in starts:
-                windows.append(chunks[tail_start:total_chunks])
-                starts.append(tail_start)
-
-        coverage_ranges = []
-        for start, window in zip(starts, windows, strict=False):
-            coverage_ranges.append([start, start + len(window)])
+        windows = _select_windows(total_chunks, window_size, overlap, max_passes)
 
         return windows, {
             "mode": "multi_pass",
@@ -385,7 +563,7 @@ class BedrockNovaOrchestrator:
             "window_size_chunks": window_size,
             "window_overlap_chunks": overlap,
             "window_max_passes": max_passes,
-            "window_ranges": coverage_ranges,
+            "window_ranges": [[start, end] for start, end in windows],
         }
 
     @staticmethod
@@ -422,10 +600,6 @@ class BedrockNovaOrchestrator:
             "per_window_candidates": per_window_candidates,
         }
 
-    @staticmethod
-    def _normalize_text(text: str) -> str:
-        return " ".join(text.split())
-
     @staticmethod
     def _render_ranked_context(
         ranked_chunks: list[dict[str, object]],
@@ -464,7 +638,10 @@ class BedrockNovaOrchestrator:
 
     @staticmethod
     def _truncate(text: str, max_chars: int) -> str:
-        clean = " ".join(text.split())
+        return BedrockNovaOrchestrator._clip(" ".join(text.split()), max_chars)
+
+    @staticmethod
+    def _clip(clean: str, max_chars: int) -> str:
         if len(clean) <= max_chars:
             return clean
         return clean[: max_chars - 3] + "..."
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import atexit
+import copy
 from contextvars import ContextVar, Token
 from datetime import datetime, timezone
+from functools import lru_cache
 import json
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
 import re
+import threading
 from typing import Any, Mapping
 from uuid import uuid4
 
@@ -12,32 +18,40 @@ from uuid import uuid4
 REQUEST_ID_CONTEXT: ContextVar[str] = ContextVar("request_id", default="-")
 REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]{0,127}$")
 _LOGGING_CONFIGURED = False
-
-SENSITIVE_KEY_NAMES = {
-    "authorization",
-    "cookie",
-    "set-cookie",
-    "token",
-    "password",
-    "secret",
-    "api_key",
-    "apikey",
-    "x_api_key",
-    "access_key",
-    "aws_secret_access_key",
-    "aws_access_key_id",
-    "aws_session_token",
-    "session_token",
-    "x_amz_security_token",
-    "x_amz_credential",
-    "x_amz_signature",
-    "client_secret",
-    "private_key",
-    "ssn",
-    "social_security_number",
-    "email",
-    "phone",
-}
+# JSON formatting (and the sanitizer it runs over every extra) happens on a listener thread;
+# request threads only stamp the request id and enqueue the record.
+_LOG_QUEUE: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+_LOG_OUTPUT_HANDLER: logging.Handler | None = None
+_LOG_LISTENER: QueueListener | None = None
+_LOG_LISTENER_LOCK = threading.Lock()
+
+SENSITIVE_KEY_NAMES = frozenset(
+    {
+        "authorization",
+        "cookie",
+        "set-cookie",
+        "token",
+        "password",
+        "secret",
+        "api_key",
+        "apikey",
+        "x_api_key",
+        "access_key",
+        "aws_secret_access_key",
+        "aws_access_key_id",
+        "aws_session_token",
+        "session_token",
+        "x_amz_security_token",
+        "x_amz_credential",
+        "x_amz_signature",
+        "client_secret",
+        "private_key",
+        "ssn",
+        "social_security_number",
+        "email",
+        "phone",
+    }
+)
 SENSITIVE_KEY_FRAGMENTS = (
     "password",
     "secret",
@@ -46,6 +60,8 @@ SENSITIVE_KEY_FRAGMENTS = (
     "access_key",
     "private_key",
 )
+# One scan per key finds any fragment, rather than one substring pass per fragment.
+_SENSITIVE_KEY_FRAGMENT_PATTERN = re.compile("|".join(re.escape(fragment) for fragment in SENSITIVE_KEY_FRAGMENTS))
 
 EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
 PHONE_PATTERN = re.compile(r"\b(?:\+?1[-.\s]?)?(?:\(?\d{3}\)?[-.\s]?)\d{3}[-.\s]?\d{4}\b")
@@ -65,6 +81,36 @@ X_AMZ_SECURITY_TOKEN_INLINE_PATTERN = re.compile(
     r"(?i)\b(x-amz-security-token)(\s*[:=]\s*)([A-Za-z0-9/+=._-]{8,})\b"
 )
 
+# Applied in order: earlier rules win where matches overlap (an inline access key id is
+# reported as an AWS access key before the generic inline rule sees it).
+_REDACTION_RULES: tuple[tuple[re.Pattern[str], str], ...] = (
+    (BEARER_PATTERN, "Bearer [REDACTED]"),
+    (AWS_ACCESS_KEY_PATTERN, "[REDACTED_AWS_ACCESS_KEY]"),
+    (AWS_SECRET_INLINE_PATTERN, r"\1\2[REDACTED]"),
+    (AWS_ACCESS_KEY_ID_INLINE_PATTERN, r"\1\2[REDACTED]"),
+    (AWS_SESSION_TOKEN_INLINE_PATTERN, r"\1\2[REDACTED]"),
+    (X_AMZ_SECURITY_TOKEN_INLINE_PATTERN, r"\1\2[REDACTED]"),
+    (EMAIL_PATTERN, "[REDACTED_EMAIL]"),
+    (PHONE_PATTERN, "[REDACTED_PHONE]"),
+    (SSN_PATTERN, "[REDACTED_SSN]"),
+)
+
+# Every rule needs one of these literals (compared lower-cased) or a run of three digits
+# (phone numbers, SSNs), so most log strings skip the substitution passes entirely.
+_REDACTION_TRIGGERS = (
+    "@",
+    "bearer",
+    "akia",
+    "asia",
+    "secret_access_key",
+    "aws_access_key_id",
+    "session_token",
+    "x-amz-security-token",
+)
+_DIGIT_RUN_PATTERN = re.compile(r"\d{3}")
+# The shortest value any rule can match is an email such as "a@b.co".
+_MIN_REDACTABLE_LENGTH = 6
+
 
 def normalize_request_id(candidate: str | None) -> str:
     if candidate:
@@ -86,58 +132,91 @@ def get_request_id() -> str:
     return REQUEST_ID_CONTEXT.get()
 
 
+# Payload keys come from a small vocabulary, so each distinct key is classified once.
+@lru_cache(maxsize=4096)
 def _looks_sensitive_key(key: str) -> bool:
     normalized = key.strip().lower().replace("-", "_")
     if normalized in SENSITIVE_KEY_NAMES:
         return True
-    return any(fragment in normalized for fragment in SENSITIVE_KEY_FRAGMENTS)
+    return _SENSITIVE_KEY_FRAGMENT_PATTERN.search(normalized) is not None
+
+
+def _may_need_redaction(value: str) -> bool:
+    if len(value) < _MIN_REDACTABLE_LENGTH:
+        return False
+    # Case-insensitive rules also match non-ASCII case variants (e.g. dotless i), so only
+    # ASCII text is screened.
+    if not value.isascii():
+        return True
+    lowered = value.lower()
+    if any(trigger in lowered for trigger in _REDACTION_TRIGGERS):
+        return True
+    return _DIGIT_RUN_PATTERN.search(value) is not None
 
 
 def _redact_string(value: str, *, max_length: int) -> str:
     redacted = value
-    redacted = BEARER_PATTERN.sub("Bearer [REDACTED]", redacted)
-    redacted = AWS_ACCESS_KEY_PATTERN.sub("[REDACTED_AWS_ACCESS_KEY]", redacted)
-    redacted = AWS_SECRET_INLINE_PATTERN.sub(r"\1\2[REDACTED]", redacted)
-    redacted = AWS_ACCESS_KEY_ID_INLINE_PATTERN.sub(r"\1\2[REDACTED]", redacted)
-    redacted = AWS_SESSION_TOKEN_INLINE_PATTERN.sub(r"\1\2[REDACTED]", redacted)
-    redacted = X_AMZ_SECURITY_TOKEN_INLINE_PATTERN.sub(r"\1\2[REDACTED]", redacted)
-    redacted = EMAIL_PATTERN.sub("[REDACTED_EMAIL]", redacted)
-    redacted = PHONE_PATTERN.sub("[REDACTED_PHONE]", redacted)
-    redacted = SSN_PATTERN.sub("[REDACTED_SSN]", redacted)
+    if _may_need_redaction(redacted):
+        for pattern, replacement in _REDACTION_RULES:
+            redacted = pattern.sub(replacement, redacted)
     if len(redacted) > max_length:
         return f"{redacted[:max_length]}...[truncated]"
     return redacted
 
 
-def sanitize_for_logging(value: Any, *, max_string_length: int = 240) -> Any:
-    if value is None:
-        return None
-
-    if isinstance(value, Mapping):
-        sanitized: dict[str, Any] = {}
-        for key, item in value.items():
-            key_text = str(key)
-            if _looks_sensitive_key(key_text):
-                sanitized[key_text] = "[REDACTED]"
-                continue
-            sanitized[key_text] = sanitize_for_logging(item, max_string_length=max_string_length)
-        return sanitized
-
-    if isinstance(value, list):
-        return [sanitize_for_logging(item, max_string_length=max_string_length) for item in value]
+# Stack marker: converts a filled tuple slot from the list it was built in to a tuple.
+_FREEZE_TUPLE = object()
 
-    if isinstance(value, tuple):
-        return tuple(sanitize_for_logging(item, max_string_length=max_string_length) for item in value)
 
+def _sanitize_leaf(value: Any, *, max_string_length: int) -> Any:
     if isinstance(value, bytes):
         return f"[{len(value)} bytes]"
-
     if isinstance(value, str):
         return _redact_string(value, max_length=max_string_length)
-
     return value
 
 
+def sanitize_for_logging(value: Any, *, max_string_length: int = 240) -> Any:
+    if value is None:
+        return None
+    if not isinstance(value, (Mapping, list, tuple)):
+        return _sanitize_leaf(value, max_string_length=max_string_length)
+
+    # Walk nested payloads with an explicit stack: each entry fills one slot of an output
+    # container, and tuple slots are frozen after their children have been filled.
+    root: list[Any] = [None]
+    stack: list[tuple[Any, Any, Any]] = [(root, 0, value)]
+    while stack:
+        target, slot, node = stack.pop()
+        if node is _FREEZE_TUPLE:
+            target[slot] = tuple(target[slot])
+            continue
+        node_type = type(node)
+        if node_type is str:
+            target[slot] = _redact_string(node, max_length=max_string_length)
+        elif node_type is dict or (node_type is not list and node_type is not tuple and isinstance(node, Mapping)):
+            sanitized: dict[str, Any] = {}
+            target[slot] = sanitized
+            pending: list[tuple[Any, Any, Any]] = []
+            for key, item in node.items():
+                key_text = str(key)
+                if _looks_sensitive_key(key_text):
+                    sanitized[key_text] = "[REDACTED]"
+                    continue
+                sanitized[key_text] = None
+                pending.append((sanitized, key_text, item))
+            stack.extend(reversed(pending))
+        elif node_type is list or isinstance(node, (list, tuple)):
+            items = [None] * len(node)
+            target[slot] = items
+            if not isinstance(node, list):
+                stack.append((target, slot, _FREEZE_TUPLE))
+            stack.extend((items, index, item) for index, item in reversed(list(enumerate(node))))
+        else:
+            target[slot] = _sanitize_leaf(node, max_string_length=max_string_length)
+    return root[0]
+
+
 class RequestIdFilter(logging.Filter):
     def filter(self, record: logging.LogRecord) -> bool:
         if not hasattr(record, "request_id"):
@@ -173,7 +252,7 @@ class JsonFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         payload: dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -187,26 +266,94 @@ class JsonFormatter(logging.Formatter):
 
         if record.exc_info:
             payload["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exception"] = record.exc_text
         return json.dumps(payload, ensure_ascii=True)
 
 
+class _EnqueueHandler(QueueHandler):
+    """Hand records to the listener thread without pre-formatting them.
+
+    The stock ``prepare`` renders the record with a plain formatter, folding the traceback into the
+    message; this keeps the traceback in ``exc_text`` so JsonFormatter still reports it separately.
+    """
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        # Once the listener has been stopped nothing drains the queue, so write straight through
+        # instead of parking records until the next configure_logging call. The check is lock-free;
+        # a record that races shutdown is written by shutdown_logging's final drain.
+        if _LOG_LISTENER is not None:
+            super().enqueue(record)
+        elif _LOG_OUTPUT_HANDLER is not None:
+            _LOG_OUTPUT_HANDLER.handle(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        prepared = copy.copy(record)
+        prepared.msg = message
+        prepared.args = None
+        prepared.exc_info = None
+        return prepared
+
+
+def _start_log_listener() -> None:
+    global _LOG_LISTENER
+    with _LOG_LISTENER_LOCK:
+        if _LOG_LISTENER is not None or _LOG_OUTPUT_HANDLER is None:
+            return
+        _LOG_LISTENER = QueueListener(_LOG_QUEUE, _LOG_OUTPUT_HANDLER, respect_handler_level=True)
+        _LOG_LISTENER.start()
+
+
+def shutdown_logging() -> None:
+    """Drain queued records to the output handler and stop the listener thread.
+
+    Records logged afterwards are written synchronously until ``configure_logging`` restarts the
+    listener.
+    """
+
+    global _LOG_LISTENER
+    with _LOG_LISTENER_LOCK:
+        listener, _LOG_LISTENER = _LOG_LISTENER, None
+    if listener is None:
+        return
+    listener.stop()
+    # Records enqueued by threads that saw the listener just before the swap land behind the stop
+    # sentinel; write them through now rather than replaying them on the next listener start.
+    output = _LOG_OUTPUT_HANDLER
+    while True:
+        try:
+            record = _LOG_QUEUE.get_nowait()
+        except queue.Empty:
+            break
+        if output is not None and record is not None:
+            output.handle(record)
+
+
 def configure_logging(level_name: str) -> None:
-    global _LOGGING_CONFIGURED
+    global _LOGGING_CONFIGURED, _LOG_OUTPUT_HANDLER
     level = getattr(logging, level_name.upper(), logging.INFO)
 
     root = logging.getLogger()
     root.setLevel(level)
 
-    if _LOGGING_CONFIGURED:
-        return
-
-    if any(getattr(handler, "_nebula_handler", False) for handler in root.handlers):
+    if not _LOGGING_CONFIGURED:
+        if any(getattr(handler, "_nebula_handler", False) for handler in root.handlers):
+            _LOGGING_CONFIGURED = True
+            return
+
+        output = logging.StreamHandler()
+        output.setFormatter(JsonFormatter())
+        _LOG_OUTPUT_HANDLER = output
+
+        # The request id lives in a context variable, so stamp it before the record leaves the request thread.
+        handler = _EnqueueHandler(_LOG_QUEUE)
+        handler.addFilter(RequestIdFilter())
+        setattr(handler, "_nebula_handler", True)
+        root.addHandler(handler)
+        atexit.register(shutdown_logging)
         _LOGGING_CONFIGURED = True
-        return
 
-    handler = logging.StreamHandler()
-    handler.setFormatter(JsonFormatter())
-    handler.addFilter(RequestIdFilter())
-    setattr(handler, "_nebula_handler", True)
-    root.addHandler(handler)
-    _LOGGING_CONFIGURED = True
+    _start_log_listener()
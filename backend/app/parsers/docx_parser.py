@@ -2,9 +2,107 @@ from __future__ import annotations
 
 import io
 from pathlib import Path
+from xml.etree import ElementTree
+import zipfile
 
 from app.parsers.base import ParseResult, ParsedPage
 
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_BODY = f"{_W}body"
+_W_P = f"{_W}p"
+_W_R = f"{_W}r"
+_W_HYPERLINK = f"{_W}hyperlink"
+_W_TBL = f"{_W}tbl"
+_W_TR = f"{_W}tr"
+_W_TC = f"{_W}tc"
+_W_T = f"{_W}t"
+_W_BR = f"{_W}br"
+_W_TYPE = f"{_W}type"
+# Run children rendered as whitespace or a hyphen, matching python-docx's run text.
+_RUN_SEPARATORS = {f"{_W}tab": "\t", f"{_W}ptab": "\t", f"{_W}cr": "\n", f"{_W}noBreakHyphen": "-"}
+# python-docx repeats horizontally/vertically merged cells per grid column; those tables take the slow path.
+_MERGED_CELL_TAGS = (f".//{_W}gridSpan", f".//{_W}vMerge")
+
+
+def _run_text(run: ElementTree.Element) -> str:
+    parts: list[str] = []
+    for child in run:
+        if child.tag == _W_T:
+            parts.append(child.text or "")
+        elif child.tag == _W_BR:
+            if child.get(_W_TYPE, "textWrapping") == "textWrapping":
+                parts.append("\n")
+        else:
+            parts.append(_RUN_SEPARATORS.get(child.tag, ""))
+    return "".join(parts)
+
+
+def _paragraph_text(paragraph: ElementTree.Element) -> str:
+    parts: list[str] = []
+    for child in paragraph:
+        if child.tag == _W_R:
+            parts.append(_run_text(child))
+        elif child.tag == _W_HYPERLINK:
+            parts.extend(_run_text(run) for run in child.findall(_W_R))
+    return "".join(parts)
+
+
+def _extract_docx_lines_fast(content: bytes) -> list[str] | None:
+    """Read body paragraphs and tables straight from ``word/document.xml``.
+
+    Returns ``None`` when the package needs python-docx's full object model (non-standard part
+    names or merged table cells) so the caller can fall back without changing the output.
+    """
+    with zipfile.ZipFile(io.BytesIO(content)) as package:
+        try:
+            document_xml = package.read("word/document.xml")
+        except KeyError:
+            return None
+
+    body = ElementTree.fromstring(document_xml).find(_W_BODY)
+    if body is None:
+        return None
+    tables = body.findall(_W_TBL)
+    if any(table.find(tag) is not None for table in tables for tag in _MERGED_CELL_TAGS):
+        return None
+
+    lines: list[str] = []
+    for paragraph in body.findall(_W_P):
+        text = " ".join(_paragraph_text(paragraph).split()).strip()
+        if text:
+            lines.append(text)
+
+    for table in tables:
+        for row in table.findall(_W_TR):
+            cell_values = [
+                " ".join("\n".join(_paragraph_text(p) for p in cell.findall(_W_P)).split()).strip()
+                for cell in row.findall(_W_TC)
+            ]
+            row_text = " | ".join([value for value in cell_values if value])
+            if row_text:
+                lines.append(row_text)
+    return lines
+
+
+def _extract_docx_lines_python_docx(content: bytes) -> list[str]:
+    from docx import Document
+
+    document = Document(io.BytesIO(content))
+    lines: list[str] = []
+
+    for paragraph in document.paragraphs:
+        text = " ".join(paragraph.text.split()).strip()
+        if text:
+            lines.append(text)
+
+    for table in document.tables:
+        for row in table.rows:
+            cell_values = [" ".join(cell.text.split()).strip() for cell in row.cells]
+            row_text = " | ".join([value for value in cell_values if value])
+            if row_text:
+                lines.append(row_text)
+    return lines
+
 
 class DocxDocumentParser:
     parser_id = "docx"
@@ -21,43 +119,37 @@ class DocxDocumentParser:
     def parse(self, *, content: bytes, file_name: str, content_type: str) -> ParseResult:
         del file_name, content_type
         try:
-            from docx import Document
-        except ImportError:
-            return ParseResult(
-                parser_id=self.parser_id,
-                pages=[],
-                text_extractable=True,
-                error="python-docx is not installed",
-            )
+            lines = _extract_docx_lines_fast(content)
+        except Exception:
+            # Corrupt or non-zip input: let python-docx produce the authoritative error.
+            lines = None
 
-        try:
-            document = Document(io.BytesIO(content))
-            lines: list[str] = []
-
-            for paragraph in document.paragraphs:
-                text = " ".join(paragraph.text.split()).strip()
-                if text:
-                    lines.append(text)
-
-            for table in document.tables:
-                for row in table.rows:
-                    cell_values = [" ".join(cell.text.split()).strip() for cell in row.cells]
-                    row_text = " | ".join([value for value in cell_values if value])
-                    if row_text:
-                        lines.append(row_text)
-
-            joined = "\n".join(lines).strip()
-            pages = [ParsedPage(page=1, text=joined)] if joined else []
-
-            return ParseResult(
-                parser_id=self.parser_id,
-                pages=pages,
-                text_extractable=True,
-            )
-        except Exception as exc:
-            return ParseResult(
-                parser_id=self.parser_id,
-                pages=[],
-                text_extractable=True,
-                error=f"docx parse failed: {exc}",
-            )
+        if lines is None:
+            try:
+                import docx  # noqa: F401
+            except ImportError:
+                return ParseResult(
+                    parser_id=self.parser_id,
+                    pages=[],
+                    text_extractable=True,
+                    error="python-docx is not installed",
+                )
+
+            try:
+                lines = _extract_docx_lines_python_docx(content)
+            except Exception as exc:
+                return ParseResult(
+                    parser_id=self.parser_id,
+                    pages=[],
+                    text_extractable=True,
+                    error=f"docx parse failed: {exc}",
+                )
+
+        joined = "\n".join(lines).strip()
+        pages = [ParsedPage(page=1, text=joined)] if joined else []
+
+        return ParseResult(
+            parser_id=self.parser_id,
+            pages=pages,
+            text_extractable=True,
+        )
@@ -1,11 +1,45 @@
 from __future__ import annotations
 
 import io
+from importlib.util import find_spec
 from pathlib import Path
 
 from app.parsers.base import ParseResult, ParsedPage
 
 
+def _extract_pdf_page_texts_pdfium(content: bytes) -> list[str]:
+    import pypdfium2 as pdfium
+
+    document = pdfium.PdfDocument(bytes(content))
+    try:
+        page_texts: list[str] = []
+        for page in document:
+            text_page = page.get_textpage()
+            try:
+                page_texts.append(text_page.get_text_range() or "")
+            finally:
+                text_page.close()
+                page.close()
+        return page_texts
+    finally:
+        document.close()
+
+
+def _extract_pdf_page_texts_pypdf(content: bytes) -> list[str]:
+    from pypdf import PdfReader
+
+    reader = PdfReader(io.BytesIO(content), strict=False)
+    return [page.extract_text() or "" for page in reader.pages]
+
+
+# pypdfium2 is an optional accelerator tried first; pypdf stays the pinned baseline and also
+# covers documents pdfium refuses to open. PyMuPDF is deliberately not used: it is AGPL-3.0.
+_PDF_TEXT_EXTRACTORS = (
+    ("pypdfium2", _extract_pdf_page_texts_pdfium),
+    ("pypdf", _extract_pdf_page_texts_pypdf),
+)
+
+
 class PdfDocumentParser:
     parser_id = "pdf"
     _CONTENT_TYPES = {"application/pdf"}
@@ -17,9 +51,12 @@ class PdfDocumentParser:
 
     def parse(self, *, content: bytes, file_name: str, content_type: str) -> ParseResult:
         del file_name, content_type
-        try:
-            from pypdf import PdfReader
-        except ImportError:
+        extractors = [
+            extract_page_texts
+            for module_name, extract_page_texts in _PDF_TEXT_EXTRACTORS
+            if find_spec(module_name) is not None
+        ]
+        if not extractors:
             return ParseResult(
                 parser_id=self.parser_id,
                 pages=[],
@@ -27,11 +64,16 @@ class PdfDocumentParser:
                 error="pypdf is not installed",
             )
 
-        try:
-            reader = PdfReader(io.BytesIO(content), strict=False)
+        last_error: Exception | None = None
+        for extract_page_texts in extractors:
+            try:
+                page_texts = extract_page_texts(content)
+            except Exception as exc:
+                last_error = exc
+                continue
+
             pages: list[ParsedPage] = []
-            for index, page in enumerate(reader.pages, start=1):
-                extracted = page.extract_text() or ""
+            for index, extracted in enumerate(page_texts, start=1):
                 cleaned = " ".join(extracted.split()).strip()
                 if cleaned:
                     pages.append(ParsedPage(page=index, text=cleaned))
@@ -41,10 +83,10 @@ class PdfDocumentParser:
                 pages=pages,
                 text_extractable=True,
             )
-        except Exception as exc:
-            return ParseResult(
-                parser_id=self.parser_id,
-                pages=[],
-                text_extractable=True,
-                error=f"pdf parse failed: {exc}",
-            )
+
+        return ParseResult(
+            parser_id=self.parser_id,
+            pages=[],
+            text_extractable=True,
+            error=f"pdf parse failed: {last_error}",
+        )
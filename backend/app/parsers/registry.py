@@ -16,10 +16,15 @@ class ParserRegistry:
             TextDocumentParser(),
         ]
 
-    def parse(self, *, content: bytes, file_name: str, content_type: str) -> ParseResult:
+    def resolve(self, *, file_name: str, content_type: str) -> DocumentParser | None:
         for parser in self._parsers:
-            if not parser.supports(file_name=file_name, content_type=content_type):
-                continue
+            if parser.supports(file_name=file_name, content_type=content_type):
+                return parser
+        return None
+
+    def parse(self, *, content: bytes, file_name: str, content_type: str) -> ParseResult:
+        parser = self.resolve(file_name=file_name, content_type=content_type)
+        if parser is not None:
             return parser.parse(content=content, file_name=file_name, content_type=content_type)
         return ParseResult(
             parser_id="none",
@@ -1,9 +1,127 @@
 from __future__ import annotations
 
+import codecs
 from pathlib import Path
+import re
 
 from app.parsers.base import ParseResult, ParsedPage
 
+# striprtf's tokenizer with its single-character text alternative widened to whole runs of plain
+# text, so body text costs one match per run instead of one match and one string concat per char.
+_RTF_TOKEN_PATTERN = re.compile(
+    r"\\([a-z]{1,32})(-?\d{1,10})?[ ]?|\\'([0-9a-f]{2})|\\([^a-z])|([{}])|[\r\n]+|([^\\{}\r\n]+)|(.)",
+    re.IGNORECASE,
+)
+
+
+def _rtf_to_text(text: str, encoding: str = "cp1252", errors: str = "strict") -> str:
+    """Port of ``striprtf.rtf_to_text`` that emits text runs instead of single characters.
+
+    Control-word tables, picture stripping and hyperlink rewriting come from striprtf itself so
+    the output stays identical to the pinned library.
+    """
+    from striprtf.striprtf import (
+        FONTTABLE,
+        HYPERLINKS,
+        charset_map,
+        destinations,
+        remove_pict_groups,
+        sectionchars,
+        specialchars,
+    )
+
+    text = remove_pict_groups(text)
+    text = HYPERLINKS.sub("\\1(\\2)", text)
+    stack: list[tuple[int, bool, bool]] = []
+    fonttbl: dict[str, dict[str, str]] = {}
+    default_font = None
+    current_font = None
+    ignorable = False
+    suppress_output = False
+    ucskip = 1
+    curskip = 0
+    hexes: list[str] = []
+    out: list[str] = []
+
+    for font_id, fcharset, font_name in FONTTABLE.findall(text):
+        fonttbl[font_id] = {
+            "name": font_name.strip(),
+            "charset": fcharset,
+            "encoding": charset_map.get(int(fcharset), encoding),
+        }
+
+    for match in _RTF_TOKEN_PATTERN.finditer(text):
+        word, arg, hex_pair, char, brace, run, tchar = match.groups()
+        if hexes and not hex_pair:
+            hex_encoding = fonttbl.get(current_font, {"encoding": encoding}).get("encoding", encoding)
+            out.append(bytes.fromhex("".join(hexes)).decode(encoding=hex_encoding, errors=errors))
+            hexes = []
+        if run or tchar:
+            run = run or tchar
+            if curskip > 0:
+                skipped = min(curskip, len(run))
+                curskip -= skipped
+                run = run[skipped:]
+            if run and not ignorable and not suppress_output:
+                out.append(run)
+        elif brace:
+            curskip = 0
+            if brace == "{":
+                stack.append((ucskip, ignorable, suppress_output))
+            elif stack:
+                ucskip, ignorable, suppress_output = stack.pop()
+            else:
+                # Unbalanced closing brace: striprtf ignores the rest of the document.
+                ucskip = 0
+                ignorable = True
+        elif char:
+            curskip = 0
+            if char in specialchars:
+                if char in sectionchars:
+                    current_font = default_font
+                if not ignorable:
+                    out.append(specialchars[char])
+            elif char == "*":
+                ignorable = True
+        elif word:
+            curskip = 0
+            if word in destinations:
+                ignorable = True
+            elif word == "ansicpg":
+                encoding = f"cp{arg}"
+                try:
+                    codecs.lookup(encoding)
+                except LookupError:
+                    encoding = "utf8"
+            if ignorable or suppress_output:
+                pass
+            elif word in specialchars:
+                out.append(specialchars[word])
+            elif word == "uc":
+                ucskip = int(arg)
+            elif word == "u":
+                if arg is None:
+                    curskip = ucskip
+                else:
+                    code_point = int(arg)
+                    if code_point < 0:
+                        code_point += 0x10000
+                    out.append(chr(code_point))
+                    curskip = ucskip
+            elif word == "f":
+                current_font = arg
+            elif word == "deff":
+                default_font = arg
+            elif word in {"fonttbl", "colortbl"}:
+                suppress_output = True
+        elif hex_pair:
+            if curskip > 0:
+                curskip -= 1
+            elif not ignorable:
+                hexes.append(hex_pair)
+
+    return "".join(out)
+
 
 class RtfDocumentParser:
     parser_id = "rtf"
@@ -17,7 +135,7 @@ class RtfDocumentParser:
     def parse(self, *, content: bytes, file_name: str, content_type: str) -> ParseResult:
         del file_name, content_type
         try:
-            from striprtf.striprtf import rtf_to_text
+            import striprtf  # noqa: F401
         except ImportError:
             return ParseResult(
                 parser_id=self.parser_id,
@@ -29,7 +147,7 @@ class RtfDocumentParser:
         decoded: str | None = None
         for encoding in ("utf-8", "latin-1"):
             try:
-                decoded = content.decode(encoding)
+                decoded = str(content, encoding)
                 break
             except UnicodeDecodeError:
                 continue
@@ -43,7 +161,7 @@ class RtfDocumentParser:
             )
 
         try:
-            text = rtf_to_text(decoded)
+            text = _rtf_to_text(decoded)
         except Exception as exc:
             return ParseResult(
                 parser_id=self.parser_id,
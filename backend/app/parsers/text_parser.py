@@ -30,7 +30,7 @@ class TextDocumentParser:
         text: str | None = None
         for encoding in ("utf-8", "latin-1"):
             try:
-                text = content.decode(encoding)
+                text = str(content, encoding)
                 break
             except UnicodeDecodeError:
                 continue
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+import copy
+import hashlib
 import re
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Literal
 
 from pydantic import BaseModel, Field, ValidationError, model_validator
@@ -67,13 +73,30 @@ def _dedupe(items: list[object]) -> list[str]:
     return result
 
 
+# Normalization and line-classification patterns are compiled once at import; these helpers run
+# for every line and candidate prompt of every extraction window.
+_PARENTHETICAL_PATTERN = re.compile(r"\([^)]*\)")
+_NON_ALNUM_PATTERN = re.compile(r"[^a-z0-9\s]")
+_ATTACHMENT_INCLUDE_PREFIX_PATTERN = re.compile(r"^include\s+")
+_ATTACHMENT_LABEL_PREFIX_PATTERN = re.compile(r"^attachment\s+[a-z0-9]+\s*[:\-]\s*")
+_CANONICAL_QUESTION_ID_PATTERN = re.compile(r"[Qq]\s*[_\-]?(\d+)")
+_NUMBERED_QUESTION_ID_PATTERN = re.compile(r"(?i)(?:question\s*)?(\d+)")
+_NUMBERED_QUESTION_LINE_PATTERN = re.compile(r"^(?:q(?:uestion)?\s*)?\d+[\).:\-]\s+")
+_RUBRIC_POINTS_PATTERN = re.compile(r"\(\s*\d+\s*points?\s*\)")
+_POINTS_ONLY_PATTERN = re.compile(r"\(?\s*\d+\s*points?\s*\)?")
+_NUMBERED_ITEM_PATTERN = re.compile(r"^\d+[\).:]")
+
+
 def _normalize_text_key(value: str) -> str:
     return " ".join(value.lower().split())
 
 
+# Dedupe keys and prompt ranks are pure functions of the prompt text. Windowed extraction and
+# merges recompute them for the same prompts many times, so they are memoized.
+@lru_cache(maxsize=4096)
 def _normalize_question_key(value: str) -> str:
-    stripped = re.sub(r"\([^)]*\)", " ", value.lower())
-    stripped = re.sub(r"[^a-z0-9\s]", " ", stripped)
+    stripped = _PARENTHETICAL_PATTERN.sub(" ", value.lower())
+    stripped = _NON_ALNUM_PATTERN.sub(" ", stripped)
     return " ".join(stripped.split())
 
 
@@ -82,6 +105,7 @@ def _normalize_question_base_key(value: str) -> str:
     return _normalize_question_key(base)
 
 
+@lru_cache(maxsize=4096)
 def _question_prompt_rank(value: str) -> int:
     normalized = " ".join(value.split()).strip()
     if not normalized:
@@ -94,16 +118,18 @@ def _question_prompt_rank(value: str) -> int:
     return rank
 
 
+@lru_cache(maxsize=4096)
 def _normalize_attachment_key(value: str) -> str:
     lowered = value.lower().strip(" -\t")
-    lowered = re.sub(r"^include\s+", "", lowered)
-    lowered = re.sub(r"^attachment\s+[a-z0-9]+\s*[:\-]\s*", "", lowered)
-    lowered = re.sub(r"[^a-z0-9\s]", " ", lowered)
+    lowered = _ATTACHMENT_INCLUDE_PREFIX_PATTERN.sub("", lowered)
+    lowered = _ATTACHMENT_LABEL_PREFIX_PATTERN.sub("", lowered)
+    lowered = _NON_ALNUM_PATTERN.sub(" ", lowered)
     return " ".join(lowered.split())
 
 
+@lru_cache(maxsize=4096)
 def _normalize_free_text(value: str) -> str:
-    normalized = re.sub(r"[^a-z0-9\s]", " ", value.lower())
+    normalized = _NON_ALNUM_PATTERN.sub(" ", value.lower())
     return " ".join(normalized.split())
 
 
@@ -121,11 +147,11 @@ def _normalize_internal_question_id(raw_id: object, fallback_index: int) -> str:
     if not candidate:
         return f"Q{fallback_index}"
 
-    canonical_match = re.fullmatch(r"[Qq]\s*[_\-]?(\d+)", candidate)
+    canonical_match = _CANONICAL_QUESTION_ID_PATTERN.fullmatch(candidate)
     if canonical_match:
         return f"Q{int(canonical_match.group(1))}"
 
-    number_match = re.fullmatch(r"(?i)(?:question\s*)?(\d+)", candidate)
+    number_match = _NUMBERED_QUESTION_ID_PATTERN.fullmatch(candidate)
     if number_match:
         return f"Q{int(number_match.group(1))}"
 
@@ -146,31 +172,37 @@ def _coerce_question_identifiers(
     return internal_id, original_id
 
 
+# List-cleanup predicates are pure functions of one item's text. Every merge reclassifies the same
+# eligibility/rubric/cost lines from both payloads, so each distinct line is lowered and matched once.
+@lru_cache(maxsize=4096)
 def _is_question_or_heading_line(value: str) -> bool:
     lowered = value.lower().strip()
     if _section_from_heading(value) is not None:
         return True
     if lowered.startswith(("funding opportunity", "program overview", "required narrative questions", "submission requirements")):
         return True
-    if re.match(r"^(?:q(?:uestion)?\s*)?\d+[\).:\-]\s+", lowered):
+    if _NUMBERED_QUESTION_LINE_PATTERN.match(lowered):
         return True
     return False
 
 
+@lru_cache(maxsize=4096)
 def _looks_like_rubric_item(value: str) -> bool:
     lowered = value.lower()
-    if re.search(r"\(\s*\d+\s*points?\s*\)", lowered):
+    if _RUBRIC_POINTS_PATTERN.search(lowered):
         return True
     if lowered.strip().endswith("points"):
         return True
     return False
 
 
+@lru_cache(maxsize=4096)
 def _is_points_only_fragment(value: str) -> bool:
     lowered = value.lower().strip()
-    return re.fullmatch(r"\(?\s*\d+\s*points?\s*\)?", lowered) is not None
+    return _POINTS_ONLY_PATTERN.fullmatch(lowered) is not None
 
 
+@lru_cache(maxsize=4096)
 def _looks_like_disallowed_cost_item(value: str) -> bool:
     normalized = _normalize_free_text(value)
     if not normalized:
@@ -242,20 +274,19 @@ def _clean_disallowed_costs(items: list[str]) -> list[str]:
 
 def _drop_prefix_fragments(items: list[str], min_prefix_len: int = 12) -> list[str]:
     normalized = [_normalize_free_text(item) for item in items]
-    keep = [True] * len(items)
-    for index, key in enumerate(normalized):
+    # Any key that strictly extends ``key`` sorts after it, and so does everything in between;
+    # checking the next larger distinct key finds an extension without comparing every pair.
+    ordered_keys = sorted(set(normalized))
+    result: list[str] = []
+    for item, key in zip(items, normalized, strict=False):
         if not key:
-            keep[index] = False
             continue
-        if len(key) < min_prefix_len:
-            continue
-        for other_index, other_key in enumerate(normalized):
-            if index == other_index:
+        if len(key) >= min_prefix_len:
+            successor_index = bisect_right(ordered_keys, key)
+            if successor_index < len(ordered_keys) and ordered_keys[successor_index].startswith(key):
                 continue
-            if other_key.startswith(key) and other_key != key:
-                keep[index] = False
-                break
-    return [item for item, should_keep in zip(items, keep, strict=False) if should_keep]
+        result.append(item)
+    return result
 
 
 def _is_section_heading(line: str) -> bool:
@@ -264,7 +295,7 @@ def _is_section_heading(line: str) -> bool:
         return False
     if stripped.startswith(("-", "*", "•")):
         return False
-    if re.match(r"^\d+[\).:]", stripped):
+    if _NUMBERED_ITEM_PATTERN.match(stripped):
         return False
     return True
 
@@ -315,10 +346,16 @@ def _clean_requirements_lists(payload: dict[str, object]) -> dict[str, object]:
         ("disallowed costs", "disallowed cost", "ineligible costs", "ineligible cost"),
     )
 
-    rubric_promoted = [item for item in disallowed_items if _looks_like_rubric_item(item)]
+    rubric_promoted: list[str] = []
+    remaining_disallowed: list[str] = []
+    for item in disallowed_items:
+        if _looks_like_rubric_item(item):
+            rubric_promoted.append(item)
+        else:
+            remaining_disallowed.append(item)
     if rubric_promoted:
         rubric_items = _dedupe([*rubric_items, *rubric_promoted])
-        disallowed_items = [item for item in disallowed_items if not _looks_like_rubric_item(item)]
+        disallowed_items = remaining_disallowed
 
     rubric_items = [item for item in rubric_items if not _is_points_only_fragment(item)]
 
@@ -329,16 +366,16 @@ def _clean_requirements_lists(payload: dict[str, object]) -> dict[str, object]:
     return cleaned
 
 
+_WORD_LIMIT_PATTERN = re.compile(r"(\d{2,5})\s*words?\b", flags=re.IGNORECASE)
+_CHAR_LIMIT_PATTERN = re.compile(r"(\d{2,6})\s*(?:chars?|characters?)\b", flags=re.IGNORECASE)
+
+
 def _extract_question_limit(text: str) -> QuestionLimit:
-    words_match = re.search(r"(\d{2,5})\s*words?\b", text, flags=re.IGNORECASE)
+    words_match = _WORD_LIMIT_PATTERN.search(text)
     if words_match:
         return QuestionLimit(type="words", value=int(words_match.group(1)))
 
-    chars_match = re.search(
-        r"(\d{2,6})\s*(?:chars?|characters?)\b",
-        text,
-        flags=re.IGNORECASE,
-    )
+    chars_match = _CHAR_LIMIT_PATTERN.search(text)
     if chars_match:
         return QuestionLimit(type="chars", value=int(chars_match.group(1)))
 
@@ -381,23 +418,28 @@ _HEADING_NOISE_PREFIXES = (
 )
 
 
+_QUESTION_NUMBER_PREFIX_PATTERN = re.compile(r"^(?:q(?:uestion)?\s*\d+\s*[:\).-]?\s*)", flags=re.IGNORECASE)
+_OUTLINE_NUMBER_PREFIX_PATTERN = re.compile(
+    r"^(?:\d+(?:\.\d+){0,4}|[A-Z]\.\d+(?:\.\d+){0,4}|[IVXLCDM]{1,6})\s*(?:[)\.:\-])?\s+"
+)
+_REQUIREMENT_TAG_PREFIX_PATTERN = re.compile(
+    r"^(?:req(?:uirement)?)[\s\-_]*[A-Za-z]?\d+(?:\.\d+)*\s*[:\-]\s*",
+    flags=re.IGNORECASE,
+)
+_PROMPT_WORD_PATTERN = re.compile(r"[a-zA-Z]{2,}")
+_REQUIREMENT_KEYWORD_PATTERN = re.compile(
+    r"\b(must|shall|required|required to|is required to|are required to|please)\b"
+)
+
+
 def _clean_candidate_prompt(text: str) -> str:
     cleaned = " ".join(text.strip(" -*\t").split())
     if not cleaned:
         return ""
 
-    cleaned = re.sub(r"^(?:q(?:uestion)?\s*\d+\s*[:\).-]?\s*)", "", cleaned, flags=re.IGNORECASE)
-    cleaned = re.sub(
-        r"^(?:\d+(?:\.\d+){0,4}|[A-Z]\.\d+(?:\.\d+){0,4}|[IVXLCDM]{1,6})\s*(?:[)\.:\-])?\s+",
-        "",
-        cleaned,
-    )
-    cleaned = re.sub(
-        r"^(?:req(?:uirement)?)[\s\-_]*[A-Za-z]?\d+(?:\.\d+)*\s*[:\-]\s*",
-        "",
-        cleaned,
-        flags=re.IGNORECASE,
-    )
+    cleaned = _QUESTION_NUMBER_PREFIX_PATTERN.sub("", cleaned)
+    cleaned = _OUTLINE_NUMBER_PREFIX_PATTERN.sub("", cleaned)
+    cleaned = _REQUIREMENT_TAG_PREFIX_PATTERN.sub("", cleaned)
     return " ".join(cleaned.split()).strip(" -\t")
 
 
@@ -412,7 +454,7 @@ def _looks_like_requirement_prompt(text: str) -> bool:
     if any(lowered.startswith(prefix) for prefix in _HEADING_NOISE_PREFIXES):
         return False
 
-    words = re.findall(r"[a-zA-Z]{2,}", cleaned)
+    words = _PROMPT_WORD_PATTERN.findall(cleaned)
     if len(words) < 3:
         return False
 
@@ -425,10 +467,7 @@ def _looks_like_requirement_prompt(text: str) -> bool:
     if any(lowered.startswith(prefix) for prefix in _QUESTION_VERB_PREFIXES):
         return True
 
-    if re.search(
-        r"\b(must|shall|required|required to|is required to|are required to|please)\b",
-        lowered,
-    ):
+    if _REQUIREMENT_KEYWORD_PATTERN.search(lowered):
         return True
 
     return False
@@ -456,142 +495,164 @@ def _build_question_candidate(
     return candidate
 
 
-def _extract_explicit_tag_candidates(lines: list[str]) -> list[dict[str, object]]:
-    pattern = re.compile(
-        r"^((?:req(?:uirement)?)[\s\-_]*[A-Za-z]?\d+(?:\.\d+)*)\s*[:\-]\s+(.+)$",
-        flags=re.IGNORECASE,
-    )
-    results: list[dict[str, object]] = []
-    for line_index, line in enumerate(lines):
-        match = pattern.match(line.strip(" -*\t"))
-        if not match:
-            continue
-        candidate = _build_question_candidate(
-            raw_prompt=match.group(2),
-            provenance="explicit_tag",
-            line_index=line_index,
-            original_id=match.group(1),
-        )
-        if candidate is not None:
-            results.append(candidate)
-    return results
+# Line patterns for the question passes are compiled once; every pass runs against the same
+# stripped line inside the single loop in ``_extract_questions``.
+_EXPLICIT_TAG_PATTERN = re.compile(
+    r"^((?:req(?:uirement)?)[\s\-_]*[A-Za-z]?\d+(?:\.\d+)*)\s*[:\-]\s+(.+)$",
+    flags=re.IGNORECASE,
+)
+_STRUCTURED_OUTLINE_PATTERN = re.compile(
+    r"^((?:\d+(?:\.\d+){1,4}|[A-Z]\.\d+(?:\.\d+){0,4}|[IVXLCDM]{1,6}))\s*(?:[)\.:\-])?\s+(.+)$",
+    flags=re.IGNORECASE,
+)
+_LETTER_OUTLINE_MARKER_PATTERN = re.compile(r"^[A-Z]\.\d+")
+_ROMAN_OUTLINE_MARKER_PATTERN = re.compile(r"[IVXLCDM]{1,6}")
+_INLINE_SUBJECT_PATTERN = re.compile(
+    r"\b(?:applicants?|organizations?|proposals?|responses?|grantees?)\b.+\b(?:must|shall|required)\b[:\s\-]*(.+)$",
+    flags=re.IGNORECASE,
+)
+# The subject pattern split at its subject word. If the first subject word cannot start a match,
+# no later one can (``.+`` would only have less to absorb), so matching the tail once from the
+# first subject gives the same result in linear time instead of a rescan per subject word.
+_INLINE_SUBJECT_WORD_PATTERN = re.compile(
+    r"\b(?:applicants?|organizations?|proposals?|responses?|grantees?)\b",
+    flags=re.IGNORECASE,
+)
+_INLINE_SUBJECT_TAIL_PATTERN = re.compile(r".+\b(?:must|shall|required)\b[:\s\-]*(.+)$", flags=re.IGNORECASE)
+_INLINE_REQUIREMENT_PATTERN = re.compile(
+    r"\b(?:must|shall|required to|is required to|are required to)\b[:\s\-]*(.+)$",
+    flags=re.IGNORECASE,
+)
+# Both inline patterns need one of these words, so lines without any of them skip both searches
+# (the subject pattern in particular rescans the line from every subject word it finds).
+_INLINE_KEYWORD_PATTERN = re.compile(r"\b(?:must|shall|required)\b", flags=re.IGNORECASE)
+_FALLBACK_QUESTION_PATTERN = re.compile(
+    r"^(?:q(?:uestion)?\s*(\d+)\s*[:\).-]?\s*|(\d+)[\).:]\s+)(.+)$",
+    flags=re.IGNORECASE,
+)
 
 
-def _extract_structured_outline_candidates(lines: list[str]) -> list[dict[str, object]]:
-    pattern = re.compile(
-        r"^((?:\d+(?:\.\d+){1,4}|[A-Z]\.\d+(?:\.\d+){0,4}|[IVXLCDM]{1,6}))\s*(?:[)\.:\-])?\s+(.+)$",
-        flags=re.IGNORECASE,
+def _explicit_tag_candidate(stripped: str, line_index: int) -> dict[str, object] | None:
+    match = _EXPLICIT_TAG_PATTERN.match(stripped)
+    if not match:
+        return None
+    return _build_question_candidate(
+        raw_prompt=match.group(2),
+        provenance="explicit_tag",
+        line_index=line_index,
+        original_id=match.group(1),
     )
-    results: list[dict[str, object]] = []
-    for line_index, line in enumerate(lines):
-        match = pattern.match(line.strip(" -*\t"))
-        if not match:
-            continue
 
-        marker = match.group(1)
-        marker_upper = marker.upper()
-        is_numeric_outline = "." in marker and marker[0].isdigit()
-        is_letter_outline = bool(re.match(r"^[A-Z]\.\d+", marker_upper))
-        is_roman_outline = bool(re.fullmatch(r"[IVXLCDM]{1,6}", marker_upper))
-        if not (is_numeric_outline or is_letter_outline or is_roman_outline):
-            continue
 
-        candidate = _build_question_candidate(
-            raw_prompt=match.group(2),
-            provenance="structured_outline",
-            line_index=line_index,
-            original_id=marker,
-        )
-        if candidate is not None:
-            results.append(candidate)
-    return results
+def _structured_outline_candidate(stripped: str, line_index: int) -> dict[str, object] | None:
+    match = _STRUCTURED_OUTLINE_PATTERN.match(stripped)
+    if not match:
+        return None
 
+    marker = match.group(1)
+    marker_upper = marker.upper()
+    is_numeric_outline = "." in marker and marker[0].isdigit()
+    is_letter_outline = _LETTER_OUTLINE_MARKER_PATTERN.match(marker_upper) is not None
+    is_roman_outline = _ROMAN_OUTLINE_MARKER_PATTERN.fullmatch(marker_upper) is not None
+    if not (is_numeric_outline or is_letter_outline or is_roman_outline):
+        return None
 
-def _extract_inline_requirement_candidates(lines: list[str]) -> list[dict[str, object]]:
-    results: list[dict[str, object]] = []
-    for line_index, line in enumerate(lines):
-        stripped = line.strip(" -*\t")
-        if not stripped:
-            continue
+    return _build_question_candidate(
+        raw_prompt=match.group(2),
+        provenance="structured_outline",
+        line_index=line_index,
+        original_id=marker,
+    )
 
-        matched_prompt: str | None = None
 
-        subject_pattern = re.search(
-            r"\b(?:applicants?|organizations?|proposals?|responses?|grantees?)\b.+\b(?:must|shall|required)\b[:\s\-]*(.+)$",
-            stripped,
-            flags=re.IGNORECASE,
-        )
-        if subject_pattern:
-            matched_prompt = subject_pattern.group(1)
+def _inline_subject_prompt(stripped: str) -> str | None:
+    if "\n" in stripped:
+        # ``.`` stops at newlines, so a later subject word could still match; keep the full search.
+        subject_match = _INLINE_SUBJECT_PATTERN.search(stripped)
+        return subject_match.group(1) if subject_match else None
+    subject_word = _INLINE_SUBJECT_WORD_PATTERN.search(stripped)
+    if subject_word is None:
+        return None
+    tail_match = _INLINE_SUBJECT_TAIL_PATTERN.match(stripped, subject_word.end())
+    return tail_match.group(1) if tail_match else None
+
 
+def _inline_requirement_candidate(stripped: str, line_index: int) -> dict[str, object] | None:
+    matched_prompt: str | None = None
+
+    if _INLINE_KEYWORD_PATTERN.search(stripped):
+        matched_prompt = _inline_subject_prompt(stripped)
         if matched_prompt is None:
-            requirement_pattern = re.search(
-                r"\b(?:must|shall|required to|is required to|are required to)\b[:\s\-]*(.+)$",
-                stripped,
-                flags=re.IGNORECASE,
-            )
-            if requirement_pattern:
-                matched_prompt = requirement_pattern.group(1)
+            requirement_match = _INLINE_REQUIREMENT_PATTERN.search(stripped)
+            if requirement_match:
+                matched_prompt = requirement_match.group(1)
+
+    if matched_prompt is None and ":" in stripped:
+        heading, _, tail = stripped.partition(":")
+        heading_lower = heading.lower()
+        if any(
+            token in heading_lower
+            for token in ("requirement", "narrative", "prompt", "response")
+        ):
+            matched_prompt = tail
+
+    if matched_prompt is None and _extract_question_limit(stripped).type != "none":
+        matched_prompt = stripped
 
-        if matched_prompt is None and ":" in stripped:
-            heading, _, tail = stripped.partition(":")
-            heading_lower = heading.lower()
-            if any(
-                token in heading_lower
-                for token in ("requirement", "narrative", "prompt", "response")
-            ):
-                matched_prompt = tail
+    if matched_prompt is None:
+        return None
 
-        if matched_prompt is None and _extract_question_limit(stripped).type != "none":
-            matched_prompt = stripped
+    return _build_question_candidate(
+        raw_prompt=matched_prompt,
+        provenance="inline_indicator",
+        line_index=line_index,
+    )
 
-        if matched_prompt is None:
-            continue
 
-        candidate = _build_question_candidate(
-            raw_prompt=matched_prompt,
-            provenance="inline_indicator",
-            line_index=line_index,
-        )
-        if candidate is not None:
-            results.append(candidate)
-    return results
+def _fallback_question_candidate(stripped: str, line_index: int) -> dict[str, object] | None:
+    prompt_text: str | None = None
+    original_id: str | None = None
+    question_match = _FALLBACK_QUESTION_PATTERN.match(stripped)
+    if question_match:
+        prompt_text = question_match.group(3)
+        question_number = question_match.group(1) or question_match.group(2)
+        if question_number:
+            original_id = f"Question {question_number}"
+    elif stripped.endswith("?") and _looks_like_requirement_prompt(stripped):
+        prompt_text = stripped
 
+    if prompt_text is None:
+        return None
 
-def _extract_fallback_question_candidates(lines: list[str]) -> list[dict[str, object]]:
-    question_pattern = re.compile(
-        r"^(?:q(?:uestion)?\s*(\d+)\s*[:\).-]?\s*|(\d+)[\).:]\s+)(.+)$",
-        flags=re.IGNORECASE,
+    return _build_question_candidate(
+        raw_prompt=prompt_text,
+        provenance="fallback_question",
+        line_index=line_index,
+        original_id=original_id,
     )
-    results: list[dict[str, object]] = []
+
+
+# Per-line candidate builders in pass order. A line may yield a candidate from several passes, so
+# each builder sees every line; candidates are still ranked pass-by-pass afterwards.
+_QUESTION_CANDIDATE_BUILDERS = (
+    _explicit_tag_candidate,
+    _structured_outline_candidate,
+    _inline_requirement_candidate,
+    _fallback_question_candidate,
+)
+
+
+def _collect_question_candidates(lines: list[str]) -> list[dict[str, object]]:
+    candidates_by_pass: list[list[dict[str, object]]] = [[] for _ in _QUESTION_CANDIDATE_BUILDERS]
     for line_index, line in enumerate(lines):
         stripped = line.strip(" -*\t")
         if not stripped:
             continue
-
-        prompt_text: str | None = None
-        original_id: str | None = None
-        question_match = question_pattern.match(stripped)
-        if question_match:
-            prompt_text = question_match.group(3)
-            question_number = question_match.group(1) or question_match.group(2)
-            if question_number:
-                original_id = f"Question {question_number}"
-        elif stripped.endswith("?") and _looks_like_requirement_prompt(stripped):
-            prompt_text = stripped
-
-        if prompt_text is None:
-            continue
-
-        candidate = _build_question_candidate(
-            raw_prompt=prompt_text,
-            provenance="fallback_question",
-            line_index=line_index,
-            original_id=original_id,
-        )
-        if candidate is not None:
-            results.append(candidate)
-    return results
+        for bucket, build_candidate in zip(candidates_by_pass, _QUESTION_CANDIDATE_BUILDERS):
+            candidate = build_candidate(stripped, line_index)
+            if candidate is not None:
+                bucket.append(candidate)
+    return [candidate for bucket in candidates_by_pass for candidate in bucket]
 
 
 def _candidate_score(candidate: dict[str, object]) -> int:
@@ -602,11 +663,7 @@ def _candidate_score(candidate: dict[str, object]) -> int:
 
 
 def _extract_questions(lines: list[str]) -> list[dict[str, object]]:
-    ordered_candidates: list[dict[str, object]] = []
-    ordered_candidates.extend(_extract_explicit_tag_candidates(lines))
-    ordered_candidates.extend(_extract_structured_outline_candidates(lines))
-    ordered_candidates.extend(_extract_inline_requirement_candidates(lines))
-    ordered_candidates.extend(_extract_fallback_question_candidates(lines))
+    ordered_candidates = _collect_question_candidates(lines)
 
     selected: list[dict[str, object]] = []
     seen_prompt_keys: set[str] = set()
@@ -660,10 +717,61 @@ def _extract_questions(lines: list[str]) -> list[dict[str, object]]:
     return questions
 
 
+# Metadata patterns are compiled once. The keyword pattern is a single-pass prefilter: every
+# funder/opportunity/deadline pattern needs one of these words, so lines without any of them
+# skip the individual searches.
+_METADATA_KEYWORDS_PATTERN = re.compile(
+    r"funder|grantor|funding organization|opportunity|deadline|due date|submission date",
+    flags=re.IGNORECASE,
+)
+_FUNDER_PATTERN = re.compile(r"(?:funder|grantor|funding organization)\s*[:\-]\s*(.+)", flags=re.IGNORECASE)
+_OPPORTUNITY_PATTERN = re.compile(r"(?:funding opportunity|opportunity)\s*[:\-]\s*(.+)", flags=re.IGNORECASE)
+_LOCAL_AUTHORITY_PATTERN = re.compile(r"((?:city|county)\s+of\s+.+)", flags=re.IGNORECASE)
+_FUNDER_NAME_STOPWORD_PATTERN = re.compile(
+    r"\b(?:grant|fund|programme|program|initiative|competition|call|youth|workforce|innovation)\b",
+    flags=re.IGNORECASE,
+)
+_DEADLINE_PATTERN = re.compile(r"(?:deadline|due date|submission date)\s*[:\-]\s*(.+)", flags=re.IGNORECASE)
+
+
+# Deterministic extraction depends only on the chunk texts, and extraction reruns on the same
+# RFP chunks across retries, revision rounds and repeated full-draft runs.
+_REQUIREMENTS_PAYLOAD_CACHE_MAX_ENTRIES = 128
+_REQUIREMENTS_PAYLOAD_CACHE: OrderedDict[bytes, dict[str, object]] = OrderedDict()
+_REQUIREMENTS_PAYLOAD_CACHE_LOCK = threading.Lock()
+
+
+def _chunk_texts_key(chunk_texts: list[str]) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    for chunk_text in chunk_texts:
+        encoded = chunk_text.encode("utf-8")
+        digest.update(len(encoded).to_bytes(8, "big"))
+        digest.update(encoded)
+    return digest.digest()
+
+
 def extract_requirements_payload(chunks: list[dict[str, object]]) -> dict[str, object]:
+    chunk_texts = [str(chunk["text"]) for chunk in chunks]
+    cache_key = _chunk_texts_key(chunk_texts)
+    with _REQUIREMENTS_PAYLOAD_CACHE_LOCK:
+        cached = _REQUIREMENTS_PAYLOAD_CACHE.get(cache_key)
+        if cached is not None:
+            _REQUIREMENTS_PAYLOAD_CACHE.move_to_end(cache_key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
+    payload = _build_requirements_payload(chunk_texts)
+    with _REQUIREMENTS_PAYLOAD_CACHE_LOCK:
+        _REQUIREMENTS_PAYLOAD_CACHE[cache_key] = copy.deepcopy(payload)
+        _REQUIREMENTS_PAYLOAD_CACHE.move_to_end(cache_key)
+        while len(_REQUIREMENTS_PAYLOAD_CACHE) > _REQUIREMENTS_PAYLOAD_CACHE_MAX_ENTRIES:
+            _REQUIREMENTS_PAYLOAD_CACHE.popitem(last=False)
+    return payload
+
+
+def _build_requirements_payload(chunk_texts: list[str]) -> dict[str, object]:
     lines: list[str] = []
-    for chunk in chunks:
-        chunk_text = str(chunk["text"])
+    for chunk_text in chunk_texts:
         lines.extend([line.strip() for line in chunk_text.splitlines() if line.strip()])
 
     funder: str | None = None
@@ -680,45 +788,28 @@ def extract_requirements_payload(chunks: list[dict[str, object]]) -> dict[str, o
             if active_section is not None:
                 continue
 
-        if funder is None:
-            funder_match = re.search(
-                r"(?:funder|grantor|funding organization)\s*[:\-]\s*(.+)",
-                line,
-                flags=re.IGNORECASE,
-            )
+        needs_metadata = funder is None or deadline is None
+        if needs_metadata and _METADATA_KEYWORDS_PATTERN.search(line) is None:
+            needs_metadata = False
+
+        if needs_metadata and funder is None:
+            funder_match = _FUNDER_PATTERN.search(line)
             if funder_match:
                 funder = funder_match.group(1).strip()
             else:
-                opportunity_match = re.search(
-                    r"(?:funding opportunity|opportunity)\s*[:\-]\s*(.+)",
-                    line,
-                    flags=re.IGNORECASE,
-                )
+                opportunity_match = _OPPORTUNITY_PATTERN.search(line)
                 if opportunity_match:
                     opportunity_text = opportunity_match.group(1).strip()
-                    local_authority_match = re.search(
-                        r"((?:city|county)\s+of\s+.+)",
-                        opportunity_text,
-                        flags=re.IGNORECASE,
-                    )
+                    local_authority_match = _LOCAL_AUTHORITY_PATTERN.search(opportunity_text)
                     if local_authority_match:
                         candidate = local_authority_match.group(1).strip()
-                        candidate = re.split(
-                            r"\b(?:grant|fund|programme|program|initiative|competition|call|youth|workforce|innovation)\b",
-                            candidate,
-                            maxsplit=1,
-                            flags=re.IGNORECASE,
-                        )[0].strip()
+                        candidate = _FUNDER_NAME_STOPWORD_PATTERN.split(candidate, maxsplit=1)[0].strip()
                         funder = candidate or opportunity_text
                     else:
                         funder = opportunity_text
 
-        if deadline is None:
-            deadline_match = re.search(
-                r"(?:deadline|due date|submission date)\s*[:\-]\s*(.+)",
-                line,
-                flags=re.IGNORECASE,
-            )
+        if needs_metadata and deadline is None:
+            deadline_match = _DEADLINE_PATTERN.search(line)
             if deadline_match:
                 deadline = deadline_match.group(1).strip()
 
@@ -1,12 +1,24 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import logging
 import math
+import multiprocessing
+import operator
+import os
 import re
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
-from typing import Any, Literal
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Iterator, Literal
 
 from app.parsers import ParseResult, ParserRegistry
 
@@ -160,6 +172,7 @@ class EmbeddingService:
         aws_region: str,
         bedrock_model_id: str,
         bedrock_client: BedrockEmbeddingClient | None = None,
+        batch_workers: int = 1,
     ) -> None:
         normalized_mode = mode.strip().lower()
         if normalized_mode not in self._VALID_MODES:
@@ -170,6 +183,7 @@ class EmbeddingService:
         self._bedrock_model_id = bedrock_model_id.strip()
         self._bedrock_client = bedrock_client
         self._bedrock_unavailable_reason: str | None = None
+        self._batch_workers = max(1, batch_workers)
 
     def describe(self) -> dict[str, object]:
         return {
@@ -207,6 +221,20 @@ class EmbeddingService:
                 warning=warning,
             )
 
+    def embed_batch(self, texts: list[str], dim: int) -> list[EmbeddingResult]:
+        if self.mode == "hash":
+            return [EmbeddingResult(vector=vector, provider="hash") for vector in embed_texts(texts, dim)]
+        # Bedrock embeds one input per InvokeModel call; keep per-text fallback semantics.
+        if self._batch_workers == 1 or len(texts) < 2:
+            return [self.embed(text, dim) for text in texts]
+        # The first call creates the client and trips the circuit breaker if the provider is down,
+        # so the rest either fan out to a healthy provider or fall back without calling it.
+        first = self.embed(texts[0], dim)
+        if first.provider != "bedrock":
+            return [first, *(self.embed(text, dim) for text in texts[1:])]
+        with ThreadPoolExecutor(max_workers=min(self._batch_workers, len(texts) - 1)) as executor:
+            return [first, *executor.map(lambda text: self.embed(text, dim), texts[1:])]
+
     def _embed_with_bedrock(self, text: str, dim: int) -> list[float]:
         if not self._bedrock_model_id:
             raise EmbeddingProviderError("Bedrock embedding model ID is not configured.")
@@ -268,6 +296,122 @@ def extract_text_pages(content: bytes, content_type: str, file_name: str) -> Tex
     return _from_parse_result(parse_result)
 
 
+# Workers are spawned rather than forked: the API process already runs the logging queue listener
+# and threadpool threads, and forking while those hold locks can deadlock the child.
+_PARSE_POOL_MP_CONTEXT = multiprocessing.get_context("spawn")
+_PARSE_POOL: ProcessPoolExecutor | None = None
+_PARSE_POOL_WORKERS = 0
+_PARSE_POOL_LOCK = threading.Lock()
+
+
+def _get_parse_pool(max_workers: int) -> ProcessPoolExecutor:
+    global _PARSE_POOL, _PARSE_POOL_WORKERS
+    stale: ProcessPoolExecutor | None = None
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is None or _PARSE_POOL_WORKERS != max_workers:
+            stale = _PARSE_POOL
+            _PARSE_POOL = ProcessPoolExecutor(max_workers=max_workers, mp_context=_PARSE_POOL_MP_CONTEXT)
+            _PARSE_POOL_WORKERS = max_workers
+        pool = _PARSE_POOL
+    if stale is not None:
+        stale.shutdown(wait=False)
+    return pool
+
+
+def _discard_parse_pool(pool: ProcessPoolExecutor) -> None:
+    global _PARSE_POOL
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is not pool:
+            return
+        _PARSE_POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_parse_pool() -> None:
+    global _PARSE_POOL
+    with _PARSE_POOL_LOCK:
+        pool, _PARSE_POOL = _PARSE_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+async def extract_text_pages_many(
+    uploads: list[tuple[bytes, str, str]],
+    *,
+    max_workers: int,
+) -> list[TextExtraction]:
+    """Parse ``(content, content_type, file_name)`` uploads, in order.
+
+    With ``max_workers > 1`` and more than one upload, parsing runs on a shared process pool so
+    CPU-bound PDF/DOCX decoding of a batch overlaps; otherwise it stays in-process. If a pool
+    worker dies (e.g. a native parser crash), the pool is discarded and each unfinished upload is
+    retried once on its own on a fresh pool; one that still kills its worker gets a parser-error
+    extraction. Uploads are never re-parsed in the API process, since a crash there would take the
+    server down with it.
+    """
+    if max_workers <= 1 or len(uploads) <= 1:
+        return [
+            extract_text_pages(content=content, content_type=content_type, file_name=file_name)
+            for content, content_type, file_name in uploads
+        ]
+
+    workers = min(max_workers, os.cpu_count() or 1)
+    loop = asyncio.get_running_loop()
+    pool = _get_parse_pool(workers)
+    outcomes = await asyncio.gather(
+        *(_submit_parse(loop, pool, upload) for upload in uploads),
+        return_exceptions=True,
+    )
+    extractions: list[TextExtraction] = []
+    retry_pool: ProcessPoolExecutor | None = None
+    for upload, outcome in zip(uploads, outcomes):
+        if isinstance(outcome, BrokenProcessPool):
+            # A dead worker fails every in-flight upload, so retry each one alone on a fresh pool
+            # to isolate the file that actually crashed.
+            _discard_parse_pool(pool)
+            if retry_pool is None:
+                retry_pool = _get_parse_pool(workers)
+            (outcome,) = await asyncio.gather(_submit_parse(loop, retry_pool, upload), return_exceptions=True)
+            if isinstance(outcome, BrokenProcessPool):
+                logger.warning(
+                    "parse_pool_broken",
+                    extra={"event": "parse_pool_broken", "file_name": upload[2]},
+                )
+                _discard_parse_pool(retry_pool)
+                retry_pool = None
+                outcome = _crashed_parse_extraction(upload)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        extractions.append(outcome)
+    return extractions
+
+
+def _submit_parse(
+    loop: asyncio.AbstractEventLoop,
+    pool: ProcessPoolExecutor,
+    upload: tuple[bytes, str, str],
+) -> asyncio.Future[TextExtraction]:
+    content, content_type, file_name = upload
+    try:
+        return loop.run_in_executor(pool, extract_text_pages, content, content_type, file_name)
+    except BrokenProcessPool as exc:
+        # submit() raises directly once the pool has already been marked broken.
+        failed: asyncio.Future[TextExtraction] = loop.create_future()
+        failed.set_exception(exc)
+        return failed
+
+
+def _crashed_parse_extraction(upload: tuple[bytes, str, str]) -> TextExtraction:
+    _, content_type, file_name = upload
+    parser = _PARSER_REGISTRY.resolve(file_name=file_name, content_type=content_type)
+    return TextExtraction(
+        pages=[],
+        parser_id=parser.parser_id if parser is not None else "none",
+        text_extractable=parser is not None,
+        error="parser worker crashed",
+    )
+
+
 def build_parse_report(
     *,
     content: bytes,
@@ -320,23 +464,32 @@ def build_parse_report(
     }
 
 
-def chunk_pages(
+# Hash embeddings are deterministic, so chunked+embedded output for identical page text and
+# chunking parameters can be reused across uploads and re-indexes. Cached vectors are packed
+# float64 arrays (8 bytes per component instead of a boxed float plus a list slot), unpacked
+# into fresh lists on the way out. The cache is bounded by total cached chunks rather than entry
+# count, since one large upload can hold thousands of chunks, and is shared across threadpool
+# workers, so every access goes through the lock.
+_HASH_CHUNK_CACHE_MAX_CHUNKS = 4096
+_HASH_CHUNK_CACHE: OrderedDict[tuple[bytes, int, int, int], tuple[tuple[int, str, array], ...]] = OrderedDict()
+_HASH_CHUNK_CACHE_LOCK = threading.Lock()
+_hash_chunk_cache_size = 0
+
+
+def _pages_content_key(pages: list[ExtractedPage]) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    for page in pages:
+        digest.update(f"{page.page}:{len(page.text)}:".encode("utf-8"))
+        digest.update(page.text.encode("utf-8"))
+    return digest.digest()
+
+
+def _iter_page_windows(
     pages: list[ExtractedPage],
     chunk_size_chars: int,
     chunk_overlap_chars: int,
-    embedding_dim: int,
-    embedding_service: EmbeddingService | None = None,
-    embedding_warnings: list[dict[str, object]] | None = None,
-) -> list[ChunkPayload]:
-    if chunk_size_chars < 1:
-        raise ValueError("chunk_size_chars must be >= 1")
-    if embedding_dim < 8:
-        raise ValueError("embedding_dim must be >= 8")
-
+) -> Iterator[tuple[ExtractedPage, int, int, str]]:
     step = max(1, chunk_size_chars - max(0, chunk_overlap_chars))
-    chunk_counter = 0
-    chunks: list[ChunkPayload] = []
-
     for page in pages:
         start = 0
         text = page.text
@@ -344,53 +497,225 @@ def chunk_pages(
             end = min(start + chunk_size_chars, len(text))
             chunk_text = text[start:end].strip()
             if chunk_text:
-                chunk_counter += 1
-                embedding_result = (
-                    embedding_service.embed(chunk_text, embedding_dim)
-                    if embedding_service is not None
-                    else EmbeddingResult(vector=embed_text(chunk_text, embedding_dim), provider="hash")
-                )
-                if embedding_warnings is not None and embedding_result.warning is not None:
-                    _append_warning_once(embedding_warnings, embedding_result.warning)
-                chunks.append(
-                    ChunkPayload(
-                        chunk_index=chunk_counter,
-                        page=page.page,
-                        text=chunk_text,
-                        embedding=embedding_result.vector,
-                        embedding_provider=embedding_result.provider,
-                    )
-                )
+                yield page, start, end, chunk_text
             if end >= len(text):
                 break
             start += step
 
-    return chunks
+
+def _iter_page_chunks(
+    pages: list[ExtractedPage],
+    chunk_size_chars: int,
+    chunk_overlap_chars: int,
+) -> Iterator[tuple[int, str]]:
+    for page, _, _, chunk_text in _iter_page_windows(pages, chunk_size_chars, chunk_overlap_chars):
+        yield page.page, chunk_text
+
+
+def _iter_page_chunk_tokens(
+    pages: list[ExtractedPage],
+    chunk_size_chars: int,
+    chunk_overlap_chars: int,
+) -> Iterator[tuple[int, str, list[str]]]:
+    """Yield (page, chunk_text, tokens), tokenizing each page once instead of once per window.
+
+    Tokens are maximal [a-z0-9] runs, so a window's tokens are the page token spans clipped
+    to the window. That only holds while lower() keeps character offsets, which is checked
+    per page; other pages are tokenized window by window.
+    """
+
+    current_page: ExtractedPage | None = None
+    lowered = ""
+    starts: list[int] | None = None
+    ends: list[int] = []
+    for page, start, end, chunk_text in _iter_page_windows(pages, chunk_size_chars, chunk_overlap_chars):
+        if page is not current_page:
+            current_page = page
+            lowered = page.text.lower()
+            starts = None
+            if len(lowered) == len(page.text):
+                spans = [match.span() for match in _TOKEN_PATTERN.finditer(lowered)]
+                starts = [span[0] for span in spans]
+                ends = [span[1] for span in spans]
+        if starts is None:
+            yield page.page, chunk_text, _tokenize(chunk_text)
+            continue
+        first = bisect_right(ends, start)
+        last = bisect_left(starts, end)
+        tokens = [
+            lowered[max(token_start, start) : min(token_end, end)]
+            for token_start, token_end in zip(starts[first:last], ends[first:last])
+        ]
+        yield page.page, chunk_text, tokens
+
+
+def _hash_chunks(
+    pages: list[ExtractedPage],
+    chunk_size_chars: int,
+    chunk_overlap_chars: int,
+    embedding_dim: int,
+) -> list[ChunkPayload]:
+    global _hash_chunk_cache_size
+    cache_key = (_pages_content_key(pages), chunk_size_chars, chunk_overlap_chars, embedding_dim)
+    with _HASH_CHUNK_CACHE_LOCK:
+        cached = _HASH_CHUNK_CACHE.get(cache_key)
+        if cached is not None:
+            _HASH_CHUNK_CACHE.move_to_end(cache_key)
+    if cached is None:
+        slots: dict[str, tuple[int, float]] = {}
+        cached = tuple(
+            (page_number, chunk_text, array("d", _hash_vector(tokens, embedding_dim, slots)))
+            for page_number, chunk_text, tokens in _iter_page_chunk_tokens(
+                pages, chunk_size_chars, chunk_overlap_chars
+            )
+        )
+        if len(cached) <= _HASH_CHUNK_CACHE_MAX_CHUNKS:
+            with _HASH_CHUNK_CACHE_LOCK:
+                previous = _HASH_CHUNK_CACHE.pop(cache_key, None)
+                if previous is not None:
+                    _hash_chunk_cache_size -= len(previous)
+                _HASH_CHUNK_CACHE[cache_key] = cached
+                _hash_chunk_cache_size += len(cached)
+                while _hash_chunk_cache_size > _HASH_CHUNK_CACHE_MAX_CHUNKS:
+                    _, evicted = _HASH_CHUNK_CACHE.popitem(last=False)
+                    _hash_chunk_cache_size -= len(evicted)
+    # Hand out fresh vector lists so callers never share mutable state with the cache.
+    return [
+        ChunkPayload(
+            chunk_index=chunk_index,
+            page=page_number,
+            text=chunk_text,
+            embedding=vector.tolist(),
+            embedding_provider="hash",
+        )
+        for chunk_index, (page_number, chunk_text, vector) in enumerate(cached, start=1)
+    ]
+
+
+def chunk_pages(
+    pages: list[ExtractedPage],
+    chunk_size_chars: int,
+    chunk_overlap_chars: int,
+    embedding_dim: int,
+    embedding_service: EmbeddingService | None = None,
+    embedding_warnings: list[dict[str, object]] | None = None,
+) -> list[ChunkPayload]:
+    if chunk_size_chars < 1:
+        raise ValueError("chunk_size_chars must be >= 1")
+    if embedding_dim < 8:
+        raise ValueError("embedding_dim must be >= 8")
+
+    if embedding_service is None or embedding_service.mode == "hash":
+        return _hash_chunks(pages, chunk_size_chars, chunk_overlap_chars, embedding_dim)
+
+    return list(
+        _iter_embedded_chunks(
+            pages,
+            chunk_size_chars,
+            chunk_overlap_chars,
+            embedding_dim,
+            embedding_service,
+            embedding_warnings,
+        )
+    )
+
+
+# Provider-embedded chunking pulls windows lazily in batches, so only one batch of window texts
+# and embedding results is alive at a time instead of every window of a large document.
+_EMBED_BATCH_CHUNKS = 64
+
+
+def _iter_embedded_chunks(
+    pages: list[ExtractedPage],
+    chunk_size_chars: int,
+    chunk_overlap_chars: int,
+    embedding_dim: int,
+    embedding_service: EmbeddingService,
+    embedding_warnings: list[dict[str, object]] | None,
+) -> Iterator[ChunkPayload]:
+    windows = _iter_page_chunks(pages, chunk_size_chars, chunk_overlap_chars)
+    chunk_index = 0
+    while batch := list(islice(windows, _EMBED_BATCH_CHUNKS)):
+        embedding_results = embedding_service.embed_batch([chunk_text for _, chunk_text in batch], embedding_dim)
+        for (page_number, chunk_text), embedding_result in zip(batch, embedding_results):
+            if embedding_warnings is not None and embedding_result.warning is not None:
+                _append_warning_once(embedding_warnings, embedding_result.warning)
+            chunk_index += 1
+            yield ChunkPayload(
+                chunk_index=chunk_index,
+                page=page_number,
+                text=chunk_text,
+                embedding=embedding_result.vector,
+                embedding_provider=embedding_result.provider,
+            )
+
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
 
 
 def _tokenize(text: str) -> list[str]:
-    return re.findall(r"[a-z0-9]+", text.lower())
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+@lru_cache(maxsize=65536)
+def _hash_token_slot(token: str, dim: int) -> tuple[int, float]:
+    digest = hashlib.sha256(token.encode("utf-8")).digest()
+    index = int.from_bytes(digest[:4], "big") % dim
+    sign = 1.0 if digest[4] % 2 == 0 else -1.0
+    return index, sign
+
+
+# Section queries repeat across draft runs, so single-text hash embeddings are memoized as
+# packed arrays and copied out as fresh lists.
+@lru_cache(maxsize=4096)
+def _cached_text_vector(text: str, dim: int) -> array:
+    return array("d", embed_texts([text], dim)[0])
 
 
 def embed_text(text: str, dim: int) -> list[float]:
+    return _cached_text_vector(text, dim).tolist()
+
+
+def _hash_vector(tokens: list[str], dim: int, slots: dict[str, tuple[int, float]]) -> list[float]:
+    # Scatter-add each distinct token once with its count (a bincount); counts are small integers,
+    # so the result is bit-identical to adding the sign once per occurrence.
     vec = [0.0] * dim
-    tokens = _tokenize(text)
-    if not tokens:
-        return vec
+    for token, count in Counter(tokens).items():
+        slot = slots.get(token)
+        if slot is None:
+            slot = slots[token] = _hash_token_slot(token, dim)
+        vec[slot[0]] += slot[1] * count
 
-    for token in tokens:
-        digest = hashlib.sha256(token.encode("utf-8")).digest()
-        index = int.from_bytes(digest[:4], "big") % dim
-        sign = 1.0 if digest[4] % 2 == 0 else -1.0
-        vec[index] += sign
+    # map(operator.mul) squares in C but sums in the same left-to-right order as before,
+    # so the norm (and every stored vector) stays bit-identical.
+    norm = math.sqrt(sum(map(operator.mul, vec, vec)))
+    return vec if norm == 0 else [v / norm for v in vec]
 
-    norm = math.sqrt(sum(v * v for v in vec))
-    if norm == 0:
-        return vec
-    return [v / norm for v in vec]
+
+def embed_texts(texts: list[str], dim: int) -> list[list[float]]:
+    """Hash-embed a batch of texts, hashing each distinct token only once per batch."""
+
+    slots: dict[str, tuple[int, float]] = {}
+    return [_hash_vector(_tokenize(text), dim, slots) for text in texts]
 
 
 def cosine_similarity(a: list[float], b: list[float]) -> float:
     if len(a) != len(b):
         raise ValueError("Vector dimensions do not match")
-    return float(sum(x * y for x, y in zip(a, b)))
+    return float(sum(map(operator.mul, a, b)))
+
+
+def sparse_terms(vector: list[float]) -> list[tuple[int, float]]:
+    """Return the (index, value) pairs of the non-zero components of ``vector``."""
+
+    return [(index, value) for index, value in enumerate(vector) if value]
+
+
+def sparse_dot(terms: list[tuple[int, float]], vector: list[float]) -> float:
+    """Dot product of a sparse vector (from ``sparse_terms``) with a dense one.
+
+    Skipped components are exact zeros, so this equals ``cosine_similarity`` against the
+    dense form while touching only the query's non-zero slots.
+    """
+
+    return float(sum(vector[index] * value for index, value in terms))
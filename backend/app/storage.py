@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 import logging
+import mmap
 from pathlib import Path
+from typing import Iterator
 from uuid import uuid4
 
 from app.config import Settings
@@ -116,3 +119,26 @@ def load_document_bytes(*, settings: Settings, storage_path: str) -> bytes:
         raise StorageError(f"Stored file not found at '{raw}'.")
     return path.read_bytes()
 
+
+
+@contextmanager
+def open_document_buffer(*, settings: Settings, storage_path: str) -> Iterator[bytes | mmap.mmap]:
+    """Yield a stored document's content, memory-mapping local files instead of reading a copy.
+
+    The mapping is read-only and only valid inside the ``with`` block; S3 objects are yielded as bytes.
+    """
+    raw = str(storage_path or "").strip()
+    if not raw or _is_s3_uri(raw):
+        yield load_document_bytes(settings=settings, storage_path=storage_path)
+        return
+
+    path = Path(raw)
+    if not path.exists():
+        raise StorageError(f"Stored file not found at '{raw}'.")
+    with path.open("rb") as handle:
+        if path.stat().st_size == 0:
+            # mmap cannot map an empty file.
+            yield b""
+            return
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
@@ -0,0 +1,120 @@
+import copy
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from app.config import settings
+from app.coverage import build_coverage_payload
+from app.drafting import build_draft_payload
+from app.requirements import extract_requirements_payload
+
+_SHM_ROOT = Path("/dev/shm")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # Import the app once up front so every xdist worker pays the FastAPI/router import before
+    # collection instead of inside the first test that touches it.
+    import app.main  # noqa: F401
+
+    config.addinivalue_line("markers", "needs_disk: keep storage_root under tmp_path for on-disk assertions")
+
+
+@pytest.fixture(scope="session")
+def shared_memory_database_url() -> Callable[[str], str]:
+    """Build a shared-cache in-memory SQLite URL for a test module, named per xdist worker.
+
+    Every connection in the worker sees the same RAM-backed database, so module/session app
+    lifespans skip the on-disk nebula.db and parallel workers never contend on one file.
+    """
+
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    return lambda name: f"sqlite:///file:nebula_{name}_{worker}?mode=memory&cache=shared"
+
+
+@pytest.fixture(autouse=True)
+def restore_settings():
+    """Snapshot the global settings and put every field back after each test."""
+
+    snapshot = settings.model_dump()
+    yield
+    for name, value in snapshot.items():
+        if getattr(settings, name) != value:
+            setattr(settings, name, value)
+
+
+@pytest.fixture()
+def fast_storage_dir(tmp_path: Path, request: pytest.FixtureRequest):
+    """Per-test upload directory on tmpfs when the host has one, otherwise under tmp_path.
+
+    Tests marked ``needs_disk`` assert on files next to ``storage_root`` and always get tmp_path.
+    """
+
+    if request.node.get_closest_marker("needs_disk") is None and os.access(_SHM_ROOT, os.W_OK):
+        shm_dir = Path(tempfile.mkdtemp(prefix="nebula-test-", dir=_SHM_ROOT))
+        try:
+            yield shm_dir
+        finally:
+            shutil.rmtree(shm_dir, ignore_errors=True)
+        return
+    yield tmp_path
+
+
+# Test inputs are deterministic, so identical chunk/requirement/draft inputs always build the
+# same payloads; memoize them for the whole worker and hand out deep copies.
+_PAYLOAD_CACHE: dict[bytes, dict[str, object]] = {}
+
+
+def _memoized_payload(kind: str, build: Callable[[], dict[str, object]], *inputs: object) -> dict[str, object]:
+    key = hashlib.blake2b(
+        json.dumps([kind, *inputs], sort_keys=True, default=str).encode("utf-8"), digest_size=16
+    ).digest()
+    payload = _PAYLOAD_CACHE.get(key)
+    if payload is None:
+        payload = _PAYLOAD_CACHE[key] = build()
+    return copy.deepcopy(payload)
+
+
+class FakeNovaOrchestrator:
+    def plan_section_generation(
+        self, section_key: str, requested_top_k: int, available_chunk_count: int
+    ) -> dict[str, object]:
+        bounded = max(1, min(requested_top_k, available_chunk_count))
+        return {
+            "retrieval_top_k": bounded,
+            "retry_on_missing_evidence": True,
+            "rationale": "default-plan",
+        }
+
+    def extract_requirements(self, chunks: list[dict[str, object]]) -> dict[str, object]:
+        return _memoized_payload("requirements", lambda: extract_requirements_payload(chunks), chunks)
+
+    def generate_section(
+        self,
+        section_key: str,
+        ranked_chunks: list[dict[str, object]],
+        *,
+        prompt_context: dict[str, str] | None = None,
+    ) -> dict[str, object]:
+        return _memoized_payload(
+            "draft", lambda: build_draft_payload(section_key, ranked_chunks), section_key, ranked_chunks
+        )
+
+    def compute_coverage(
+        self, requirements: dict[str, object], draft: dict[str, object]
+    ) -> dict[str, object]:
+        return _memoized_payload(
+            "coverage", lambda: build_coverage_payload(requirements, draft), requirements, draft
+        )
+
+
+@pytest.fixture(scope="session")
+def fake_nova_orchestrator() -> FakeNovaOrchestrator:
+    """Deterministic orchestrator backed by the local extract/draft/coverage builders."""
+
+    return FakeNovaOrchestrator()
@@ -154,6 +154,20 @@ def test_collect_run_metrics_fails_with_actionable_field_path(tmp_path: Path) ->
         module._collect_run_metrics(run_dir)
 
 
+def test_collect_run_metrics_reports_missing_artifact_files(tmp_path: Path) -> None:
+    module = _load_compute_module()
+    run_dir = _write_run_artifacts(tmp_path, "run-1")
+    (run_dir / "export.json").unlink()
+    (run_dir / "export.json").mkdir()
+
+    with pytest.raises(module.ArtifactValidationError, match="missing required artifact file 'export.json'"):
+        module._collect_run_metrics(run_dir)
+
+    (run_dir / "summary.txt").unlink()
+    with pytest.raises(module.ArtifactValidationError, match="missing required summary file 'summary.txt'"):
+        module._collect_run_metrics(run_dir)
+
+
 def test_compute_impact_baseline_script_writes_stable_schema(tmp_path: Path) -> None:
     _write_run_artifacts(tmp_path, "run-1")
 
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from app.coverage import normalize_coverage_payload
+import pytest
+
+from app.api.services.runtime import compute_validated_coverage_payload
+from app.config import settings
+from app.coverage import normalize_coverage_payload, split_locally_decided_coverage
 
 
 def test_normalize_coverage_payload_maps_text_attachment_to_canonical_id() -> None:
@@ -54,6 +58,20 @@ def test_normalize_coverage_payload_backfills_missing_requirements() -> None:
     assert by_id["A1"]["status"] == "missing"
 
 
+def test_normalize_coverage_payload_keeps_first_item_per_requirement() -> None:
+    requirements = {"questions": [{"id": "Q1", "prompt": "Need Statement"}]}
+    coverage_payload = {
+        "items": [
+            {"requirement_id": "Q1", "status": "partial", "notes": "First", "evidence_refs": []},
+            {"requirement_id": "Question 1", "status": "met", "notes": "Duplicate", "evidence_refs": []},
+        ]
+    }
+
+    normalized = normalize_coverage_payload(requirements=requirements, payload=coverage_payload)
+
+    assert [(item["requirement_id"], item["notes"]) for item in normalized["items"]] == [("Q1", "First")]
+
+
 def test_normalize_coverage_payload_maps_prefixed_ids_to_canonical_ids() -> None:
     requirements = {
         "questions": [
@@ -120,3 +138,91 @@ def test_normalize_coverage_payload_maps_original_solicitation_id_and_keeps_dual
     assert item["internal_id"] == "Q1"
     assert item["original_id"] == "REQ-101"
     assert item["status"] == "met"
+
+
+_PREFILTER_REQUIREMENTS = {
+    "questions": [
+        {"id": "Q1", "prompt": "Describe community need for youth employment"},
+        {"id": "Q2", "prompt": "Explain the evaluation plan and outcome metrics"},
+    ],
+    "required_attachments": [],
+}
+_PREFILTER_DRAFT = {
+    "paragraphs": [
+        {
+            "text": "We describe the community need for youth employment in the county.",
+            "citations": [{"doc_id": "evidence.txt", "page": 2, "snippet": "youth employment"}],
+        }
+    ]
+}
+
+
+def test_split_locally_decided_coverage_keeps_ambiguous_questions_for_review() -> None:
+    decided, review = split_locally_decided_coverage(_PREFILTER_REQUIREMENTS, _PREFILTER_DRAFT)
+
+    assert [(item["requirement_id"], item["status"]) for item in decided] == [("Q1", "met")]
+    assert decided[0]["evidence_refs"] == ["evidence.txt:p2"]
+    assert [question["id"] for question in review["questions"]] == ["Q2"]
+
+    decided, review = split_locally_decided_coverage(_PREFILTER_REQUIREMENTS, {"paragraphs": []})
+    assert [item["status"] for item in decided] == ["missing", "missing"]
+    assert review["questions"] == []
+
+
+def test_coverage_local_prefilter_sends_only_undecided_requirements_to_nova(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class CountingOrchestrator:
+        def __init__(self) -> None:
+            self.requirement_ids: list[list[str]] = []
+
+        def compute_coverage(self, requirements: dict[str, object], draft: dict[str, object]) -> dict[str, object]:
+            ids = [str(question["id"]) for question in requirements["questions"]]
+            self.requirement_ids.append(ids)
+            return {
+                "items": [
+                    {"requirement_id": requirement_id, "status": "partial", "notes": "Reviewed", "evidence_refs": []}
+                    for requirement_id in ids
+                ]
+            }
+
+    monkeypatch.setattr(settings, "coverage_local_prefilter", True)
+    orchestrator = CountingOrchestrator()
+    coverage, _, _ = compute_validated_coverage_payload(
+        requirements_payload=_PREFILTER_REQUIREMENTS,
+        draft_payload=_PREFILTER_DRAFT,
+        get_nova_orchestrator=lambda: orchestrator,
+    )
+    assert orchestrator.requirement_ids == [["Q2"]]
+    assert {item["requirement_id"]: item["status"] for item in coverage["items"]} == {"Q1": "met", "Q2": "partial"}
+
+    compute_validated_coverage_payload(
+        requirements_payload=_PREFILTER_REQUIREMENTS,
+        draft_payload={"paragraphs": []},
+        get_nova_orchestrator=lambda: orchestrator,
+    )
+    assert orchestrator.requirement_ids == [["Q2"]]
+
+
+def test_split_locally_decided_coverage_short_circuits_verbatim_attachments() -> None:
+    requirements = {**_PREFILTER_REQUIREMENTS, "required_attachments": ["Board roster", "Audited financials"]}
+    draft = {
+        "paragraphs": [
+            {
+                "text": "Our board roster and audited financials are attached for review.",
+                "citations": [{"doc_id": "evidence.txt", "page": 3, "snippet": "board roster"}],
+            }
+        ]
+    }
+
+    decided, review = split_locally_decided_coverage(requirements, draft)
+    attachments = [item for item in decided if str(item["requirement_id"]).startswith("A")]
+    assert [(item["requirement_id"], item["status"]) for item in attachments] == [("A1", "met"), ("A2", "met")]
+    assert attachments[0]["evidence_refs"] == ["evidence.txt:p3"]
+    assert review["required_attachments"] == []
+
+    # One attachment the draft does not name keeps the whole positional list for the model review.
+    partial_requirements = {**requirements, "required_attachments": ["Board roster", "Letters of support"]}
+    decided, review = split_locally_decided_coverage(partial_requirements, draft)
+    assert not [item for item in decided if str(item["requirement_id"]).startswith("A")]
+    assert review["required_attachments"] == ["Board roster", "Letters of support"]
@@ -0,0 +1,97 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from app.config import settings
+from app.db import _load_payload_json, create_chunks, create_document, create_project, get_conn, init_db, list_chunks
+from app.retrieval import cosine_similarity, embed_texts
+
+
+@pytest.mark.parametrize(
+    ("journal_mode", "synchronous", "expected_synchronous"),
+    [("wal", "normal", 1), ("memory", "off", 0)],
+)
+def test_sqlite_file_connections_apply_configured_pragmas(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    journal_mode: str,
+    synchronous: str,
+    expected_synchronous: int,
+) -> None:
+    monkeypatch.setattr(settings, "database_url", f"sqlite:///{tmp_path}/pragmas.db")
+    monkeypatch.setattr(settings, "sqlite_journal_mode", journal_mode)
+    monkeypatch.setattr(settings, "sqlite_synchronous", synchronous)
+    init_db()
+
+    with get_conn() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == journal_mode
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == expected_synchronous
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+
+
+def test_sqlite_rejects_unknown_journal_mode(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(settings, "database_url", f"sqlite:///{tmp_path}/pragmas.db")
+    monkeypatch.setattr(settings, "sqlite_journal_mode", "turbo")
+
+    with pytest.raises(RuntimeError, match="SQLITE_JOURNAL_MODE"):
+        init_db()
+
+
+def test_sqlite_memory_uri_reuses_one_shared_connection(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "database_url", "sqlite:///file:nebula_db_shared_conn?mode=memory&cache=shared")
+    init_db()
+
+    with get_conn() as first, get_conn() as second:
+        assert first is second
+        assert first.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+
+def test_int8_embedding_storage_round_trips_within_quantization_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "database_url", "sqlite:///file:nebula_db_int8_embeddings?mode=memory&cache=shared")
+    monkeypatch.setattr(settings, "embedding_storage", "int8")
+    init_db()
+
+    texts = ["Need statement for 1240 households.", "Program design timeline.", "Budget narrative and costs."]
+    vectors = embed_texts(texts, 32)
+    project_id = create_project("Quantized")["id"]
+    document_id = str(create_document(project_id, "rfp.txt", "text/plain", "rfp.txt", 10, "batch-1")["id"])
+    chunks = [
+        {"chunk_index": index, "page": 1, "text": text, "embedding": vector}
+        for index, (text, vector) in enumerate(zip(texts, vectors, strict=True))
+    ]
+    create_chunks(project_id, document_id, chunks, "batch-1")
+
+    with get_conn() as conn:
+        stored = conn.execute("SELECT embedding_json FROM chunks WHERE project_id = ?", (project_id,)).fetchone()[0]
+    assert stored.startswith('{"q8":')
+
+    restored = [chunk["embedding"] for chunk in list_chunks(project_id)]
+    for original, decoded in zip(vectors, restored, strict=True):
+        assert len(decoded) == len(original)
+        assert max(abs(a - b) for a, b in zip(original, decoded)) <= max(map(abs, original)) / 254 + 1e-12
+    query = vectors[0]
+    assert cosine_similarity(query, restored[0]) == pytest.approx(1.0, abs=0.01)
+    assert cosine_similarity(query, restored[0]) > max(cosine_similarity(query, vector) for vector in restored[1:])
+
+
+def test_unknown_embedding_storage_is_rejected(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app.db import _encode_embedding
+
+    monkeypatch.setattr(settings, "embedding_storage", "float16")
+
+    with pytest.raises(RuntimeError, match="EMBEDDING_STORAGE"):
+        _encode_embedding([0.5, -0.5])
+
+
+def test_payload_json_decoding_matches_stdlib_for_edge_values() -> None:
+    payload = {"count": 2**70, "small": -(2**63), "ratio": float("nan"), "text": "café \ud800", "nested": [1.5, None]}
+    raw = json.dumps(payload)
+
+    decoded = _load_payload_json(raw)
+
+    assert decoded["count"] == 2**70 and isinstance(decoded["count"], int)
+    assert decoded["small"] == -(2**63)
+    assert decoded["ratio"] != decoded["ratio"]
+    assert decoded["text"] == payload["text"]
+    assert _load_payload_json('{"a": [1, 2.5, "x"]}') == json.loads('{"a": [1, 2.5, "x"]}')
@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+from pathlib import Path
+
+import pytest
+
+from app.api.services.exporting import write_markdown_export_files
+from app.config import settings
 from app.export_bundle import build_export_bundle
 
 
@@ -384,3 +390,22 @@ def test_build_export_bundle_preserves_internal_and_original_requirement_ids() -
     requirements_md = next(file for file in files if file["path"] in {"REQUIREMENTS_MATRIX.md", "requirements.md"})
     assert "| internal_id | original_id | requirement | status | notes |" in requirements_md["content"]
     assert "| Q1 | REQ-101 | Need Statement (350 words max): Describe need." in requirements_md["content"]
+
+
+def test_write_markdown_export_files_writes_utf8_bytes_verbatim(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "storage_root", str(tmp_path / "uploads"))
+    content = "# Draft Application\n\nR\u00e9sum\u00e9 of outcomes \u2014 line one\nline two\n"
+
+    written = write_markdown_export_files(
+        "project-123",
+        [
+            {"path": "../drafts/draft.md", "content": content},
+            {"path": "empty.md", "content": ""},
+        ],
+    )
+
+    assert written == ["drafts/draft.md"]
+    destination = tmp_path / "exports" / "project-123" / "drafts" / "draft.md"
+    assert destination.read_bytes() == content.encode("utf-8")
@@ -1,15 +1,105 @@
+import asyncio
+import json
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from io import BytesIO
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
+from app import main as app_module
 from app.config import settings
 from app.coverage import build_coverage_payload
+from app.db import create_projects
 from app.drafting import build_draft_payload
 from app.main import app
 from app.requirements import extract_requirements_payload
 
+# Shared upload fixtures. Reusing identical bytes across tests lets the content-hash chunk
+# cache in app.retrieval serve repeat uploads without re-embedding.
+RFP_TEXT = b"""
+Funder: City Community Fund
+Question 1: Need Statement (300 words max): Describe the local need.
+Question 2: Program Design (400 words max): Explain activities and timeline.
+"""
+EVIDENCE_TEXT = b"""
+Need Statement evidence: 1240 households served in 2024.
+Program Design evidence: monthly coaching, employer partnerships, quarterly milestones.
+"""
+COVERAGE_RFP_TEXT = b"""
+Funder: City Community Fund
+Question 1: Describe program outcomes. Limit 250 words.
+Question 2: Explain implementation timeline. Limit 500 words.
+"""
+COVERAGE_SOURCE_TEXT = b"""
+Need Statement: We served 1240 households in 2024 with emergency housing support.
+Our implementation timeline spans four quarters with milestones.
+"""
+PILOT_TEXT = (
+    b"Need Statement evidence paragraph one. "
+    b"Need Statement evidence paragraph two with additional support. "
+    b"Need Statement evidence paragraph three for refinement."
+)
+DRIFT_SOURCE_TEXT = b"""
+Question 1: Describe the need statement.
+Need Statement evidence with outcomes and household counts.
+Households received rent support.
+"""
+FULL_RFP_TEXT = b"""
+Funder: City Community Fund
+Deadline: March 30, 2026
+
+Eligibility:
+- Eligible applicants must be registered nonprofits.
+
+Question 1: Describe program outcomes. Limit 250 words.
+Question 2: Provide implementation timeline. Limit 1200 characters.
+
+Required Attachments:
+- Attachment A: Budget Narrative
+- Attachment B: Board List
+
+Rubric:
+- Scoring criteria include impact and feasibility.
+
+Disallowed costs:
+- Alcohol purchases are not allowed costs.
+"""
+DRAFTING_SOURCE_TEXT = b"""
+Question 1: Describe the organization need statement.
+We served 1240 households with emergency support in 2024.
+Our outcomes improved housing stability for low-income families.
+"""
+AMBIGUOUS_RFP_A_TEXT = b"""
+Funding Opportunity: City Community Fund
+Required Narrative Questions:
+Question 1: Need Statement (300 words max): Describe need.
+"""
+AMBIGUOUS_RFP_B_TEXT = b"""
+Funding Opportunity: County Community Fund
+Required Narrative Questions:
+Question 1: Need Statement (300 words max): Describe need.
+"""
+CONTEXT_BRIEF_RFP_TEXT = b"""
+Question 1: Need Statement (300 words max): Describe the local need.
+"""
+CONTEXT_BRIEF_EVIDENCE_TEXT = b"""
+Need Statement evidence: 1240 households served in 2024.
+"""
+
+# Request bodies reused verbatim across tests, encoded once instead of per request.
+JSON_HEADERS = {"content-type": "application/json"}
+NEED_STATEMENT_BODY = json.dumps({"section_key": "Need Statement"}).encode("utf-8")
+LEGACYTERM_QUERY_BODY = json.dumps({"query": "legacyterm", "top_k": 3}).encode("utf-8")
+OLD_TERM_FILE = ("old.txt", b"legacyterm legacyterm legacyterm", "text/plain")
+NEW_TERM_FILE = ("new.txt", b"newterm newterm newterm", "text/plain")
+
+# /health touches neither the database nor storage, so it is served without running the app lifespan.
+_LIFESPANLESS_CLIENT = TestClient(app)
+
 
 def _build_pdf_bytes(text: str) -> bytes:
     from pypdf import PdfWriter
@@ -60,177 +150,217 @@ def _build_rtf_bytes(line: str) -> bytes:
     ).encode("utf-8")
 
 
-@pytest.fixture(autouse=True)
-def mock_nova_orchestrator(monkeypatch: pytest.MonkeyPatch):
-    class FakeNovaOrchestrator:
-        def plan_section_generation(
-            self, section_key: str, requested_top_k: int, available_chunk_count: int
-        ) -> dict[str, object]:
-            bounded = max(1, min(requested_top_k, available_chunk_count))
-            return {
-                "retrieval_top_k": bounded,
-                "retry_on_missing_evidence": True,
-                "rationale": "default-plan",
-            }
+def _upload_files(
+    client: TestClient, project_id: str, *files: tuple[str, bytes, str], prefix: str = ""
+) -> httpx.Response:
+    """Send every file in one multipart upload request (one batch, one round-trip)."""
 
-        def extract_requirements(self, chunks: list[dict[str, object]]) -> dict[str, object]:
-            return extract_requirements_payload(chunks)
+    return client.post(f"{prefix}/projects/{project_id}/upload", files=[("files", item) for item in files])
 
-        def generate_section(
-            self,
-            section_key: str,
-            ranked_chunks: list[dict[str, object]],
-            *,
-            prompt_context: dict[str, str] | None = None,
-        ) -> dict[str, object]:
-            return build_draft_payload(section_key, ranked_chunks)
 
-        def compute_coverage(
-            self, requirements: dict[str, object], draft: dict[str, object]
-        ) -> dict[str, object]:
-            return build_coverage_payload(requirements, draft)
+def _upload_two_batches(
+    client: TestClient, project_name: str, older: tuple[str, bytes, str], newer: tuple[str, bytes, str]
+) -> tuple[str, str]:
+    """Create a project with two upload batches; only batch-scope tests need the second round-trip."""
 
-    monkeypatch.setattr("app.main.get_nova_orchestrator", lambda: FakeNovaOrchestrator())
+    project_id = client.post("/projects", json={"name": project_name}).json()["id"]
+    assert _upload_files(client, project_id, older).status_code == 200
+    newer_upload = _upload_files(client, project_id, newer)
+    assert newer_upload.status_code == 200
+    return project_id, str(newer_upload.json()["upload_batch_id"])
 
 
-def test_health_endpoint() -> None:
-    with TestClient(app) as client:
-        response = client.get("/health")
-        assert response.status_code == 200
-        assert response.json()["status"] == "ok"
+@pytest.fixture(scope="module", autouse=True)
+def mock_nova_orchestrator(fake_nova_orchestrator: object):
+    # Installed once per module; tests that need a different orchestrator override it with their own
+    # monkeypatch, which restores this fake on teardown.
+    with pytest.MonkeyPatch.context() as module_patch:
+        module_patch.setattr(app_module, "get_nova_orchestrator", lambda: fake_nova_orchestrator)
+        yield
 
 
-def test_api_health_endpoint_alias() -> None:
-    with TestClient(app) as client:
-        response = client.get("/api/health")
-        assert response.status_code == 200
-        assert response.json()["status"] == "ok"
-
-
-def test_ready_endpoint() -> None:
-    with TestClient(app) as client:
-        response = client.get("/ready")
-        assert response.status_code == 200
-        payload = response.json()
-        assert payload["status"] == "ready"
-        assert payload["checks"]["db"]["ok"] is True
-        assert payload["checks"]["storage"]["ok"] is True
-
-
-def test_api_ready_endpoint_alias() -> None:
-    with TestClient(app) as client:
-        response = client.get("/api/ready")
-        assert response.status_code == 200
-        payload = response.json()
-        assert payload["status"] == "ready"
-        assert payload["checks"]["db"]["ok"] is True
-        assert payload["checks"]["storage"]["ok"] is True
-
-
-def test_create_project_and_upload(tmp_path: Path) -> None:
-    settings.database_url = f"sqlite:///{tmp_path}/test.db"
-    settings.storage_root = str(tmp_path / "uploads")
-    settings.chunk_size_chars = 40
-    settings.chunk_overlap_chars = 10
-    settings.embedding_dim = 64
-
-    with TestClient(app) as scoped_client:
-        project_response = scoped_client.post("/projects", json={"name": "Sample Grant"})
-        assert project_response.status_code == 200
-        project_id = project_response.json()["id"]
-
-        upload_response = scoped_client.post(
-            f"/projects/{project_id}/upload",
-            files=[("files", ("rfp.txt", b"RFP content", "text/plain"))],
-        )
-        assert upload_response.status_code == 200
-        payload = upload_response.json()
-        assert payload["project_id"] == project_id
-        assert len(payload["documents"]) == 1
-        assert payload["documents"][0]["file_name"] == "rfp.txt"
-        assert "storage_path" not in payload["documents"][0]
-        assert payload["documents"][0]["chunks_indexed"] >= 1
-        assert payload["documents"][0]["parse_report"]["quality"] in {"good", "low", "none"}
-        assert payload["parse_report"]["documents_total"] == 1
-
-        list_response = scoped_client.get(f"/projects/{project_id}/documents")
-        assert list_response.status_code == 200
-        assert len(list_response.json()["documents"]) == 1
-        assert "storage_path" not in list_response.json()["documents"][0]
-
-
-def test_api_prefix_routes_match_root_routes_for_project_and_pipeline(tmp_path: Path) -> None:
-    settings.database_url = f"sqlite:///{tmp_path}/test.db"
-    settings.storage_root = str(tmp_path / "uploads")
-    settings.chunk_size_chars = 200
-    settings.chunk_overlap_chars = 40
-    settings.embedding_dim = 64
-
-    rfp_text = b"""
-Question 1: Need Statement (300 words max): Describe the local need.
-Question 2: Program Design (400 words max): Explain activities and timeline.
-"""
-    evidence_text = b"""
-Need Statement evidence: 1240 households served in 2024.
-Program Design evidence: monthly coaching, employer partnerships, quarterly milestones.
-"""
+@contextmanager
+def override_settings(**overrides: object) -> Iterator[None]:
+    """Apply several settings at once and restore exactly those fields on exit."""
 
-    with TestClient(app) as client:
-        project_response = client.post("/api/projects", json={"name": "API Prefix Routing"})
-        assert project_response.status_code == 200
-        project_id = project_response.json()["id"]
-
-        upload_response = client.post(
-            f"/api/projects/{project_id}/upload",
-            files=[
-                ("files", ("rfp.txt", rfp_text, "text/plain")),
-                ("files", ("evidence.txt", evidence_text, "text/plain")),
-            ],
+    previous = {name: getattr(settings, name) for name in overrides}
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            setattr(settings, name, value)
+
+
+@pytest.fixture()
+def nebula_settings(
+    fast_storage_dir: Path,
+    request: pytest.FixtureRequest,
+    shared_memory_database_url: Callable[[str], str],
+) -> Iterator[None]:
+    chunk_size, chunk_overlap, embedding_dim = getattr(request, "param", (220, 40, 16))
+    with override_settings(
+        database_url=shared_memory_database_url("health"),
+        storage_root=str(fast_storage_dir / "uploads"),
+        chunk_size_chars=chunk_size,
+        chunk_overlap_chars=chunk_overlap,
+        embedding_dim=embedding_dim,
+    ):
+        yield
+
+
+@pytest.fixture(scope="session")
+def client(tmp_path_factory: pytest.TempPathFactory, shared_memory_database_url: Callable[[str], str]):
+    # One app startup for the whole session; per-test config goes through `settings`,
+    # which the running app reads on every request.
+    storage_root = str(tmp_path_factory.mktemp("session") / "uploads")
+    with override_settings(database_url=shared_memory_database_url("health"), storage_root=storage_root):
+        with TestClient(app) as session_client:
+            yield session_client
+
+
+@pytest.fixture(scope="module")
+def seeded_project(client: TestClient) -> tuple[str, str]:
+    """Upload and extract the shared coverage RFP once; returns (project_id, requirements_artifact_id).
+
+    Coverage and export tests only add draft/coverage artifacts on top, so they can share this baseline.
+    """
+
+    with override_settings(chunk_size_chars=220, chunk_overlap_chars=40, embedding_dim=16):
+        project_id = client.post("/projects", json={"name": "Seeded Coverage"}).json()["id"]
+        upload = _upload_files(
+            client,
+            project_id,
+            ("rfp.txt", COVERAGE_RFP_TEXT, "text/plain"),
+            ("impact.txt", COVERAGE_SOURCE_TEXT, "text/plain"),
         )
-        assert upload_response.status_code == 200
-        assert upload_response.json()["project_id"] == project_id
+        assert upload.status_code == 200
+        extract = client.post(f"/projects/{project_id}/extract-requirements")
+        assert extract.status_code == 200
+    return project_id, str(extract.json()["artifact"]["id"])
 
-        run_response = client.post(
-            f"/api/projects/{project_id}/generate-full-draft?profile=submission",
-            json={"top_k": 4, "max_revision_rounds": 1},
-        )
-        assert run_response.status_code == 200
-        payload = run_response.json()
-        assert payload["project_id"] == project_id
-        assert payload["run_summary"]["status"] == "complete"
 
+@pytest.fixture()
+def anyio_backend() -> str:
+    return "asyncio"
 
-def test_upload_parse_report_marks_unsupported_file_types(tmp_path: Path) -> None:
-    settings.database_url = f"sqlite:///{tmp_path}/test.db"
-    settings.storage_root = str(tmp_path / "uploads")
-    settings.chunk_size_chars = 40
-    settings.chunk_overlap_chars = 10
-    settings.embedding_dim = 64
 
-    with TestClient(app) as client:
-        project_id = client.post("/projects", json={"name": "Parse Report"}).json()["id"]
+@pytest.fixture()
+async def async_client(client: TestClient) -> AsyncIterator[httpx.AsyncClient]:
+    # Depends on the session client so lifespan startup (init_db) has already run; requests
+    # then go straight into the ASGI app without TestClient's thread-portal hop.
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http_client:
+        yield http_client
 
-        upload_response = client.post(
-            f"/projects/{project_id}/upload",
-            files=[("files", ("scan.bin", b"\x00\x01\x02\x03binary", "application/octet-stream"))],
-        )
-        assert upload_response.status_code == 200
-        payload = upload_response.json()
-        document = payload["documents"][0]
-        report = document["parse_report"]
-        assert report["quality"] == "none"
-        assert report["reason"] == "unsupported_file_type"
-        assert report["parser_id"] == "none"
-        assert report["chunks_indexed"] == 0
-
-
-def test_upload_parses_pdf_docx_and_rtf_documents(tmp_path: Path) -> None:
-    settings.database_url = f"sqlite:///{tmp_path}/test.db"
-    settings.storage_root = str(tmp_path / "uploads")
-    settings.chunk_size_chars = 80
-    settings.chunk_overlap_chars = 20
-    settings.embedding_dim = 64
 
+def test_health_endpoint() -> None:
+    response = _LIFESPANLESS_CLIENT.get("/health")
+    assert response.status_code == 200
+    assert response.json()["status"] == "ok"
+
+
+def test_api_health_endpoint_alias() -> None:
+    response = _LIFESPANLESS_CLIENT.get("/api/health")
+    assert response.status_code == 200
+    assert response.json()["status"] == "ok"
+
+
+@pytest.mark.anyio
+async def test_ready_endpoint(async_client: httpx.AsyncClient) -> None:
+    response = await async_client.get("/ready")
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["status"] == "ready"
+    assert payload["checks"]["db"]["ok"] is True
+    assert payload["checks"]["storage"]["ok"] is True
+
+
+@pytest.mark.anyio
+async def test_api_ready_endpoint_alias(async_client: httpx.AsyncClient) -> None:
+    response = await async_client.get("/api/ready")
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["status"] == "ready"
+    assert payload["checks"]["db"]["ok"] is True
+    assert payload["checks"]["storage"]["ok"] is True
+
+
+@pytest.mark.parametrize("nebula_settings", [(40, 10, 16)], indirect=True)
+def test_create_project_and_upload(nebula_settings: None, client: TestClient) -> None:
+    project_response = client.post("/projects", json={"name": "Sample Grant"})
+    assert project_response.status_code == 200
+    project_id = project_response.json()["id"]
+
+    upload_response = client.post(
+        f"/projects/{project_id}/upload",
+        files=[("files", ("rfp.txt", b"RFP content", "text/plain"))],
+    )
+    assert upload_response.status_code == 200
+    payload = upload_response.json()
+    assert payload["project_id"] == project_id
+    assert len(payload["documents"]) == 1
+    assert payload["documents"][0]["file_name"] == "rfp.txt"
+    assert "storage_path" not in payload["documents"][0]
+    assert payload["documents"][0]["chunks_indexed"] >= 1
+    assert payload["documents"][0]["parse_report"]["quality"] in {"good", "low", "none"}
+    assert payload["parse_report"]["documents_total"] == 1
+
+    list_response = client.get(f"/projects/{project_id}/documents")
+    assert list_response.status_code == 200
+    assert len(list_response.json()["documents"]) == 1
+    assert "storage_path" not in list_response.json()["documents"][0]
+
+
+@pytest.mark.parametrize("nebula_settings", [(200, 40, 16)], indirect=True)
+def test_api_prefix_routes_match_root_routes_for_project_and_pipeline(
+    nebula_settings: None, client: TestClient
+) -> None:
+    project_response = client.post("/api/projects", json={"name": "API Prefix Routing"})
+    assert project_response.status_code == 200
+    project_id = project_response.json()["id"]
+
+    upload_response = _upload_files(
+        client,
+        project_id,
+        ("rfp.txt", RFP_TEXT, "text/plain"),
+        ("evidence.txt", EVIDENCE_TEXT, "text/plain"),
+        prefix="/api",
+    )
+    assert upload_response.status_code == 200
+    assert upload_response.json()["project_id"] == project_id
+
+    run_response = client.post(
+        f"/api/projects/{project_id}/generate-full-draft?profile=submission",
+        json={"top_k": 4, "max_revision_rounds": 1},
+    )
+    assert run_response.status_code == 200
+    payload = run_response.json()
+    assert payload["project_id"] == project_id
+    assert payload["run_summary"]["status"] == "complete"
+
+
+@pytest.mark.parametrize("nebula_settings", [(40, 10, 16)], indirect=True)
+def test_upload_parse_report_marks_unsupported_file_types(nebula_settings: None, client: TestClient) -> None:
+    project_id = client.post("/projects", json={"name": "Parse Report"}).json()["id"]
+
+    upload_response = client.post(
+        f"/projects/{project_id}/upload",
+        files=[("files", ("scan.bin", b"\x00\x01\x02\x03binary", "application/octet-stream"))],
+    )
+    assert upload_response.status_code == 200
+    payload = upload_response.json()
+    document = payload["documents"][0]
+    report = document["parse_report"]
+    assert report["quality"] == "none"
+    assert report["reason"] == "unsupported_file_type"
+    assert report["parser_id"] == "none"
+    assert report["chunks_indexed"] == 0
+
+
+@pytest.mark.parametrize("nebula_settings", [(80, 20, 16)], indirect=True)
+def test_upload_parses_pdf_docx_and_rtf_documents(nebula_settings: None, client: TestClient) -> None:
     pdf_bytes = _build_pdf_bytes("Grant need statement with citation-ready outcomes.")
     docx_bytes = _build_docx_bytes(
         [
@@ -240,564 +370,383 @@ def test_upload_parses_pdf_docx_and_rtf_documents(tmp_path: Path) -> None:
     )
     rtf_bytes = _build_rtf_bytes("Attachment narrative with budget justification.")
 
-    with TestClient(app) as client:
-        project_id = client.post("/projects", json={"name": "Parser Registry"}).json()["id"]
-        upload_response = client.post(
-            f"/projects/{project_id}/upload",
-            files=[
-                ("files", ("sample.pdf", pdf_bytes, "application/pdf")),
-                (
-                    "files",
-                    (
-                        "sample.docx",
-                        docx_bytes,
-                        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                    ),
-                ),
-                ("files", ("sample.rtf", rtf_bytes, "application/rtf")),
-            ],
-        )
-        assert upload_response.status_code == 200
-        payload = upload_response.json()
-        assert payload["parse_report"]["documents_total"] == 3
-        assert payload["parse_report"]["quality_counts"]["none"] == 0
-
-        by_name = {document["file_name"]: document for document in payload["documents"]}
-        assert by_name["sample.pdf"]["parse_report"]["parser_id"] == "pdf"
-        assert by_name["sample.docx"]["parse_report"]["parser_id"] == "docx"
-        assert by_name["sample.rtf"]["parse_report"]["parser_id"] == "rtf"
-
-        for file_name in ("sample.pdf", "sample.docx", "sample.rtf"):
-            report = by_name[file_name]["parse_report"]
-            assert report["quality"] in {"good", "low"}
-            assert report["reason"] in {"ok", "low_extracted_text", "low_text_density"}
-            assert report["chars_extracted"] > 0
-            assert report["pages_extracted"] >= 1
-            assert by_name[file_name]["chunks_indexed"] >= 1
-
-
-def test_upload_parse_report_marks_malformed_pdf_as_parser_error(tmp_path: Path) -> None:
-    settings.database_url = f"sqlite:///{tmp_path}/test.db"
-    settings.storage_root = str(tmp_path / "uploads")
-    settings.chunk_size_chars = 80
-    settings.chunk_overlap_chars = 20
-    settings.embedding_dim = 64
-
-    with TestClient(app) as client:
-        project_id = client.post("/projects", json={"name": "Malformed PDF"}).json()["id"]
-        upload_response = client.post(
-            f"/projects/{project_id}/upload",
-            files=[("files", ("broken.pdf", b"%PDF-1.7\nbad-pdf", "application/pdf"))],
-        )
-
-        assert upload_response.status_code == 200
-        payload = upload_response.json()
-        report = payload["documents"][0]["parse_report"]
-        assert report["parser_id"] == "pdf"
-        assert report["quality"] == "none"
-        assert report["reason"] == "parser_error"
-        assert report["chunks_indexed"] == 0
-        assert report["parser_error"]
+    project_id = client.post("/projects", json={"name": "Parser Registry"}).json()["id"]
+    upload_response = _upload_files(
+        client,
+        project_id,
+        ("sample.pdf", pdf_bytes, "application/pdf"),
+        ("sample.docx", docx_bytes, "application/vnd.openxmlformats-officedocument.wordprocessingml.document"),
+        ("sample.rtf", rtf_bytes, "application/rtf"),
+    )
+    assert upload_response.status_code == 200
+    payload = upload_response.json()
+    assert payload["parse_report"]["documents_total"] == 3
+    assert payload["parse_report"]["quality_counts"]["none"] == 0
+
+    by_name = {document["file_name"]: document for document in payload["documents"]}
+    assert by_name["sample.pdf"]["parse_report"]["parser_id"] == "pdf"
+    assert by_name["sample.docx"]["parse_report"]["parser_id"] == "docx"
+    assert by_name["sample.rtf"]["parse_report"]["parser_id"] == "rtf"
+
+    for file_name in ("sample.pdf", "sample.docx", "sample.rtf"):
+        report = by_name[file_name]["parse_report"]
+        assert report["quality"] in {"good", "low"}
+        assert report["reason"] in {"ok", "low_extracted_text", "low_text_density"}
+        assert report["chars_extracted"] > 0
+        assert report["pages_extracted"] >= 1
+        assert by_name[file_name]["chunks_indexed"] >= 1
+
+
+@pytest.mark.parametrize("nebula_settings", [(80, 20, 16)], indirect=True)
+def test_upload_parse_report_marks_malformed_pdf_as_parser_error(nebula_settings: None, client: TestClient) -> None:
+    project_id = client.post("/projects", json={"name": "Malformed PDF"}).json()["id"]
+    upload_response = client.post(
+        f"/projects/{project_id}/upload",
+        files=[("files", ("broken.pdf", b"%PDF-1.7\nbad-pdf", "application/pdf"))],
+    )
 
+    assert upload_response.status_code == 200
+    payload = upload_response.json()
+    report = payload["documents"][0]["parse_report"]
+    assert report["parser_id"] == "pdf"
+    assert report["quality"] == "none"
+    assert report["reason"] == "parser_error"
+    assert report["chunks_indexed"] == 0
+    assert report["parser_error"]
 
-def test_upload_rejects_oversized_file(tmp_path: Path) -> None:
-    settings.database_url = f"sqlite:///{tmp_path}/test.db"
-    settings.storage_root = str(tmp_path / "uploads")
-    previous_limit = settings.max_upload_file_bytes
-    settings.max_upload_file_bytes = 8
 
-    try:
-        with TestClient(app) as client:
-            project_id = client.post("/projects", json={"name": "Upload Limits"}).json()["id"]
-            upload_response = client.post(
-                f"/projects/{project_id}/upload",
-                files=[("files", ("too-large.txt", b"123456789", "text/plain"))],
-            )
-            assert upload_response.status_code == 413
-            assert "exceeds max size" in str(upload_response.json()["detail"])
-    finally:
-        settings.max_upload_file_bytes = previous_limit
+def test_upload_rejects_oversized_file(
+    monkeypatch: pytest.MonkeyPatch, nebula_settings: None, client: TestClient
+) -> None:
+    monkeypatch.setattr(settings, "max_upload_file_bytes", 8)
 
+    project_id = client.post("/projects", json={"name": "Upload Limits"}).json()["id"]
+    upload_response = client.post(
+        f"/projects/{project_id}/upload",
+        files=[("files", ("too-large.txt", b"123456789", "text/plain"))],
+    )
+    assert upload_response.status_code == 413
+    assert "exceeds max size" in str(upload_response.json()["detail"])
 
-def test_retrieve_is_project_scoped(tmp_path: Path) -> None:
-    settings.database_url = f"sqlite:///{tmp_path}/test.db"
-    settings.storage_root = str(tmp_path / "uploads")
-    settings.chunk_size_chars = 80
-    settings.chunk_overlap_chars = 20
-    settings.embedding_dim = 64
 
-    with TestClient(app) as client:
-        project_a = client.post("/projects", json={"name": "Project A"}).json()["id"]
-        project_b = client.post("/projects", json={"name": "Project B"}).json()["id"]
+@pytest.mark.parametrize("nebula_settings", [(80, 20, 16)], indirect=True)
+@pytest.mark.anyio
+async def test_retrieve_is_project_scoped(nebula_settings: None, async_client: httpx.AsyncClient) -> None:
+    project_a, project_b = (project["id"] for project in create_projects(["Project A", "Project B"]))
 
-        upload_a = client.post(
+    # The two projects share no rows, so their uploads are sent concurrently.
+    upload_a, upload_b = await asyncio.gather(
+        async_client.post(
             f"/projects/{project_a}/upload",
-            files=[
-                (
-                    "files",
-                    (
-                        "impact.txt",
-                        b"We served 1240 households with rent support in 2024.",
-                        "text/plain",
-                    ),
-                )
-            ],
-        )
-        assert upload_a.status_code == 200
-
-        upload_b = client.post(
+            files=[("files", ("impact.txt", b"We served 1240 households with rent support in 2024.", "text/plain"))],
+        ),
+        async_client.post(
             f"/projects/{project_b}/upload",
-            files=[
-                (
-                    "files",
-                    (
-                        "other.txt",
-                        b"This document is about tree planting metrics.",
-                        "text/plain",
-                    ),
-                )
-            ],
-        )
-        assert upload_b.status_code == 200
-
-        result = client.post(
-            f"/projects/{project_a}/retrieve",
-            json={"query": "households rent support", "top_k": 3},
-        )
-        assert result.status_code == 200
-        payload = result.json()
-        assert payload["project_id"] == project_a
-        assert len(payload["results"]) >= 1
-        top = payload["results"][0]
-        assert top["file_name"] == "impact.txt"
-
-
-def test_retrieve_defaults_to_latest_upload_batch(tmp_path: Path) -> None:
-    settings.database_url = f"sqlite:///{tmp_path}/test.db"
-    settings.storage_root = str(tmp_path / "uploads")
-    settings.chunk_size_chars = 80
-    settings.chunk_overlap_chars = 20
-    settings.embedding_dim = 64
+            files=[("files", ("other.txt", b"This document is about tree planting metrics.", "text/plain"))],
+        ),
+    )
+    assert upload_a.status_code == 200
+    assert upload_b.status_code == 200
 
-    with TestClient(app) as client:
-        project_id = client.post("/projects", json={"name": "Batch Scope"}).json()["id"]
+    result = await async_client.post(
+        f"/projects/{project_a}/retrieve",
+        json={"query": "households rent support", "top_k": 3},
+    )
+    assert result.status_code == 200
+    payload = result.json()
+    assert payload["project_id"] == project_a
+    assert len(payload["results"]) >= 1
+    top = payload["results"][0]
+    assert top["file_name"] == "impact.txt"
+
+
+@pytest.mark.parametrize("nebula_settings", [(80, 20, 16)], indirect=True)
+def test_retrieve_defaults_to_latest_upload_batch(nebula_settings: None, client: TestClient) -> None:
+    project_id, second_batch_id = _upload_two_batches(client, "Batch Scope", OLD_TERM_FILE, NEW_TERM_FILE)
+
+    latest_scoped = client.post(
+        f"/projects/{project_id}/retrieve",
+        content=LEGACYTERM_QUERY_BODY,
+        headers=JSON_HEADERS,
+    )
+    assert latest_scoped.status_code == 200
+    latest_payload = latest_scoped.json()
+    assert latest_payload["upload_batch_id"] == second_batch_id
+    assert len(latest_payload["results"]) >= 1
+    assert latest_payload["results"][0]["file_name"] == "new.txt"
+
+    all_scoped = client.post(
+        f"/projects/{project_id}/retrieve?document_scope=all",
+        content=LEGACYTERM_QUERY_BODY,
+        headers=JSON_HEADERS,
+    )
+    assert all_scoped.status_code == 200
+    all_payload = all_scoped.json()
+    assert all_payload["upload_batch_id"] is None
+    assert len(all_payload["results"]) >= 1
+    assert all_payload["results"][0]["file_name"] == "old.txt"
 
-        first_upload = client.post(
-            f"/projects/{project_id}/upload",
-            files=[("files", ("old.txt", b"legacyterm legacyterm legacyterm", "text/plain"))],
-        )
-        assert first_upload.status_code == 200
 
-        second_upload = client.post(
-            f"/projects/{project_id}/upload",
-            files=[("files", ("new.txt", b"newterm newterm newterm", "text/plain"))],
-        )
-        assert second_upload.status_code == 200
-        second_batch_id = second_upload.json()["upload_batch_id"]
+@pytest.mark.parametrize("nebula_settings", [(80, 20, 16)], indirect=True)
+def test_reindex_defaults_to_latest_upload_batch(
+    monkeypatch: pytest.MonkeyPatch, nebula_settings: None, client: TestClient
+) -> None:
+    monkeypatch.setattr(settings, "embedding_mode", "hash")
 
-        latest_scoped = client.post(
-            f"/projects/{project_id}/retrieve",
-            json={"query": "legacyterm", "top_k": 3},
-        )
-        assert latest_scoped.status_code == 200
-        latest_payload = latest_scoped.json()
-        assert latest_payload["upload_batch_id"] == second_batch_id
-        assert len(latest_payload["results"]) >= 1
-        assert latest_payload["results"][0]["file_name"] == "new.txt"
-
-        all_scoped = client.post(
-            f"/projects/{project_id}/retrieve?document_scope=all",
-            json={"query": "legacyterm", "top_k": 3},
-        )
-        assert all_scoped.status_code == 200
-        all_payload = all_scoped.json()
-        assert all_payload["upload_batch_id"] is None
-        assert len(all_payload["results"]) >= 1
-        assert all_payload["results"][0]["file_name"] == "old.txt"
-
-
-def test_reindex_defaults_to_latest_upload_batch(tmp_path: Path) -> None:
-    settings.database_url = f"sqlite:///{tmp_path}/test.db"
-    settings.storage_root = str(tmp_path / "uploads")
-    settings.chunk_size_chars = 80
-    settings.chunk_overlap_chars = 20
-    settings.embedding_dim = 64
-    settings.embedding_mode = "hash"
-
-    with TestClient(app) as client:
-        project_id = client.post("/projects", json={"name": "Reindex Batch Scope"}).json()["id"]
-
-        first_upload = client.post(
-            f"/projects/{project_id}/upload",
-            files=[("files", ("old.txt", b"legacyterm legacyterm legacyterm", "text/plain"))],
-        )
-        assert first_upload.status_code == 200
+    project_id, second_batch_id = _upload_two_batches(
+        client, "Reindex Batch Scope", OLD_TERM_FILE, NEW_TERM_FILE
+    )
 
-        second_upload = client.post(
-            f"/projects/{project_id}/upload",
-            files=[("files", ("new.txt", b"newterm newterm newterm", "text/plain"))],
-        )
-        assert second_upload.status_code == 200
-        second_batch_id = second_upload.json()["upload_batch_id"]
-
-        reindex = client.post(f"/projects/{project_id}/reindex")
-        assert reindex.status_code == 200
-        payload = reindex.json()
-        assert payload["upload_batch_id"] == second_batch_id
-        assert payload["chunks_deleted"] >= 1
-        assert payload["chunks_indexed"] >= 1
-        assert payload["embedding"]["mode"] == "hash"
-        assert payload["documents"][0]["parse_report"]["embedding_providers"]["hash"] >= 1
-
-        latest_scoped = client.post(
-            f"/projects/{project_id}/retrieve",
-            json={"query": "legacyterm", "top_k": 3},
-        )
-        assert latest_scoped.status_code == 200
-        latest_payload = latest_scoped.json()
-        assert latest_payload["upload_batch_id"] == second_batch_id
-        assert len(latest_payload["results"]) >= 1
-        assert latest_payload["results"][0]["file_name"] == "new.txt"
+    reindex = client.post(f"/projects/{project_id}/reindex")
+    assert reindex.status_code == 200
+    payload = reindex.json()
+    assert payload["upload_batch_id"] == second_batch_id
+    assert payload["chunks_deleted"] >= 1
+    assert payload["chunks_indexed"] >= 1
+    assert payload["embedding"]["mode"] == "hash"
+    assert payload["documents"][0]["parse_report"]["embedding_providers"]["hash"] >= 1
+
+    latest_scoped = client.post(
+        f"/projects/{project_id}/retrieve",
+        content=LEGACYTERM_QUERY_BODY,
+        headers=JSON_HEADERS,
+    )
+    assert latest_scoped.status_code == 200
+    latest_payload = latest_scoped.json()
+    assert latest_payload["upload_batch_id"] == second_batch_id
+    assert len(latest_payload["results"]) >= 1
+    assert latest_payload["results"][0]["file_name"] == "new.txt"
 
 
-def test_retrieve_handles_embedding_dimension_drift(tmp_path: Path) -> None:
-    settings.database_url = f"sqlite:///{tmp_path}/test.db"
-    settings.storage_root = str(tmp_path / "uploads")
-    settings.chunk_size_chars = 80
-    settings.chunk_overlap_chars = 20
-    settings.embedding_dim = 64
+@pytest.fixture(scope="module")
+def seeded_drift_project(client: TestClient) -> str:
+    """Project indexed with 16-dim embeddings; drift tests only raise embedding_dim afterwards."""
 
-    with TestClient(app) as client:
+    with override_settings(chunk_size_chars=120, chunk_overlap_chars=20, embedding_dim=16):
         project_id = client.post("/projects", json={"name": "Embedding Drift"}).json()["id"]
-        upload = client.post(
-            f"/projects/{project_id}/upload",
-            files=[("files", ("impact.txt", b"Households received rent support.", "text/plain"))],
-        )
-        assert upload.status_code == 200
-
-        previous_dim = settings.embedding_dim
-        try:
-            settings.embedding_dim = 128
-            retrieve = client.post(
-                f"/projects/{project_id}/retrieve",
-                json={"query": "rent support households", "top_k": 3},
-            )
-            assert retrieve.status_code == 200
-            payload = retrieve.json()
-            assert len(payload["results"]) >= 1
-            assert payload["results"][0]["file_name"] == "impact.txt"
-            warnings = payload.get("warnings")
-            assert isinstance(warnings, list)
-            assert any(item.get("code") == "embedding_dim_drift" for item in warnings if isinstance(item, dict))
-        finally:
-            settings.embedding_dim = previous_dim
-
-
-def test_generate_section_surfaces_embedding_dimension_drift_warning(tmp_path: Path) -> None:
-    settings.database_url = f"sqlite:///{tmp_path}/test.db"
-    settings.storage_root = str(tmp_path / "uploads")
-    settings.chunk_size_chars = 120
-    settings.chunk_overlap_chars = 20
-    settings.embedding_dim = 64
-
-    source_text = b"""
-Question 1: Describe the need statement.
-Need Statement evidence with outcomes and household counts.
-"""
-
-    with TestClient(app) as client:
-        project_id = client.post("/projects", json={"name": "Draft Drift Warning"}).json()["id"]
-        upload = client.post(
-            f"/projects/{project_id}/upload",
-            files=[("files", ("impact.txt", source_text, "text/plain"))],
-        )
-        assert upload.status_code == 200
+        assert _upload_files(client, project_id, ("impact.txt", DRIFT_SOURCE_TEXT, "text/plain")).status_code == 200
+    return project_id
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "body"),
+    [
+        ("retrieve", {"query": "rent support households", "top_k": 3}),
+        ("generate-section", {"section_key": "Need Statement", "top_k": 2}),
+    ],
+)
+def test_embedding_dimension_drift_is_reported(
+    monkeypatch: pytest.MonkeyPatch,
+    nebula_settings: None,
+    seeded_drift_project: str,
+    client: TestClient,
+    endpoint: str,
+    body: dict[str, object],
+) -> None:
+    monkeypatch.setattr(settings, "embedding_dim", 32)
+    response = client.post(f"/projects/{seeded_drift_project}/{endpoint}", json=body)
+    assert response.status_code == 200
+    payload = response.json()
+    if endpoint == "retrieve":
+        assert len(payload["results"]) >= 1
+        assert payload["results"][0]["file_name"] == "impact.txt"
+    warnings = payload.get("warnings")
+    assert isinstance(warnings, list)
+    assert any(item.get("code") == "embedding_dim_drift" for item in warnings if isinstance(item, dict))
 
-        previous_dim = settings.embedding_dim
-        try:
-            settings.embedding_dim = 128
-            generate = client.post(
-                f"/projects/{project_id}/generate-section",
-                json={"section_key": "Need Statement", "top_k": 2},
-            )
-            assert generate.status_code == 200
-            payload = generate.json()
-            warnings = payload.get("warnings")
-            assert isinstance(warnings, list)
-            assert any(item.get("code") == "embedding_dim_drift" for item in warnings if isinstance(item, dict))
-        finally:
-            settings.embedding_dim = previous_dim
-
-
-def test_extract_requirements_defaults_to_latest_upload_batch(tmp_path: Path) -> None:
-    settings.database_url = f"sqlite:///{tmp_path}/test.db"
-    settings.storage_root = str(tmp_path / "uploads")
-    settings.chunk_size_chars = 250
-    settings.chunk_overlap_chars = 40
-    settings.embedding_dim = 64
 
+@pytest.mark.parametrize("nebula_settings", [(250, 40, 16)], indirect=True)
+def test_extract_requirements_defaults_to_latest_upload_batch(nebula_settings: None, client: TestClient) -> None:
     first_rfp = b"Funder: Legacy Foundation\nQuestion 1: Legacy prompt. Limit 100 words."
     second_rfp = b"Funder: New Foundation\nQuestion 1: Fresh prompt. Limit 120 words."
 
-    with TestClient(app) as client:
-        project_id = client.post("/projects", json={"name": "Batch RFP"}).json()["id"]
-
-        assert (
-            client.post(
-                f"/projects/{project_id}/upload",
-                files=[("files", ("rfp_legacy.txt", first_rfp, "text/plain"))],
-            ).status_code
-            == 200
-        )
-        second_upload = client.post(
-            f"/projects/{project_id}/upload",
-            files=[("files", ("rfp_new.txt", second_rfp, "text/plain"))],
-        )
-        assert second_upload.status_code == 200
-        second_batch_id = second_upload.json()["upload_batch_id"]
-
-        extract = client.post(f"/projects/{project_id}/extract-requirements")
-        assert extract.status_code == 200
-        payload = extract.json()
-        assert payload["upload_batch_id"] == second_batch_id
-        assert payload["requirements"]["funder"] == "New Foundation"
-        rfp_selection = payload["extraction"]["rfp_selection"]
-        assert rfp_selection["selected_file_name"] == "rfp_new.txt"
-
-
-def test_extract_requirements_and_read_latest(tmp_path: Path) -> None:
-    settings.database_url = f"sqlite:///{tmp_path}/test.db"
-    settings.storage_root = str(tmp_path / "uploads")
-    settings.chunk_size_chars = 300
-    settings.chunk_overlap_chars = 50
-    settings.embedding_dim = 64
-
-    rfp_text = b"""
-Funder: City Community Fund
-Deadline: March 30, 2026
-
-Eligibility:
-- Eligible applicants must be registered nonprofits.
-
-Question 1: Describe program outcomes. Limit 250 words.
-Question 2: Provide implementation timeline. Limit 1200 characters.
-
-Required Attachments:
-- Attachment A: Budget Narrative
-- Attachment B: Board List
-
-Rubric:
-- Scoring criteria include impact and feasibility.
-
-Disallowed costs:
-- Alcohol purchases are not allowed costs.
-"""
-
-    with TestClient(app) as client:
-        project_id = client.post("/projects", json={"name": "RFP Extraction"}).json()["id"]
-
-        upload = client.post(
-            f"/projects/{project_id}/upload",
-            files=[("files", ("rfp.txt", rfp_text, "text/plain"))],
-        )
-        assert upload.status_code == 200
-
-        extract = client.post(f"/projects/{project_id}/extract-requirements")
-        assert extract.status_code == 200
-        payload = extract.json()
-        requirements = payload["requirements"]
-        extraction = payload["extraction"]
-        assert requirements["funder"] == "City Community Fund"
-        assert requirements["deadline"] == "March 30, 2026"
-        assert len(requirements["questions"]) >= 2
-        assert requirements["questions"][0]["limit"]["type"] in {"words", "none", "chars"}
-        assert len(requirements["required_attachments"]) >= 1
-        assert len(requirements["disallowed_costs"]) >= 1
-        assert extraction["mode"] in {"deterministic+nova", "deterministic-only"}
-        assert extraction["deterministic_question_count"] >= 2
-        adaptive_context = extraction["adaptive_context"]
-        assert adaptive_context["mode"] in {"single_pass", "multi_pass", "deterministic-only"}
-        assert adaptive_context["window_count"] >= 0
-        assert adaptive_context["deduped_candidates"] >= 0
-
-        latest = client.get(f"/projects/{project_id}/requirements/latest")
-        assert latest.status_code == 200
-        assert latest.json()["artifact"]["source"] == "nova-agents-v1"
-
-
-def test_extract_requirements_without_chunks_returns_400(tmp_path: Path) -> None:
-    settings.database_url = f"sqlite:///{tmp_path}/test.db"
-    settings.storage_root = str(tmp_path / "uploads")
-
-    with TestClient(app) as client:
-        project_id = client.post("/projects", json={"name": "No Chunks"}).json()["id"]
-        extract = client.post(f"/projects/{project_id}/extract-requirements")
-        assert extract.status_code == 400
+    project_id, second_batch_id = _upload_two_batches(
+        client,
+        "Batch RFP",
+        ("rfp_legacy.txt", first_rfp, "text/plain"),
+        ("rfp_new.txt", second_rfp, "text/plain"),
+    )
 
+    extract = client.post(f"/projects/{project_id}/extract-requirements")
+    assert extract.status_code == 200
+    payload = extract.json()
+    assert payload["upload_batch_id"] == second_batch_id
+    assert payload["requirements"]["funder"] == "New Foundation"
+    rfp_selection = payload["extraction"]["rfp_selection"]
+    assert rfp_selection["selected_file_name"] == "rfp_new.txt"
 
-def test_generate_section_and_read_latest_draft(tmp_path: Path) -> None:
-    settings.database_url = f"sqlite:///{tmp_path}/test.db"
-    settings.storage_root = str(tmp_path / "uploads")
-    settings.chunk_size_chars = 120
-    settings.chunk_overlap_chars = 20
-    settings.embedding_dim = 64
 
-    source_text = b"""
-Question 1: Describe the organization need statement.
-We served 1240 households with emergency support in 2024.
-Our outcomes improved housing stability for low-income families.
-"""
+@pytest.mark.parametrize("nebula_settings", [(300, 50, 16)], indirect=True)
+def test_extract_requirements_and_read_latest(nebula_settings: None, client: TestClient) -> None:
+    project_id = client.post("/projects", json={"name": "RFP Extraction"}).json()["id"]
 
-    with TestClient(app) as client:
-        project_id = client.post("/projects", json={"name": "Drafting"}).json()["id"]
-        upload = client.post(
-            f"/projects/{project_id}/upload",
-            files=[("files", ("impact.txt", source_text, "text/plain"))],
-        )
-        assert upload.status_code == 200
+    upload = client.post(
+        f"/projects/{project_id}/upload",
+        files=[("files", ("rfp.txt", FULL_RFP_TEXT, "text/plain"))],
+    )
+    assert upload.status_code == 200
+
+    extract = client.post(f"/projects/{project_id}/extract-requirements")
+    assert extract.status_code == 200
+    payload = extract.json()
+    requirements = payload["requirements"]
+    extraction = payload["extraction"]
+    assert requirements["funder"] == "City Community Fund"
+    assert requirements["deadline"] == "March 30, 2026"
+    assert len(requirements["questions"]) >= 2
+    assert requirements["questions"][0]["limit"]["type"] in {"words", "none", "chars"}
+    assert len(requirements["required_attachments"]) >= 1
+    assert len(requirements["disallowed_costs"]) >= 1
+    assert extraction["mode"] in {"deterministic+nova", "deterministic-only"}
+    assert extraction["deterministic_question_count"] >= 2
+    adaptive_context = extraction["adaptive_context"]
+    assert adaptive_context["mode"] in {"single_pass", "multi_pass", "deterministic-only"}
+    assert adaptive_context["window_count"] >= 0
+    assert adaptive_context["deduped_candidates"] >= 0
+
+    latest = client.get(f"/projects/{project_id}/requirements/latest")
+    assert latest.status_code == 200
+    assert latest.json()["artifact"]["source"] == "nova-agents-v1"
+
+
+def test_extract_requirements_without_chunks_returns_400(nebula_settings: None, client: TestClient) -> None:
+    project_id = client.post("/projects", json={"name": "No Chunks"}).json()["id"]
+    extract = client.post(f"/projects/{project_id}/extract-requirements")
+    assert extract.status_code == 400
+
+
+@pytest.mark.parametrize("nebula_settings", [(120, 20, 16)], indirect=True)
+def test_generate_section_and_read_latest_draft(nebula_settings: None, client: TestClient) -> None:
+    project_id = client.post("/projects", json={"name": "Drafting"}).json()["id"]
+    upload = client.post(
+        f"/projects/{project_id}/upload",
+        files=[("files", ("impact.txt", DRAFTING_SOURCE_TEXT, "text/plain"))],
+    )
+    assert upload.status_code == 200
 
-        generate = client.post(
-            f"/projects/{project_id}/generate-section",
-            json={"section_key": "Need Statement", "top_k": 2},
-        )
-        assert generate.status_code == 200
-        payload = generate.json()
-        assert payload["draft"]["section_key"] == "Need Statement"
-        assert len(payload["draft"]["paragraphs"]) >= 1
-        first = payload["draft"]["paragraphs"][0]
-        assert len(first["citations"]) >= 1
-        assert first["citations"][0]["doc_id"] == "impact.txt"
-
-        latest = client.get(f"/projects/{project_id}/drafts/Need Statement/latest")
-        assert latest.status_code == 200
-        assert latest.json()["draft"]["section_key"] == "Need Statement"
-        assert latest.json()["artifact"]["source"] == "nova-agents-v1"
-
-
-def test_compute_coverage_and_read_latest(tmp_path: Path) -> None:
-    settings.database_url = f"sqlite:///{tmp_path}/test.db"
-    settings.storage_root = str(tmp_path / "uploads")
-    settings.chunk_size_chars = 220
-    settings.chunk_overlap_chars = 40
-    settings.embedding_dim = 64
-
-    rfp_text = b"""
-Funder: City Community Fund
-Question 1: Describe program outcomes. Limit 250 words.
-Question 2: Explain implementation timeline. Limit 500 words.
-"""
-    source_text = b"""
-Need Statement: We served 1240 households in 2024 with emergency housing support.
-Our implementation timeline spans four quarters with milestones.
-"""
+    generate = client.post(
+        f"/projects/{project_id}/generate-section",
+        json={"section_key": "Need Statement", "top_k": 2},
+    )
+    assert generate.status_code == 200
+    payload = generate.json()
+    assert payload["draft"]["section_key"] == "Need Statement"
+    assert len(payload["draft"]["paragraphs"]) >= 1
+    first = payload["draft"]["paragraphs"][0]
+    assert len(first["citations"]) >= 1
+    assert first["citations"][0]["doc_id"] == "impact.txt"
+
+    latest = client.get(f"/projects/{project_id}/drafts/Need Statement/latest")
+    assert latest.status_code == 200
+    assert latest.json()["draft"]["section_key"] == "Need Statement"
+    assert latest.json()["artifact"]["source"] == "nova-agents-v1"
+
+
+@pytest.mark.anyio
+async def test_compute_coverage_and_read_latest(
+    nebula_settings: None, seeded_project: tuple[str, str], async_client: httpx.AsyncClient
+) -> None:
+    project_id, _ = seeded_project
 
-    with TestClient(app) as client:
-        project_id = client.post("/projects", json={"name": "Coverage"}).json()["id"]
-        upload = client.post(
-            f"/projects/{project_id}/upload",
-            files=[
-                ("files", ("rfp.txt", rfp_text, "text/plain")),
-                ("files", ("impact.txt", source_text, "text/plain")),
-            ],
-        )
-        assert upload.status_code == 200
+    generate = await async_client.post(
+        f"/projects/{project_id}/generate-section",
+        json={"section_key": "Need Statement", "top_k": 3},
+    )
+    assert generate.status_code == 200
 
-        extract = client.post(f"/projects/{project_id}/extract-requirements")
-        assert extract.status_code == 200
+    coverage = await async_client.post(
+        f"/projects/{project_id}/coverage",
+        content=NEED_STATEMENT_BODY,
+        headers=JSON_HEADERS,
+    )
+    assert coverage.status_code == 200
+    payload = coverage.json()
+    assert payload["project_id"] == project_id
+    assert len(payload["coverage"]["items"]) >= 1
+    assert payload["coverage"]["items"][0]["status"] in {"met", "partial", "missing"}
+
+    latest = await async_client.get(f"/projects/{project_id}/coverage/latest")
+    assert latest.status_code == 200
+    assert len(latest.json()["coverage"]["items"]) >= 1
+    assert latest.json()["artifact"]["source"] == "nova-agents-v1"
+
+
+@pytest.mark.anyio
+@pytest.mark.needs_disk
+async def test_export_json_and_markdown(
+    tmp_path: Path, nebula_settings: None, seeded_project: tuple[str, str], async_client: httpx.AsyncClient
+) -> None:
+    project_id, requirements_artifact_id = seeded_project
 
-        generate = client.post(
-            f"/projects/{project_id}/generate-section",
-            json={"section_key": "Need Statement", "top_k": 3},
-        )
-        assert generate.status_code == 200
+    generate = await async_client.post(
+        f"/projects/{project_id}/generate-section",
+        content=NEED_STATEMENT_BODY,
+        headers=JSON_HEADERS,
+    )
+    assert generate.status_code == 200
+    coverage = await async_client.post(
+        f"/projects/{project_id}/coverage",
+        params={"requirements_artifact_id": requirements_artifact_id},
+        content=NEED_STATEMENT_BODY,
+        headers=JSON_HEADERS,
+    )
+    assert coverage.status_code == 200
 
-        coverage = client.post(
-            f"/projects/{project_id}/coverage",
-            json={"section_key": "Need Statement"},
-        )
-        assert coverage.status_code == 200
-        payload = coverage.json()
-        assert payload["project_id"] == project_id
-        assert len(payload["coverage"]["items"]) >= 1
-        assert payload["coverage"]["items"][0]["status"] in {"met", "partial", "missing"}
-
-        latest = client.get(f"/projects/{project_id}/coverage/latest")
-        assert latest.status_code == 200
-        assert len(latest.json()["coverage"]["items"]) >= 1
-        assert latest.json()["artifact"]["source"] == "nova-agents-v1"
-
-
-def test_export_json_and_markdown(tmp_path: Path) -> None:
-    settings.database_url = f"sqlite:///{tmp_path}/test.db"
-    settings.storage_root = str(tmp_path / "uploads")
-    settings.chunk_size_chars = 220
-    settings.chunk_overlap_chars = 40
-    settings.embedding_dim = 64
-
-    with TestClient(app) as client:
-        project_id = client.post("/projects", json={"name": "Export"}).json()["id"]
-        upload = client.post(
-            f"/projects/{project_id}/upload",
-            files=[
-                (
-                    "files",
-                    (
-                        "rfp.txt",
-                        b"Funder: City Community Fund\nQuestion 1: Describe outcomes. Limit 200 words.",
-                        "text/plain",
-                    ),
-                ),
-                (
-                    "files",
-                    (
-                        "impact.txt",
-                        b"We served 1240 households and improved housing stability outcomes.",
-                        "text/plain",
-                    ),
-                ),
-            ],
-        )
-        assert upload.status_code == 200
+    missing_artifact = await async_client.post(
+        f"/projects/{project_id}/coverage",
+        params={"requirements_artifact_id": "missing-artifact"},
+        content=NEED_STATEMENT_BODY,
+        headers=JSON_HEADERS,
+    )
+    assert missing_artifact.status_code == 404
+
+    # Both export formats write into the same exports folder, so they stay sequential.
+    export_json = await async_client.get(
+        f"/projects/{project_id}/export",
+        params={
+            "format": "json",
+            "section_key": "Need Statement",
+            "requirements_artifact_id": requirements_artifact_id,
+        },
+    )
+    assert export_json.status_code == 200
+    payload = export_json.json()
+    assert payload["export_version"] == "nebula.export.v1"
+    assert payload["project"]["id"] == project_id
+    assert payload["bundle"]["json"] is not None
+    assert payload["bundle"]["json"]["requirements"] is not None
+    assert payload["bundle"]["markdown"] is not None
+    markdown_files = payload["bundle"]["markdown"]["files"]
+    assert isinstance(markdown_files, list)
+    assert len(markdown_files) >= 1
+
+    exports_root = tmp_path / "exports" / project_id
+    assert exports_root.exists()
+    assert (exports_root / "application.md").exists()
+    assert (exports_root / "requirements.md").exists()
+
+    export_md = await async_client.get(f"/projects/{project_id}/export?format=markdown&section_key=Need Statement")
+    assert export_md.status_code == 200
+    assert "Draft Application" in export_md.text
+    etag = export_md.headers["etag"]
+
+    repeat_md = await async_client.get(f"/projects/{project_id}/export?format=markdown&section_key=Need Statement")
+    assert repeat_md.status_code == 200
+    assert repeat_md.headers["etag"] == etag
+    assert repeat_md.text == export_md.text
+
+    not_modified = await async_client.get(
+        f"/projects/{project_id}/export?format=markdown&section_key=Need Statement",
+        headers={"If-None-Match": etag},
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
 
-        assert client.post(f"/projects/{project_id}/extract-requirements").status_code == 200
-        assert (
-            client.post(
-                f"/projects/{project_id}/generate-section",
-                json={"section_key": "Need Statement"},
-            ).status_code
-            == 200
-        )
-        assert (
-            client.post(
-                f"/projects/{project_id}/coverage",
-                json={"section_key": "Need Statement"},
-            ).status_code
-            == 200
-        )
 
-        export_json = client.get(f"/projects/{project_id}/export?format=json&section_key=Need Statement")
-        assert export_json.status_code == 200
-        payload = export_json.json()
-        assert payload["export_version"] == "nebula.export.v1"
-        assert payload["project"]["id"] == project_id
-        assert payload["bundle"]["json"] is not None
-        assert payload["bundle"]["json"]["requirements"] is not None
-        assert payload["bundle"]["markdown"] is not None
-        markdown_files = payload["bundle"]["markdown"]["files"]
-        assert isinstance(markdown_files, list)
-        assert len(markdown_files) >= 1
-
-        exports_root = tmp_path / "exports" / project_id
-        assert exports_root.exists()
-        assert (exports_root / "application.md").exists()
-        assert (exports_root / "requirements.md").exists()
-
-        export_md = client.get(f"/projects/{project_id}/export?format=markdown&section_key=Need Statement")
-        assert export_md.status_code == 200
-        assert "Draft Application" in export_md.text
-
-
-def test_agentic_orchestration_pilot_retries_missing_evidence(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+@pytest.mark.parametrize("nebula_settings", [(70, 10, 16)], indirect=True)
+def test_agentic_orchestration_pilot_retries_missing_evidence(
+    monkeypatch: pytest.MonkeyPatch, nebula_settings: None, client: TestClient
+) -> None:
     class PilotOrchestrator:
         def plan_section_generation(
             self, section_key: str, requested_top_k: int, available_chunk_count: int
@@ -852,165 +801,161 @@ def test_agentic_orchestration_pilot_retries_missing_evidence(tmp_path: Path, mo
         ) -> dict[str, object]:
             return build_coverage_payload(requirements, draft)
 
-    monkeypatch.setattr("app.main.get_nova_orchestrator", lambda: PilotOrchestrator())
-
-    settings.database_url = f"sqlite:///{tmp_path}/test.db"
-    settings.storage_root = str(tmp_path / "uploads")
-    settings.chunk_size_chars = 70
-    settings.chunk_overlap_chars = 10
-    settings.embedding_dim = 64
+    monkeypatch.setattr(app_module, "get_nova_orchestrator", lambda: PilotOrchestrator())
 
-    source_text = (
-        b"Need Statement evidence paragraph one. "
-        b"Need Statement evidence paragraph two with additional support. "
-        b"Need Statement evidence paragraph three for refinement."
+    project_id = client.post("/projects", json={"name": "Pilot Off"}).json()["id"]
+    upload = client.post(
+        f"/projects/{project_id}/upload",
+        files=[("files", ("impact.txt", PILOT_TEXT, "text/plain"))],
     )
+    assert upload.status_code == 200
 
-    previous_flag = settings.enable_agentic_orchestration_pilot
-    try:
-        with TestClient(app) as client:
-            project_id = client.post("/projects", json={"name": "Pilot Off"}).json()["id"]
-            upload = client.post(
-                f"/projects/{project_id}/upload",
-                files=[("files", ("impact.txt", source_text, "text/plain"))],
-            )
-            assert upload.status_code == 200
-
-            settings.enable_agentic_orchestration_pilot = False
-            off_resp = client.post(
-                f"/projects/{project_id}/generate-section",
-                json={"section_key": "Need Statement", "top_k": 1},
-            )
-            assert off_resp.status_code == 200
-            off_draft = off_resp.json()["draft"]
-            assert len(off_draft["paragraphs"]) == 0
-            assert len(off_draft["missing_evidence"]) == 1
-
-            settings.enable_agentic_orchestration_pilot = True
-            on_resp = client.post(
-                f"/projects/{project_id}/generate-section",
-                json={"section_key": "Need Statement", "top_k": 1},
-            )
-            assert on_resp.status_code == 200
-            on_draft = on_resp.json()["draft"]
-            assert len(on_draft["paragraphs"]) == 1
-            assert len(on_draft["missing_evidence"]) == 0
-            assert len(on_draft["paragraphs"][0]["citations"]) >= 1
-    finally:
-        settings.enable_agentic_orchestration_pilot = previous_flag
-
+    monkeypatch.setattr(settings, "enable_agentic_orchestration_pilot", False)
+    off_resp = client.post(
+        f"/projects/{project_id}/generate-section",
+        json={"section_key": "Need Statement", "top_k": 1},
+    )
+    assert off_resp.status_code == 200
+    off_draft = off_resp.json()["draft"]
+    assert len(off_draft["paragraphs"]) == 0
+    assert len(off_draft["missing_evidence"]) == 1
+
+    monkeypatch.setattr(settings, "enable_agentic_orchestration_pilot", True)
+    on_resp = client.post(
+        f"/projects/{project_id}/generate-section",
+        json={"section_key": "Need Statement", "top_k": 1},
+    )
+    assert on_resp.status_code == 200
+    on_draft = on_resp.json()["draft"]
+    assert len(on_draft["paragraphs"]) == 1
+    assert len(on_draft["missing_evidence"]) == 0
+    assert len(on_draft["paragraphs"][0]["citations"]) >= 1
 
-def test_export_surfaces_source_ambiguity_warning(tmp_path: Path) -> None:
-    settings.database_url = f"sqlite:///{tmp_path}/test.db"
-    settings.storage_root = str(tmp_path / "uploads")
-    settings.chunk_size_chars = 220
-    settings.chunk_overlap_chars = 40
-    settings.embedding_dim = 64
 
-    rfp_a = b"""
-Funding Opportunity: City Community Fund
-Required Narrative Questions:
-Question 1: Need Statement (300 words max): Describe need.
-"""
-    rfp_b = b"""
-Funding Opportunity: County Community Fund
-Required Narrative Questions:
-Question 1: Need Statement (300 words max): Describe need.
-"""
+def test_export_surfaces_source_ambiguity_warning(nebula_settings: None, client: TestClient) -> None:
     evidence = b"Need Statement evidence about households and service outcomes."
 
-    with TestClient(app) as client:
-        project_id = client.post("/projects", json={"name": "Ambiguous RFP Export"}).json()["id"]
-        upload = client.post(
-            f"/projects/{project_id}/upload",
-            files=[
-                ("files", ("rfp_a.txt", rfp_a, "text/plain")),
-                ("files", ("rfp_b.txt", rfp_b, "text/plain")),
-                ("files", ("evidence.txt", evidence, "text/plain")),
-            ],
-        )
-        assert upload.status_code == 200
+    project_id = client.post("/projects", json={"name": "Ambiguous RFP Export"}).json()["id"]
+    upload = _upload_files(
+        client,
+        project_id,
+        ("rfp_a.txt", AMBIGUOUS_RFP_A_TEXT, "text/plain"),
+        ("rfp_b.txt", AMBIGUOUS_RFP_B_TEXT, "text/plain"),
+        ("evidence.txt", evidence, "text/plain"),
+    )
+    assert upload.status_code == 200
 
-        assert client.post(f"/projects/{project_id}/extract-requirements").status_code == 200
-        assert (
-            client.post(
-                f"/projects/{project_id}/generate-section",
-                json={"section_key": "Need Statement"},
-            ).status_code
-            == 200
-        )
-        assert (
-            client.post(
-                f"/projects/{project_id}/coverage",
-                json={"section_key": "Need Statement"},
-            ).status_code
-            == 200
-        )
+    assert client.post(f"/projects/{project_id}/extract-requirements").status_code == 200
+    assert (
+        client.post(
+            f"/projects/{project_id}/generate-section",
+            content=NEED_STATEMENT_BODY,
+            headers=JSON_HEADERS,
+        ).status_code
+        == 200
+    )
+    assert (
+        client.post(
+            f"/projects/{project_id}/coverage",
+            content=NEED_STATEMENT_BODY,
+            headers=JSON_HEADERS,
+        ).status_code
+        == 200
+    )
 
-        export_json = client.get(f"/projects/{project_id}/export?format=json&section_key=Need Statement")
-        assert export_json.status_code == 200
-        payload = export_json.json()
+    export_json = client.get(f"/projects/{project_id}/export?format=json&section_key=Need Statement")
+    assert export_json.status_code == 200
+    payload = export_json.json()
 
-        assert "source ambiguity warning" in payload["quality_gates"]["warnings"]
-        assert payload["summary"]["uncertainty"]["source_ambiguity_count"] == 1
+    assert "source ambiguity warning" in payload["quality_gates"]["warnings"]
+    assert payload["summary"]["uncertainty"]["source_ambiguity_count"] == 1
 
 
-def test_generate_full_draft_endpoint_runs_all_sections_and_exports(tmp_path: Path) -> None:
-    settings.database_url = f"sqlite:///{tmp_path}/test.db"
-    settings.storage_root = str(tmp_path / "uploads")
-    settings.chunk_size_chars = 220
-    settings.chunk_overlap_chars = 40
-    settings.embedding_dim = 64
+def test_generate_full_draft_endpoint_runs_all_sections_and_exports(nebula_settings: None, client: TestClient) -> None:
+    project_id = client.post("/projects", json={"name": "Full Run"}).json()["id"]
+    upload = _upload_files(
+        client,
+        project_id,
+        ("rfp.txt", RFP_TEXT, "text/plain"),
+        ("evidence.txt", EVIDENCE_TEXT, "text/plain"),
+    )
+    assert upload.status_code == 200
 
-    rfp_text = b"""
-Funder: City Community Fund
-Question 1: Need Statement (300 words max): Describe the local need.
-Question 2: Program Design (400 words max): Explain activities and timeline.
-"""
-    evidence_text = b"""
-Need Statement evidence: 1240 households served in 2024.
-Program Design evidence: monthly coaching, employer partnerships, quarterly milestones.
-"""
+    run_response = client.post(
+        f"/projects/{project_id}/generate-full-draft",
+        json={"top_k": 4, "max_revision_rounds": 1},
+    )
+    assert run_response.status_code == 200
+    payload = run_response.json()
 
-    with TestClient(app) as client:
-        project_id = client.post("/projects", json={"name": "Full Run"}).json()["id"]
-        upload = client.post(
-            f"/projects/{project_id}/upload",
-            files=[
-                ("files", ("rfp.txt", rfp_text, "text/plain")),
-                ("files", ("evidence.txt", evidence_text, "text/plain")),
-            ],
-        )
-        assert upload.status_code == 200
+    assert payload["project_id"] == project_id
+    assert payload["run_summary"]["status"] == "complete"
+    assert payload["run_summary"]["sections_total"] >= 2
+    assert payload["run_summary"]["sections_completed"] == payload["run_summary"]["sections_total"]
+    assert len(payload["section_runs"]) == payload["run_summary"]["sections_total"]
 
-        run_response = client.post(
-            f"/projects/{project_id}/generate-full-draft",
-            json={"top_k": 4, "max_revision_rounds": 1},
-        )
-        assert run_response.status_code == 200
-        payload = run_response.json()
+    section_keys = {item["section_key"] for item in payload["section_runs"]}
+    assert "Need Statement" in section_keys
+    assert "Program Design" in section_keys
 
-        assert payload["project_id"] == project_id
-        assert payload["run_summary"]["status"] == "complete"
-        assert payload["run_summary"]["sections_total"] >= 2
-        assert payload["run_summary"]["sections_completed"] == payload["run_summary"]["sections_total"]
-        assert len(payload["section_runs"]) == payload["run_summary"]["sections_total"]
+    assert payload["coverage"]["items"]
+    assert payload["export"]["bundle"]["json"] is not None
+    assert payload["export"]["bundle"]["markdown"] is not None
 
-        section_keys = {item["section_key"] for item in payload["section_runs"]}
-        assert "Need Statement" in section_keys
-        assert "Program Design" in section_keys
+    latest_coverage = client.get(f"/projects/{project_id}/coverage/latest")
+    assert latest_coverage.status_code == 200
+    assert len(latest_coverage.json()["coverage"]["items"]) >= 1
 
-        assert payload["coverage"]["items"]
-        assert payload["export"]["bundle"]["json"] is not None
-        assert payload["export"]["bundle"]["markdown"] is not None
 
-        latest_coverage = client.get(f"/projects/{project_id}/coverage/latest")
-        assert latest_coverage.status_code == 200
-        assert len(latest_coverage.json()["coverage"]["items"]) >= 1
+def test_generate_full_draft_keeps_section_order_and_wall_clock_timings_with_concurrent_sections(
+    monkeypatch: pytest.MonkeyPatch,
+    nebula_settings: None,
+    client: TestClient,
+    fake_nova_orchestrator: object,
+) -> None:
+    class SlowFirstSectionOrchestrator:
+        def __getattr__(self, name: str) -> object:
+            return getattr(fake_nova_orchestrator, name)
+
+        def generate_section(
+            self,
+            section_key: str,
+            ranked_chunks: list[dict[str, object]],
+            *,
+            prompt_context: dict[str, str] | None = None,
+        ) -> dict[str, object]:
+            # The first section finishes last, so section_runs must not follow completion order.
+            time.sleep(0.2 if section_key == "Need Statement" else 0.05)
+            return fake_nova_orchestrator.generate_section(section_key, ranked_chunks, prompt_context=prompt_context)
+
+    monkeypatch.setattr(app_module, "get_nova_orchestrator", lambda: SlowFirstSectionOrchestrator())
+    monkeypatch.setattr(settings, "full_draft_section_workers", 4)
+
+    project_id = client.post("/projects", json={"name": "Concurrent Sections"}).json()["id"]
+    upload = _upload_files(
+        client,
+        project_id,
+        ("rfp.txt", RFP_TEXT, "text/plain"),
+        ("evidence.txt", EVIDENCE_TEXT, "text/plain"),
+    )
+    assert upload.status_code == 200
+
+    payload = client.post(
+        f"/projects/{project_id}/generate-full-draft",
+        json={"top_k": 4, "max_revision_rounds": 1},
+    ).json()
+
+    assert [run["section_key"] for run in payload["section_runs"]][:2] == ["Need Statement", "Program Design"]
+    timings = payload["run_summary"]["timings_ms"]
+    assert timings["extraction"] + timings["drafting"] + timings["coverage"] + timings["export"] <= timings["total"]
+    assert timings["drafting"] >= max(run["timings_ms"]["total"] for run in payload["section_runs"])
+    assert timings["section_sums"]["drafting"] == pytest.approx(
+        sum(run["timings_ms"]["draft"] for run in payload["section_runs"]), abs=0.05
+    )
 
 
 def test_generate_full_draft_passes_optional_context_brief(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    monkeypatch: pytest.MonkeyPatch, nebula_settings: None, client: TestClient
 ) -> None:
     captured_contexts: list[dict[str, str] | None] = []
 
@@ -1043,42 +988,28 @@ def test_generate_full_draft_passes_optional_context_brief(
         ) -> dict[str, object]:
             return build_coverage_payload(requirements, draft)
 
-    monkeypatch.setattr("app.main.get_nova_orchestrator", lambda: ContextAwareOrchestrator())
-
-    settings.database_url = f"sqlite:///{tmp_path}/test.db"
-    settings.storage_root = str(tmp_path / "uploads")
-    settings.chunk_size_chars = 220
-    settings.chunk_overlap_chars = 40
-    settings.embedding_dim = 64
+    monkeypatch.setattr(app_module, "get_nova_orchestrator", lambda: ContextAwareOrchestrator())
 
-    rfp_text = b"""
-Question 1: Need Statement (300 words max): Describe the local need.
-"""
-    evidence_text = b"""
-Need Statement evidence: 1240 households served in 2024.
-"""
     context_brief = "Focus on outcomes for first-time job seekers."
 
-    with TestClient(app) as client:
-        project_id = client.post("/projects", json={"name": "Context Brief Run"}).json()["id"]
-        upload = client.post(
-            f"/projects/{project_id}/upload",
-            files=[
-                ("files", ("rfp.txt", rfp_text, "text/plain")),
-                ("files", ("evidence.txt", evidence_text, "text/plain")),
-            ],
-        )
-        assert upload.status_code == 200
-
-        run_response = client.post(
-            f"/projects/{project_id}/generate-full-draft",
-            json={
-                "top_k": 4,
-                "max_revision_rounds": 1,
-                "context_brief": context_brief,
-            },
-        )
-        assert run_response.status_code == 200
+    project_id = client.post("/projects", json={"name": "Context Brief Run"}).json()["id"]
+    upload = _upload_files(
+        client,
+        project_id,
+        ("rfp.txt", CONTEXT_BRIEF_RFP_TEXT, "text/plain"),
+        ("evidence.txt", CONTEXT_BRIEF_EVIDENCE_TEXT, "text/plain"),
+    )
+    assert upload.status_code == 200
+
+    run_response = client.post(
+        f"/projects/{project_id}/generate-full-draft",
+        json={
+            "top_k": 4,
+            "max_revision_rounds": 1,
+            "context_brief": context_brief,
+        },
+    )
+    assert run_response.status_code == 200
 
     assert captured_contexts
     assert all(context == {"context_brief": context_brief} for context in captured_contexts)
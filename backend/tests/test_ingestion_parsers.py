@@ -1,8 +1,27 @@
 from __future__ import annotations
 
+import mmap
+import os
+import sys
+import tempfile
 from io import BytesIO
+from pathlib import Path
+from types import SimpleNamespace
 
-from app.retrieval import build_parse_report, chunk_pages, extract_text_pages
+import pytest
+
+from app import retrieval
+from app.config import settings
+from app.parsers import docx_parser, pdf_parser, rtf_parser
+from app.retrieval import (
+    TextExtraction,
+    build_parse_report,
+    chunk_pages,
+    extract_text_pages,
+    extract_text_pages_many,
+    shutdown_parse_pool,
+)
+from app.storage import open_document_buffer
 
 
 def _build_pdf_bytes(text: str) -> bytes:
@@ -52,8 +71,8 @@ def _build_rtf_bytes(text: str) -> bytes:
     ).encode("utf-8")
 
 
-def test_pdf_docx_rtf_parsers_extract_text() -> None:
-    scenarios = [
+def _parser_scenarios() -> list[tuple[str, str, str, bytes]]:
+    return [
         ("pdf", "sample.pdf", "application/pdf", _build_pdf_bytes("Need statement evidence text")),
         (
             "docx",
@@ -64,7 +83,9 @@ def test_pdf_docx_rtf_parsers_extract_text() -> None:
         ("rtf", "sample.rtf", "application/rtf", _build_rtf_bytes("Attachment summary and budget rationale.")),
     ]
 
-    for parser_id, file_name, content_type, content in scenarios:
+
+def test_pdf_docx_rtf_parsers_extract_text() -> None:
+    for parser_id, file_name, content_type, content in _parser_scenarios():
         extraction = extract_text_pages(content=content, content_type=content_type, file_name=file_name)
         assert extraction.parser_id == parser_id
         assert extraction.text_extractable is True
@@ -90,6 +111,91 @@ def test_pdf_docx_rtf_parsers_extract_text() -> None:
         assert report["chunks_indexed"] >= 1
 
 
+def test_parsers_read_memory_mapped_stored_files(tmp_path: Path) -> None:
+    for parser_id, file_name, content_type, content in [
+        *_parser_scenarios(),
+        ("text", "notes.txt", "text/plain", "Need statement café".encode("utf-8")),
+    ]:
+        stored = tmp_path / file_name
+        stored.write_bytes(content)
+        expected = extract_text_pages(content=content, content_type=content_type, file_name=file_name)
+
+        with open_document_buffer(settings=settings, storage_path=str(stored)) as mapped:
+            assert isinstance(mapped, mmap.mmap)
+            extraction = extract_text_pages(content=mapped, content_type=content_type, file_name=file_name)
+
+        assert extraction.parser_id == parser_id
+        assert extraction == expected
+
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    with open_document_buffer(settings=settings, storage_path=str(empty)) as mapped:
+        assert mapped == b""
+
+
+def test_parsers_never_spool_uploads_to_temp_files(monkeypatch: pytest.MonkeyPatch) -> None:
+    scenarios = _parser_scenarios()
+
+    def _refuse_temp_file(*args: object, **kwargs: object) -> None:
+        raise AssertionError("parsers must read upload bytes in memory")
+
+    for name in ("NamedTemporaryFile", "TemporaryFile", "SpooledTemporaryFile", "mkstemp"):
+        monkeypatch.setattr(tempfile, name, _refuse_temp_file)
+
+    for parser_id, file_name, content_type, content in scenarios:
+        extraction = extract_text_pages(content=content, content_type=content_type, file_name=file_name)
+        assert extraction.parser_id == parser_id
+        assert extraction.error is None
+        assert extraction.pages
+
+
+@pytest.fixture()
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.mark.anyio
+async def test_extract_text_pages_many_process_pool_matches_in_process_order() -> None:
+    uploads = [(content, content_type, file_name) for _, file_name, content_type, content in _parser_scenarios()]
+
+    in_process = await extract_text_pages_many(uploads, max_workers=1)
+    try:
+        pooled = await extract_text_pages_many(uploads, max_workers=2)
+    finally:
+        shutdown_parse_pool()
+
+    assert [extraction.parser_id for extraction in pooled] == ["pdf", "docx", "rtf"]
+    assert pooled == in_process
+
+
+def _parse_or_kill_worker(content: bytes, content_type: str, file_name: str) -> TextExtraction:
+    # Runs inside a spawned pool worker: simulate a native parser crash taking the process down.
+    if file_name == "crash.pdf":
+        os._exit(1)
+    return extract_text_pages(content=content, content_type=content_type, file_name=file_name)
+
+
+@pytest.mark.anyio
+async def test_extract_text_pages_many_reports_worker_crash_without_parsing_in_process(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    uploads = [(content, content_type, file_name) for _, file_name, content_type, content in _parser_scenarios()]
+    uploads.insert(1, (b"%PDF-1.7 crash", "application/pdf", "crash.pdf"))
+    monkeypatch.setattr(retrieval, "extract_text_pages", _parse_or_kill_worker)
+    monkeypatch.setattr(retrieval.os, "cpu_count", lambda: 2)
+
+    try:
+        extractions = await extract_text_pages_many(uploads, max_workers=2)
+    finally:
+        shutdown_parse_pool()
+
+    assert [extraction.parser_id for extraction in extractions] == ["pdf", "pdf", "docx", "rtf"]
+    crashed = extractions[1]
+    assert crashed.pages == []
+    assert crashed.error == "parser worker crashed"
+    assert all(extraction.error is None for index, extraction in enumerate(extractions) if index != 1)
+
+
 def test_malformed_pdf_reports_parser_error() -> None:
     malformed_pdf = b"%PDF-1.7\nthis-is-not-a-valid-pdf-structure"
     extraction = extract_text_pages(
@@ -115,6 +221,165 @@ def test_malformed_pdf_reports_parser_error() -> None:
     assert report["parser_error"]
 
 
+def test_pdf_parser_falls_back_when_a_native_backend_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _failing_backend(content: bytes) -> list[str]:
+        raise RuntimeError("native backend rejected document")
+
+    monkeypatch.setattr(
+        pdf_parser,
+        "_PDF_TEXT_EXTRACTORS",
+        (("pypdf", _failing_backend), ("pypdf", pdf_parser._extract_pdf_page_texts_pypdf)),
+    )
+    extraction = extract_text_pages(
+        content=_build_pdf_bytes("Fallback extraction evidence"),
+        content_type="application/pdf",
+        file_name="fallback.pdf",
+    )
+
+    assert extraction.parser_id == "pdf"
+    assert extraction.error is None
+    assert [page.text for page in extraction.pages] == ["Fallback extraction evidence"]
+
+
+class _FakePdfiumTextPage:
+    def __init__(self, text: str, closed: list[str]) -> None:
+        self.text = text
+        self.closed = closed
+
+    def get_text_range(self) -> str:
+        return self.text
+
+    def close(self) -> None:
+        self.closed.append("textpage")
+
+
+class _FakePdfiumPage:
+    def __init__(self, text: str, closed: list[str]) -> None:
+        self.text = text
+        self.closed = closed
+
+    def get_textpage(self) -> _FakePdfiumTextPage:
+        return _FakePdfiumTextPage(self.text, self.closed)
+
+    def close(self) -> None:
+        self.closed.append("page")
+
+
+def _install_fake_pdfium(monkeypatch: pytest.MonkeyPatch, pdfium_document) -> None:
+    monkeypatch.setitem(sys.modules, "pypdfium2", SimpleNamespace(PdfDocument=pdfium_document))
+    monkeypatch.setattr(pdf_parser, "find_spec", lambda name: object() if name in {"pypdf", "pypdfium2"} else None)
+
+
+def test_pdf_parser_never_loads_pymupdf(monkeypatch: pytest.MonkeyPatch) -> None:
+    def refuse_open(**kwargs: object) -> None:
+        raise AssertionError("PyMuPDF is AGPL-3.0 and must not be used")
+
+    monkeypatch.setitem(sys.modules, "fitz", SimpleNamespace(open=refuse_open))
+    monkeypatch.setattr(pdf_parser, "find_spec", lambda name: object() if name in {"fitz", "pypdf"} else None)
+
+    assert [module_name for module_name, _ in pdf_parser._PDF_TEXT_EXTRACTORS] == ["pypdfium2", "pypdf"]
+    extraction = extract_text_pages(
+        content=_build_pdf_bytes("Baseline extraction evidence"),
+        content_type="application/pdf",
+        file_name="a.pdf",
+    )
+    assert extraction.error is None
+    assert [page.text for page in extraction.pages] == ["Baseline extraction evidence"]
+
+
+def test_pdf_parser_uses_pdfium_backend_and_closes_its_handles(monkeypatch: pytest.MonkeyPatch) -> None:
+    closed: list[str] = []
+
+    class FakePdfDocument:
+        def __init__(self, content: bytes) -> None:
+            assert content == b"%PDF-stub"
+            self.pages = [_FakePdfiumPage("Program design", closed), _FakePdfiumPage("Timeline", closed)]
+
+        def __iter__(self):
+            return iter(self.pages)
+
+        def close(self) -> None:
+            closed.append("document")
+
+    _install_fake_pdfium(monkeypatch, FakePdfDocument)
+    extraction = extract_text_pages(content=b"%PDF-stub", content_type="application/pdf", file_name="a.pdf")
+
+    assert extraction.error is None
+    assert [page.text for page in extraction.pages] == ["Program design", "Timeline"]
+    assert closed == ["textpage", "page", "textpage", "page", "document"]
+
+
+def test_pdf_parser_falls_back_from_pdfium_to_pypdf_and_reports_last_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    attempts: list[str] = []
+
+    def failing_document(content: bytes) -> None:
+        attempts.append("pypdfium2")
+        raise RuntimeError("pdfium rejected document")
+
+    _install_fake_pdfium(monkeypatch, failing_document)
+    content = _build_pdf_bytes("Fallback extraction evidence")
+    extraction = extract_text_pages(content=content, content_type="application/pdf", file_name="a.pdf")
+
+    assert attempts == ["pypdfium2"]
+    assert extraction.error is None
+    assert [page.text for page in extraction.pages] == ["Fallback extraction evidence"]
+
+    attempts.clear()
+    broken = extract_text_pages(content=b"%PDF-1.7\nbroken", content_type="application/pdf", file_name="b.pdf")
+
+    assert attempts == ["pypdfium2"]
+    assert broken.pages == []
+    assert broken.error is not None and broken.error.startswith("pdf parse failed:")
+
+
+def test_docx_fast_path_matches_python_docx_for_paragraphs_and_tables() -> None:
+    from docx import Document
+    from docx.enum.text import WD_BREAK
+
+    doc = Document()
+    paragraph = doc.add_paragraph("Need statement")
+    paragraph.add_run().add_break(WD_BREAK.LINE)
+    paragraph.add_run("for 1240 households.")
+    plain_table = doc.add_table(rows=2, cols=2)
+    plain_table.cell(0, 0).text = "Milestone"
+    plain_table.cell(0, 1).text = "Quarter"
+    plain_table.cell(1, 0).text = "Launch"
+    buffer = BytesIO()
+    doc.save(buffer)
+    content = buffer.getvalue()
+
+    assert docx_parser._extract_docx_lines_fast(content) == [
+        "Need statement for 1240 households.",
+        "Milestone | Quarter",
+        "Launch",
+    ]
+    assert docx_parser._extract_docx_lines_fast(content) == docx_parser._extract_docx_lines_python_docx(content)
+
+    plain_table.cell(1, 0).merge(plain_table.cell(1, 1))
+    buffer = BytesIO()
+    doc.save(buffer)
+    merged = buffer.getvalue()
+
+    # python-docx repeats merged cells per grid column, so merged tables keep using it.
+    assert docx_parser._extract_docx_lines_fast(merged) is None
+    extraction = extract_text_pages(content=merged, content_type="application/msword", file_name="merged.docx")
+    assert extraction.error is None
+    assert extraction.pages[0].text.endswith("Launch | Launch")
+
+
+def test_rtf_run_tokenizer_matches_striprtf() -> None:
+    from striprtf.striprtf import rtf_to_text
+
+    samples = [
+        _build_rtf_bytes("Attachment summary and budget rationale.").decode("utf-8"),
+        "{\\rtf1\\ansi\\ansicpg1252{\\fonttbl{\\f0\\fcharset0 Arial;}}"
+        "{\\*\\generator Writer;}\\f0 Need statement\\par Caf\\'e9 \\u8212? \\uc2\\u8220 xyrest}",
+        "{\\rtf1 Budget\\tab 1200\\cell Total\\row}}} trailing text ignored",
+    ]
+    for sample in samples:
+        assert rtf_parser._rtf_to_text(sample) == rtf_to_text(sample)
+
+
 def test_unsupported_binary_content_is_graceful() -> None:
     payload = b"\x00\x10\x20\x30\x40binary"
     extraction = extract_text_pages(
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from pathlib import Path
 
 from fastapi.testclient import TestClient
 
+from app import main as app_module
 from app.config import settings
 from app.main import app
 from app.nova_runtime import BedrockNovaOrchestrator
@@ -38,17 +40,21 @@ class FakeBedrockRuntimeClient:
         return {"output": {"message": {"content": [{"text": text}]}}}
 
 
-def test_nova_end_to_end_api_run(tmp_path: Path, monkeypatch) -> None:
-    settings.database_url = f"sqlite:///{tmp_path}/test.db"
+def test_nova_end_to_end_api_run(
+    tmp_path: Path,
+    monkeypatch,
+    shared_memory_database_url: Callable[[str], str],
+) -> None:
+    settings.database_url = shared_memory_database_url("nova_e2e")
     settings.storage_root = str(tmp_path / "uploads")
     settings.chunk_size_chars = 220
     settings.chunk_overlap_chars = 40
-    settings.embedding_dim = 64
+    settings.embedding_dim = 16
     settings.enable_agentic_orchestration_pilot = False
 
     fake_client = FakeBedrockRuntimeClient()
     orchestrator = BedrockNovaOrchestrator(settings=settings, client=fake_client)
-    monkeypatch.setattr("app.main.get_nova_orchestrator", lambda: orchestrator)
+    monkeypatch.setattr(app_module, "get_nova_orchestrator", lambda: orchestrator)
 
     with TestClient(app) as client:
         project_id = client.post("/projects", json={"name": "Nova E2E"}).json()["id"]
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import threading
+
 import pytest
 
+import app.nova_runtime as nova_runtime_module
 from app.config import settings
-from app.nova_runtime import BedrockNovaOrchestrator, NovaRuntimeError
+from app.nova_runtime import BedrockNovaOrchestrator, NovaRuntimeError, _select_windows
 
 
 class FakeBedrockClient:
@@ -65,6 +68,28 @@ def test_nova_orchestrator_uses_expected_models() -> None:
     assert client.calls[2]["modelId"] == settings.bedrock_lite_model_id
 
 
+def test_nova_orchestrator_response_cache_reuses_identical_requests_only() -> None:
+    runtime_settings = settings.model_copy(deep=True)
+    runtime_settings.nova_response_cache_size = 4
+    client = FakeBedrockClient()
+    orchestrator = BedrockNovaOrchestrator(settings=runtime_settings, client=client)
+    evidence = [{"file_name": "rfp.txt", "page": 1, "score": 0.91, "text": "Evidence text"}]
+
+    first = orchestrator.generate_section("Need Statement", evidence)
+    first["paragraphs"].clear()
+    second = orchestrator.generate_section("Need Statement", evidence)
+    assert len(client.calls) == 1
+    assert second["paragraphs"]
+
+    orchestrator.generate_section("Program Design", evidence)
+    assert len(client.calls) == 2
+
+    uncached = BedrockNovaOrchestrator(settings=settings, client=client)
+    uncached.generate_section("Need Statement", evidence)
+    uncached.generate_section("Need Statement", evidence)
+    assert len(client.calls) == 4
+
+
 def test_nova_orchestrator_wraps_malformed_json_parse_errors() -> None:
     class MalformedJsonClient:
         def converse(self, **kwargs):
@@ -93,6 +118,25 @@ def test_nova_orchestrator_wraps_malformed_json_parse_errors() -> None:
         )
 
 
+def test_nova_orchestrator_parses_first_balanced_object_around_prose() -> None:
+    raw = (
+        'Here is the result: {"notes":"use {braces} and \\"quotes\\" freely","items":[{"id":"Q1"}]} '
+        "Let me know if you need {anything} else."
+    )
+    assert BedrockNovaOrchestrator._parse_json_object(raw) == {
+        "notes": 'use {braces} and "quotes" freely',
+        "items": [{"id": "Q1"}],
+    }
+    assert BedrockNovaOrchestrator._parse_json_object('```json\n{"ok": true}\n```') == {"ok": True}
+    with pytest.raises(NovaRuntimeError, match="not valid JSON"):
+        BedrockNovaOrchestrator._parse_json_object('{"truncated": "resp')
+
+
+def test_nova_orchestrator_keeps_wide_integers_exact() -> None:
+    parsed = BedrockNovaOrchestrator._parse_json_object('{"id": 123456789012345678901234}')
+    assert parsed == {"id": 123456789012345678901234}
+
+
 def test_nova_orchestrator_wraps_on_demand_throughput_errors_with_inference_profile_hint() -> None:
     class ThroughputClient:
         def converse(self, **kwargs):
@@ -186,3 +230,127 @@ def test_nova_orchestrator_adaptive_extraction_merges_windows_and_reports_diagno
     prompts = {item["prompt"] for item in questions}
     assert "Need Statement (250 words max): Describe local need." in prompts
     assert "Program Design (350 words max): Explain implementation." in prompts
+
+
+def test_nova_orchestrator_marks_extraction_prefix_for_prompt_caching() -> None:
+    runtime_settings = settings.model_copy(deep=True)
+    runtime_settings.bedrock_prompt_caching = True
+    runtime_settings.extraction_context_max_chunks = 2
+    runtime_settings.extraction_window_size_chunks = 2
+    runtime_settings.extraction_window_overlap_chunks = 0
+    runtime_settings.extraction_window_max_passes = 2
+
+    class RecordingClient:
+        def __init__(self) -> None:
+            self.calls: list[dict[str, object]] = []
+
+        def converse(self, **kwargs):
+            self.calls.append(kwargs)
+            text = '{"funder":null,"deadline":null,"eligibility":[],"questions":[],"required_attachments":[],"rubric":[],"disallowed_costs":[]}'  # noqa: E501
+            return {"output": {"message": {"content": [{"text": text}]}}}
+
+    client = RecordingClient()
+    orchestrator = BedrockNovaOrchestrator(settings=runtime_settings, client=client)
+    orchestrator.extract_requirements(
+        [{"file_name": "rfp.txt", "page": page, "text": f"Requirement detail {page}."} for page in range(1, 5)]
+    )
+
+    assert len(client.calls) == 2
+    prefixes = set()
+    for call in client.calls:
+        assert call["system"][-1] == {"cachePoint": {"type": "default"}}
+        content = call["messages"][0]["content"]
+        assert content[1] == {"cachePoint": {"type": "default"}}
+        assert content[2]["text"].startswith("Extraction window")
+        prefixes.add(content[0]["text"])
+    assert len(prefixes) == 1
+
+
+def test_nova_orchestrator_shares_section_instructions_across_section_keys() -> None:
+    runtime_settings = settings.model_copy(deep=True)
+    runtime_settings.bedrock_prompt_caching = True
+
+    class RecordingClient:
+        def __init__(self) -> None:
+            self.calls: list[dict[str, object]] = []
+
+        def converse(self, **kwargs):
+            self.calls.append(kwargs)
+            text = '{"section_key":"Need Statement","paragraphs":[],"missing_evidence":[]}'
+            return {"output": {"message": {"content": [{"text": text}]}}}
+
+    client = RecordingClient()
+    orchestrator = BedrockNovaOrchestrator(settings=runtime_settings, client=client)
+    ranked_chunks = [{"file_name": "impact.txt", "page": 1, "score": 0.9, "text": "Served 1240 households."}]
+    for section_key in ("Need Statement", "Program Design"):
+        orchestrator.generate_section(section_key, ranked_chunks)
+
+    contents = [call["messages"][0]["content"] for call in client.calls]
+    assert contents[0][0] == contents[1][0]
+    assert contents[0][0]["text"].startswith("Return a JSON object with keys: section_key, paragraphs")
+    assert [content[2]["text"].splitlines()[0] for content in contents] == [
+        "Target section: Need Statement",
+        "Target section: Program Design",
+    ]
+
+
+def test_nova_orchestrator_runs_extraction_windows_concurrently_in_window_order() -> None:
+    runtime_settings = settings.model_copy(deep=True)
+    runtime_settings.extraction_context_max_chunks = 2
+    runtime_settings.extraction_window_size_chunks = 2
+    runtime_settings.extraction_window_overlap_chunks = 0
+    runtime_settings.extraction_window_max_passes = 2
+    runtime_settings.extraction_window_workers = 2
+
+    class BarrierClient:
+        def __init__(self) -> None:
+            # Both windows must be in flight at once or the barrier times out.
+            self.barrier = threading.Barrier(2, timeout=5)
+
+        def converse(self, **kwargs):
+            self.barrier.wait()
+            user_text = kwargs["messages"][0]["content"][0]["text"]
+            window = "1" if "Extraction window 1 of 2" in user_text else "2"
+            text = (
+                '{"funder":"Fund ' + window + '","deadline":null,"eligibility":[],'
+                '"questions":[],"required_attachments":[],"rubric":[],"disallowed_costs":[]}'
+            )
+            return {"output": {"message": {"content": [{"text": text}]}}}
+
+    orchestrator = BedrockNovaOrchestrator(settings=runtime_settings, client=BarrierClient())
+    payload = orchestrator.extract_requirements(
+        [{"file_name": "rfp.txt", "page": page, "text": f"Requirement detail {page}."} for page in range(1, 5)]
+    )
+
+    assert payload["_extraction_diagnostics"]["window_count"] == 2
+    assert payload["funder"] == "Fund 1"
+
+
+def test_select_windows_steps_by_overlap_and_spends_spare_pass_on_tail() -> None:
+    assert _select_windows(0, 4, 1, 3) == []
+    assert _select_windows(3, 4, 1, 3) == [(0, 3)]
+    assert _select_windows(10, 4, 1, 5) == [(0, 4), (3, 7), (6, 10)]
+    assert _select_windows(11, 4, 1, 5) == [(0, 4), (3, 7), (6, 10), (9, 11), (7, 11)]
+    assert _select_windows(20, 4, 1, 2) == [(0, 4), (3, 7)]
+
+
+def test_orchestrators_share_one_default_bedrock_client_per_region(monkeypatch: pytest.MonkeyPatch) -> None:
+    boto3 = pytest.importorskip("boto3")
+    created: list[str] = []
+
+    def fake_client(service_name: str, *, region_name: str) -> object:
+        created.append(region_name)
+        return object()
+
+    monkeypatch.setattr(boto3, "client", fake_client)
+    monkeypatch.setattr(nova_runtime_module, "_BEDROCK_CLIENTS", {})
+    eu_settings = settings.model_copy(update={"aws_region": "eu-central-1"})
+    us_settings = settings.model_copy(update={"aws_region": "us-east-1"})
+
+    first = BedrockNovaOrchestrator(settings=eu_settings)
+    second = BedrockNovaOrchestrator(settings=eu_settings)
+    other_region = BedrockNovaOrchestrator(settings=us_settings)
+
+    assert first._client is second._client
+    assert other_region._client is not first._client
+    assert created == ["eu-central-1", "us-east-1"]
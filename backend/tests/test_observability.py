@@ -1,32 +1,52 @@
+import io
+import json
 import logging
+from collections.abc import Callable, Iterator
 from uuid import UUID
 
+import pytest
 from fastapi.testclient import TestClient
 
+from app.config import settings
+from app import observability
 from app.main import app
-from app.observability import sanitize_for_logging
+from app.observability import (
+    JsonFormatter,
+    configure_logging,
+    reset_request_id,
+    sanitize_for_logging,
+    set_request_id,
+    shutdown_logging,
+)
 
 
-def test_request_id_header_is_generated_when_missing() -> None:
-    with TestClient(app) as client:
-        response = client.get("/health")
+@pytest.fixture(scope="module")
+def client(tmp_path_factory: pytest.TempPathFactory, shared_memory_database_url: Callable[[str], str]):
+    # One app lifespan serves the whole module.
+    with pytest.MonkeyPatch.context() as module_patch:
+        module_patch.setattr(settings, "database_url", shared_memory_database_url("observability"))
+        module_patch.setattr(settings, "storage_root", str(tmp_path_factory.mktemp("observability") / "uploads"))
+        with TestClient(app) as module_client:
+            yield module_client
+
+
+def test_request_id_header_is_generated_when_missing(client: TestClient) -> None:
+    response = client.get("/health")
     assert response.status_code == 200
     request_id = response.headers.get("X-Request-ID")
     assert request_id is not None
     UUID(request_id)
 
 
-def test_request_id_header_is_preserved_when_provided() -> None:
-    with TestClient(app) as client:
-        response = client.get("/ready", headers={"X-Request-ID": "demo-request-123"})
+def test_request_id_header_is_preserved_when_provided(client: TestClient) -> None:
+    response = client.get("/ready", headers={"X-Request-ID": "demo-request-123"})
     assert response.status_code == 200
     assert response.headers.get("X-Request-ID") == "demo-request-123"
 
 
-def test_request_started_log_redacts_sensitive_query_values(caplog) -> None:
-    with TestClient(app) as client:
-        with caplog.at_level(logging.INFO, logger="nebula.api"):
-            response = client.get("/health?token=supersecret&email=user@example.org&q=public")
+def test_request_started_log_redacts_sensitive_query_values(client: TestClient, caplog) -> None:
+    with caplog.at_level(logging.INFO, logger="nebula.api"):
+        response = client.get("/health?token=supersecret&email=user@example.org&q=public")
     assert response.status_code == 200
 
     request_started_logs = [
@@ -85,3 +105,113 @@ def test_sanitize_for_logging_redacts_sensitive_aws_header_keys() -> None:
     assert sanitized["x-amz-credential"] == "[REDACTED]"
     assert sanitized["x-amz-signature"] == "[REDACTED]"
     assert sanitized["x-amz-date"] == "20260211T000000Z"
+
+
+def test_sanitize_for_logging_screens_plain_strings_without_changing_redaction() -> None:
+    plain = "section_drafting completed for Q3 with 4 citations"
+    assert sanitize_for_logging(plain) == plain
+    assert sanitize_for_logging("public") == "public"
+    assert sanitize_for_logging("a@b.co") == "[REDACTED_EMAIL]"
+    assert sanitize_for_logging("call 415-555-0101") == "call [REDACTED_PHONE]"
+    assert sanitize_for_logging("BEARER abc123") == "Bearer [REDACTED]"
+    # Non-ASCII case variants still reach the case-insensitive rules.
+    assert sanitize_for_logging("sessıon_token=abcdefgh1234") == "sessıon_token=[REDACTED]"
+
+
+def test_sanitize_for_logging_redacts_keys_containing_sensitive_fragments() -> None:
+    sanitized = sanitize_for_logging(
+        {"X-Client-Secret": "a", "refresh_token_hint": "b", "db-password": "c", "AWS-Access-Key": "d", "tokens": 3},
+    )
+    assert set(sanitized.values()) == {"[REDACTED]"}
+    assert sanitize_for_logging({"section_key": "Q1"}) == {"section_key": "Q1"}
+
+
+def test_sanitize_for_logging_walks_deeply_nested_payloads() -> None:
+    payload: object = {"notes": "mail user@example.org", "pair": ("a", {"token": "x"})}
+    for _ in range(3000):
+        payload = {"items": [payload]}
+
+    sanitized = sanitize_for_logging(payload)
+    for _ in range(3000):
+        sanitized = sanitized["items"][0]
+    assert sanitized == {"notes": "mail [REDACTED_EMAIL]", "pair": ("a", {"token": "[REDACTED]"})}
+
+
+@pytest.fixture()
+def log_output() -> Iterator[io.StringIO]:
+    """Capture the JSON output handler's stream, restoring the stream and listener state afterwards."""
+
+    listener_was_running = observability._LOG_LISTENER is not None
+    configure_logging("INFO")
+    output = observability._LOG_OUTPUT_HANDLER
+    assert isinstance(output, logging.StreamHandler)
+    stream = io.StringIO()
+    previous = output.setStream(stream)
+    try:
+        yield stream
+    finally:
+        shutdown_logging()
+        output.setStream(previous)
+        if listener_was_running:
+            configure_logging("INFO")
+
+
+def _logged_lines(stream: io.StringIO) -> list[dict[str, object]]:
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_configured_logging_formats_records_on_listener_thread(log_output: io.StringIO) -> None:
+    token = set_request_id("queued-request")
+    try:
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger = logging.getLogger("nebula.api")
+            logger.exception("queued %s", "event", extra={"detail": "contact jane@example.com"})
+    finally:
+        reset_request_id(token)
+    shutdown_logging()
+
+    record = next(line for line in _logged_lines(log_output) if line["message"] == "queued event")
+    assert record["request_id"] == "queued-request"
+    assert record["detail"] == "contact [REDACTED_EMAIL]"
+    assert "ValueError: boom" in record["exception"]
+
+
+def test_logging_after_shutdown_writes_through_instead_of_queueing(log_output: io.StringIO) -> None:
+    shutdown_logging()
+    token = set_request_id("after-shutdown")
+    try:
+        logging.getLogger("nebula.api").info("late %s", "event")
+    finally:
+        reset_request_id(token)
+
+    assert observability._LOG_QUEUE.empty()
+    record = next(line for line in _logged_lines(log_output) if line["message"] == "late event")
+    assert record["request_id"] == "after-shutdown"
+
+
+def test_json_formatter_stamps_when_the_record_was_logged_not_formatted() -> None:
+    record = logging.LogRecord("nebula.api", logging.INFO, __file__, 1, "queued", None, None)
+    record.created = 1_700_000_000.25
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert payload["timestamp"] == "2023-11-14T22:13:20.250000+00:00"
+
+
+def test_shutdown_logging_writes_through_records_left_behind_the_stop_sentinel(log_output: io.StringIO) -> None:
+    listener = observability._LOG_LISTENER
+    assert listener is not None
+    stop = listener.stop
+
+    def stop_then_enqueue_late_record() -> None:
+        stop()
+        late = logging.LogRecord("nebula.api", logging.INFO, __file__, 1, "raced shutdown", None, None)
+        observability._LOG_QUEUE.put_nowait(late)
+
+    listener.stop = stop_then_enqueue_late_record  # type: ignore[method-assign]
+    shutdown_logging()
+
+    assert observability._LOG_QUEUE.empty()
+    assert any(line["message"] == "raced shutdown" for line in _logged_lines(log_output))
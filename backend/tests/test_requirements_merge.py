@@ -244,6 +244,41 @@ def test_merge_requirements_filters_non_cost_noise_from_disallowed() -> None:
     assert "ters" not in merged["disallowed_costs"]
 
 
+def test_extract_requirements_payload_reuses_cached_result_without_sharing_it() -> None:
+    chunks = [{"text": "Funder: Cache Fund\nQuestion 1: Describe the need statement."}]
+
+    first = extract_requirements_payload(chunks)
+    first["questions"][0]["prompt"] = "mutated"
+    first["eligibility"].append("mutated")
+    second = extract_requirements_payload([{"text": "Funder: Cache Fund\nQuestion 1: Describe the need statement."}])
+
+    assert second["funder"] == "Cache Fund"
+    assert second["questions"][0]["prompt"] == "Describe the need statement."
+    assert second["eligibility"] == []
+    assert extract_requirements_payload([{"text": "Funder: Other Fund"}])["funder"] == "Other Fund"
+
+
+def test_merge_requirements_drops_truncated_fragments_of_longer_items() -> None:
+    empty = {"questions": [], "required_attachments": [], "rubric": [], "disallowed_costs": []}
+    eligibility = [
+        "Registered nonprofit organizations",
+        "Registered nonprofit organizations serving Dublin residents",
+        "Registered nonprofit organizations serving",
+        "Open to all",
+        "Open to all applicants",
+        "Registered nonprofit organizations serving Dublin residents",
+    ]
+
+    merged = merge_requirements_payload({**empty, "eligibility": eligibility}, {**empty, "eligibility": []})
+
+    # Keys shorter than the minimum prefix length are never treated as fragments.
+    assert merged["eligibility"] == [
+        "Registered nonprofit organizations serving Dublin residents",
+        "Open to all",
+        "Open to all applicants",
+    ]
+
+
 def test_extract_questions_pass_explicit_tags_preserves_provenance() -> None:
     rfp_text = """
 REQ-101: Describe the target population and unmet need. (max 300 words)
@@ -314,6 +349,20 @@ Narrative Requirement: Explain how outcomes will be measured across quarters.
     assert provenance_by_prompt["Explain how outcomes will be measured across quarters."] == "inline_indicator"
 
 
+def test_extract_questions_inline_subject_lines_match_from_first_subject_word() -> None:
+    rfp_text = """
+Proposals from grantees and applicants shall describe the evaluation design.
+You must submit budgets covering organizations and proposals and responses.
+"""
+
+    payload = extract_requirements_payload([{"text": rfp_text}])
+
+    assert [(item["prompt"], item.get("provenance")) for item in payload["questions"]] == [
+        ("describe the evaluation design.", "inline_indicator"),
+        ("submit budgets covering organizations and proposals and responses.", "inline_indicator"),
+    ]
+
+
 def test_extract_questions_pass_fallback_question_preserves_provenance() -> None:
     rfp_text = """
 Question 1: Describe the need statement for your service area.
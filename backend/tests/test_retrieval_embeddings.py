@@ -1,10 +1,18 @@
+import threading
+from collections import OrderedDict
+
 import pytest
 
+from app import retrieval
 from app.retrieval import (
     EmbeddingProviderError,
     EmbeddingService,
     ExtractedPage,
     chunk_pages,
+    cosine_similarity,
+    embed_text,
+    sparse_dot,
+    sparse_terms,
 )
 
 
@@ -115,3 +123,159 @@ def test_chunk_pages_records_embedding_provider_and_warning_in_hybrid_fallback()
     assert chunks[0].embedding_provider == "hash"
     assert len(warnings) == 1
     assert warnings[0].get("code") == "embedding_provider_fallback"
+
+
+def test_chunk_pages_embeds_provider_chunks_in_bounded_batches() -> None:
+    client = SuccessfulBedrockClient()
+    service = EmbeddingService(
+        mode="bedrock",
+        aws_region="us-east-1",
+        bedrock_model_id="test-model",
+        bedrock_client=client,  # type: ignore[arg-type]
+    )
+    batch_sizes: list[int] = []
+    embed_batch = service.embed_batch
+
+    def recording_embed_batch(texts: list[str], dim: int):
+        batch_sizes.append(len(texts))
+        return embed_batch(texts, dim)
+
+    service.embed_batch = recording_embed_batch  # type: ignore[method-assign]
+    pages = [ExtractedPage(page=page, text="Program evidence sentence. " * 80) for page in (1, 2)]
+
+    chunks = chunk_pages(
+        pages=pages,
+        chunk_size_chars=40,
+        chunk_overlap_chars=10,
+        embedding_dim=16,
+        embedding_service=service,
+    )
+    hash_chunks = chunk_pages(pages=pages, chunk_size_chars=40, chunk_overlap_chars=10, embedding_dim=16)
+
+    assert len(chunks) == len(hash_chunks) > 64
+    assert [(chunk.page, chunk.text) for chunk in chunks] == [(chunk.page, chunk.text) for chunk in hash_chunks]
+    assert [chunk.chunk_index for chunk in chunks] == list(range(1, len(chunks) + 1))
+    assert max(batch_sizes) <= 64
+    assert sum(batch_sizes) == client.calls == len(chunks)
+
+
+def test_chunk_pages_reuses_hash_embeddings_without_sharing_vectors() -> None:
+    pages = [ExtractedPage(page=1, text="Need statement evidence for households served " * 4)]
+
+    first = chunk_pages(pages=pages, chunk_size_chars=60, chunk_overlap_chars=10, embedding_dim=32)
+    second = chunk_pages(pages=pages, chunk_size_chars=60, chunk_overlap_chars=10, embedding_dim=32)
+
+    assert [chunk.embedding for chunk in first] == [chunk.embedding for chunk in second]
+    assert [chunk.chunk_index for chunk in first] == list(range(1, len(first) + 1))
+    first[0].embedding[0] = 99.0
+    assert second[0].embedding[0] != 99.0
+
+
+def test_chunk_pages_hash_cache_is_chunk_bounded_and_thread_safe(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(retrieval, "_HASH_CHUNK_CACHE", OrderedDict())
+    monkeypatch.setattr(retrieval, "_HASH_CHUNK_CACHE_MAX_CHUNKS", 20)
+    monkeypatch.setattr(retrieval, "_hash_chunk_cache_size", 0)
+    errors: list[BaseException] = []
+
+    def worker(offset: int) -> None:
+        try:
+            for step in range(200):
+                pages = [ExtractedPage(page=1, text="evidence " * ((offset * 7 + step) % 13 + 5))]
+                chunk_pages(pages=pages, chunk_size_chars=10, chunk_overlap_chars=2, embedding_dim=16)
+        except BaseException as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    cached_chunks = sum(len(entry) for entry in retrieval._HASH_CHUNK_CACHE.values())
+    assert cached_chunks == retrieval._hash_chunk_cache_size <= 20
+
+
+def test_embed_text_reuses_cached_vectors_without_sharing_them() -> None:
+    first = embed_text("rent support for households", 32)
+    second = embed_text("rent support for households", 32)
+
+    assert first == second
+    first[0] = 99.0
+    assert embed_text("rent support for households", 32)[0] != 99.0
+
+
+class ConcurrentBedrockClient:
+    def __init__(self, parties: int) -> None:
+        self.barrier = threading.Barrier(parties, timeout=5)
+        self.texts: list[str] = []
+
+    def embed(self, text: str, dim: int) -> list[float]:
+        self.texts.append(text)
+        if len(self.texts) > 1:
+            self.barrier.wait()
+        return [float(len(text))] * dim
+
+
+def test_embed_batch_fans_provider_calls_out_after_first_succeeds() -> None:
+    client = ConcurrentBedrockClient(parties=3)
+    service = EmbeddingService(
+        mode="bedrock",
+        aws_region="us-east-1",
+        bedrock_model_id="test-model",
+        bedrock_client=client,  # type: ignore[arg-type]
+        batch_workers=3,
+    )
+    texts = ["a", "bb", "ccc", "dddd"]
+
+    results = service.embed_batch(texts, 8)
+
+    assert [result.vector[0] for result in results] == [1.0, 2.0, 3.0, 4.0]
+    assert all(result.provider == "bedrock" for result in results)
+    assert client.texts[0] == "a" and sorted(client.texts) == texts
+
+
+def test_embed_batch_stops_calling_failed_provider_in_hybrid_mode() -> None:
+    failing_client = FailingBedrockClient()
+    service = EmbeddingService(
+        mode="hybrid",
+        aws_region="us-east-1",
+        bedrock_model_id="test-model",
+        bedrock_client=failing_client,  # type: ignore[arg-type]
+        batch_workers=4,
+    )
+
+    results = service.embed_batch(["households served", "grant outcomes", "rent support"], 32)
+
+    assert [result.provider for result in results] == ["hash", "hash", "hash"]
+    assert failing_client.calls == 1
+
+
+def test_embed_batch_matches_single_text_embeddings() -> None:
+    service = EmbeddingService(
+        mode="hash",
+        aws_region="us-east-1",
+        bedrock_model_id="unused",
+    )
+    texts = ["households served", "rent support for households", ""]
+
+    batch = service.embed_batch(texts, 32)
+
+    assert [result.vector for result in batch] == [service.embed(text, 32).vector for text in texts]
+    assert all(result.provider == "hash" for result in batch)
+
+
+def test_sparse_dot_matches_dense_cosine_similarity() -> None:
+    query = embed_text("rent support households", 64)
+    chunk = embed_text("We served 1240 households with rent support in 2024.", 64)
+
+    assert sparse_dot(sparse_terms(query), chunk) == cosine_similarity(query, chunk)
+
+
+def test_chunk_pages_fused_tokenization_matches_per_chunk_embeddings() -> None:
+    pages = [ExtractedPage(page=1, text="Households received rent support; outcomes improved in 2024. " * 3)]
+
+    chunks = chunk_pages(pages=pages, chunk_size_chars=25, chunk_overlap_chars=7, embedding_dim=32)
+
+    assert chunks
+    assert all(chunk.embedding == embed_text(chunk.text, 32) for chunk in chunks)
@@ -1,56 +1,35 @@
-from pathlib import Path
+from collections.abc import Callable
 
 import pytest
 from fastapi.testclient import TestClient
 
+from app import main as app_module
 from app.config import settings
-from app.coverage import build_coverage_payload
-from app.drafting import build_draft_payload
 from app.main import app
-from app.requirements import extract_requirements_payload
 from app.api.services.tracing import evaluate_full_draft_run
 
 
-@pytest.fixture(autouse=True)
-def mock_nova_orchestrator(monkeypatch: pytest.MonkeyPatch):
-    class FakeNovaOrchestrator:
-        def plan_section_generation(
-            self, section_key: str, requested_top_k: int, available_chunk_count: int
-        ) -> dict[str, object]:
-            bounded = max(1, min(requested_top_k, available_chunk_count))
-            return {
-                "retrieval_top_k": bounded,
-                "retry_on_missing_evidence": True,
-                "rationale": "default-plan",
-            }
-
-        def extract_requirements(self, chunks: list[dict[str, object]]) -> dict[str, object]:
-            return extract_requirements_payload(chunks)
-
-        def generate_section(
-            self,
-            section_key: str,
-            ranked_chunks: list[dict[str, object]],
-            *,
-            prompt_context: dict[str, str] | None = None,
-        ) -> dict[str, object]:
-            return build_draft_payload(section_key, ranked_chunks)
-
-        def compute_coverage(
-            self, requirements: dict[str, object], draft: dict[str, object]
-        ) -> dict[str, object]:
-            return build_coverage_payload(requirements, draft)
+@pytest.fixture(scope="module", autouse=True)
+def mock_nova_orchestrator(fake_nova_orchestrator: object):
+    with pytest.MonkeyPatch.context() as module_patch:
+        module_patch.setattr(app_module, "get_nova_orchestrator", lambda: fake_nova_orchestrator)
+        yield
 
-    monkeypatch.setattr("app.main.get_nova_orchestrator", lambda: FakeNovaOrchestrator())
 
+@pytest.fixture(scope="module")
+def client(tmp_path_factory: pytest.TempPathFactory, shared_memory_database_url: Callable[[str], str]):
+    # One app lifespan serves every full-draft test in the module.
+    with pytest.MonkeyPatch.context() as module_patch:
+        module_patch.setattr(settings, "database_url", shared_memory_database_url("run_diagnostics"))
+        module_patch.setattr(settings, "storage_root", str(tmp_path_factory.mktemp("run_diagnostics") / "uploads"))
+        module_patch.setattr(settings, "chunk_size_chars", 220)
+        module_patch.setattr(settings, "chunk_overlap_chars", 40)
+        module_patch.setattr(settings, "embedding_dim", 16)
+        with TestClient(app) as module_client:
+            yield module_client
 
-def test_generate_full_draft_persists_traces_and_evals(tmp_path: Path) -> None:
-    settings.database_url = f"sqlite:///{tmp_path}/test.db"
-    settings.storage_root = str(tmp_path / "uploads")
-    settings.chunk_size_chars = 220
-    settings.chunk_overlap_chars = 40
-    settings.embedding_dim = 64
 
+def test_generate_full_draft_persists_traces_and_evals(client: TestClient) -> None:
     source_text = b"""
 Funder: City Community Fund
 Deadline: March 30, 2026
@@ -59,26 +38,25 @@ Question 2: Describe the program design. Limit 150 words.
 We served 1240 households with emergency support in 2024.
 """
 
-    with TestClient(app) as client:
-        project_id = client.post("/projects", json={"name": "Tracing"}).json()["id"]
-        upload = client.post(
-            f"/projects/{project_id}/upload",
-            files=[("files", ("rfp.txt", source_text, "text/plain"))],
-        )
-        assert upload.status_code == 200
-
-        run = client.post(
-            f"/projects/{project_id}/generate-full-draft",
-            json={"top_k": 2, "max_revision_rounds": 1},
-        )
-        assert run.status_code == 200
-        run_payload = run.json()
-        run_id = run_payload["run_id"]
-        assert run_id
-
-        diagnostics = client.get(f"/projects/{project_id}/runs/{run_id}/diagnostics")
-        assert diagnostics.status_code == 200
-        payload = diagnostics.json()
+    project_id = client.post("/projects", json={"name": "Tracing"}).json()["id"]
+    upload = client.post(
+        f"/projects/{project_id}/upload",
+        files=[("files", ("rfp.txt", source_text, "text/plain"))],
+    )
+    assert upload.status_code == 200
+
+    run = client.post(
+        f"/projects/{project_id}/generate-full-draft",
+        json={"top_k": 2, "max_revision_rounds": 1},
+    )
+    assert run.status_code == 200
+    run_payload = run.json()
+    run_id = run_payload["run_id"]
+    assert run_id
+
+    diagnostics = client.get(f"/projects/{project_id}/runs/{run_id}/diagnostics")
+    assert diagnostics.status_code == 200
+    payload = diagnostics.json()
 
     trace_events = payload["trace_events"]
     assert len(trace_events) >= 8
@@ -99,13 +77,7 @@ We served 1240 households with emergency support in 2024.
     assert judge_evals[0]["run_id"] == run_id
 
 
-def test_trace_payload_redacts_sensitive_values(tmp_path: Path) -> None:
-    settings.database_url = f"sqlite:///{tmp_path}/test.db"
-    settings.storage_root = str(tmp_path / "uploads")
-    settings.chunk_size_chars = 220
-    settings.chunk_overlap_chars = 40
-    settings.embedding_dim = 64
-
+def test_trace_payload_redacts_sensitive_values(client: TestClient) -> None:
     source_text = b"""
 Funder: City Community Fund
 Deadline: March 30, 2026
@@ -115,24 +87,23 @@ We served 1240 households with emergency support in 2024.
 
     secret_brief = "contact user@example.org aws_secret_access_key=abcd1234abcd1234abcd1234abcd1234abcd1234"
 
-    with TestClient(app) as client:
-        project_id = client.post("/projects", json={"name": "Tracing Redaction"}).json()["id"]
-        upload = client.post(
-            f"/projects/{project_id}/upload",
-            files=[("files", ("rfp.txt", source_text, "text/plain"))],
-        )
-        assert upload.status_code == 200
-
-        run = client.post(
-            f"/projects/{project_id}/generate-full-draft",
-            json={"top_k": 2, "max_revision_rounds": 1, "context_brief": secret_brief},
-        )
-        assert run.status_code == 200
-        run_id = run.json()["run_id"]
-
-        diagnostics = client.get(f"/projects/{project_id}/runs/{run_id}/diagnostics")
-        assert diagnostics.status_code == 200
-        trace_events = diagnostics.json()["trace_events"]
+    project_id = client.post("/projects", json={"name": "Tracing Redaction"}).json()["id"]
+    upload = client.post(
+        f"/projects/{project_id}/upload",
+        files=[("files", ("rfp.txt", source_text, "text/plain"))],
+    )
+    assert upload.status_code == 200
+
+    run = client.post(
+        f"/projects/{project_id}/generate-full-draft",
+        json={"top_k": 2, "max_revision_rounds": 1, "context_brief": secret_brief},
+    )
+    assert run.status_code == 200
+    run_id = run.json()["run_id"]
+
+    diagnostics = client.get(f"/projects/{project_id}/runs/{run_id}/diagnostics")
+    assert diagnostics.status_code == 200
+    trace_events = diagnostics.json()["trace_events"]
 
     run_start = next(
         event for event in trace_events if event["phase"] == "run" and event["event_type"] == "started"
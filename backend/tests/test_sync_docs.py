@@ -13,7 +13,9 @@ REPO_ROOT = Path(__file__).resolve().parents[2]
 SYNC_DOCS_PATH = REPO_ROOT / "scripts" / "sync_docs.py"
 
 
-def _load_sync_docs_module() -> ModuleType:
+@pytest.fixture(scope="module")
+def module() -> ModuleType:
+    # Tests only monkeypatch ROOT/STATUS_PATH (restored per test), so one load serves the file.
     spec = importlib.util.spec_from_file_location("sync_docs_module", SYNC_DOCS_PATH)
     assert spec is not None and spec.loader is not None
     module = importlib.util.module_from_spec(spec)
@@ -91,15 +93,13 @@ def _seed_temp_repo(tmp_path: Path, module: ModuleType, *, stale: bool) -> tuple
     return repo_root, status_path, status
 
 
-def test_validate_status_schema_accepts_phase_only_payload() -> None:
-    module = _load_sync_docs_module()
+def test_validate_status_schema_accepts_phase_only_payload(module: ModuleType) -> None:
     validated = module.validate_status_schema(_base_status())
     assert validated["current_phase"] == "phase_one"
     assert isinstance(validated["phases"], list)
 
 
-def test_validate_status_schema_rejects_legacy_week_keys() -> None:
-    module = _load_sync_docs_module()
+def test_validate_status_schema_rejects_legacy_week_keys(module: ModuleType) -> None:
     legacy = _base_status()
     legacy["weeks"] = []
     legacy["current_week"] = 1
@@ -108,8 +108,7 @@ def test_validate_status_schema_rejects_legacy_week_keys() -> None:
         module.validate_status_schema(legacy)
 
 
-def test_validate_status_schema_rejects_unknown_current_phase() -> None:
-    module = _load_sync_docs_module()
+def test_validate_status_schema_rejects_unknown_current_phase(module: ModuleType) -> None:
     invalid = _base_status()
     invalid["current_phase"] = "missing_phase"
 
@@ -118,9 +117,8 @@ def test_validate_status_schema_rejects_unknown_current_phase() -> None:
 
 
 def test_main_check_passes_when_docs_are_current(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    module: ModuleType, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    module = _load_sync_docs_module()
     repo_root, status_path, _ = _seed_temp_repo(tmp_path, module, stale=False)
 
     monkeypatch.setattr(module, "ROOT", repo_root)
@@ -131,11 +129,11 @@ def test_main_check_passes_when_docs_are_current(
 
 
 def test_main_check_fails_when_docs_are_stale(
+    module: ModuleType,
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
     capsys: pytest.CaptureFixture[str],
 ) -> None:
-    module = _load_sync_docs_module()
     repo_root, status_path, _ = _seed_temp_repo(tmp_path, module, stale=True)
 
     monkeypatch.setattr(module, "ROOT", repo_root)
@@ -152,9 +150,8 @@ def test_main_check_fails_when_docs_are_stale(
 
 
 def test_main_write_mode_is_deterministic(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    module: ModuleType, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    module = _load_sync_docs_module()
     repo_root, status_path, _ = _seed_temp_repo(tmp_path, module, stale=True)
 
     monkeypatch.setattr(module, "ROOT", repo_root)
@@ -165,3 +162,13 @@ def test_main_write_mode_is_deterministic(
 
     monkeypatch.setattr(sys, "argv", ["sync_docs.py", "--check"])
     assert module.main() == 0
+
+
+def test_replace_block_splices_generated_body_literally(module: ModuleType) -> None:
+    text = "intro\n<!-- AUTO-GEN:X:START -->\nold\n<!-- AUTO-GEN:X:END -->\noutro\n"
+
+    updated = module._replace_block(text, "X", r"- path C:\docs\1 ")
+
+    assert updated == "intro\n<!-- AUTO-GEN:X:START -->\n- path C:\\docs\\1\n<!-- AUTO-GEN:X:END -->\noutro\n"
+    with pytest.raises(SystemExit, match="Could not find block Y"):
+        module._replace_block(text, "Y", "body")
@@ -9,7 +9,6 @@ from __future__ import annotations
 
 import argparse
 import json
-import re
 import sys
 from pathlib import Path
 from typing import Callable
@@ -26,6 +25,7 @@ STATUS_LABELS = {
     "blocked": "Blocked",
     "partial": "Partial",
 }
+_ALLOWED_STATUSES_TEXT = ", ".join(sorted(STATUS_LABELS))
 
 
 def _label(value: str) -> str:
@@ -56,8 +56,9 @@ def _require_string(
 def _require_status(value: object, field: str) -> str:
     normalized = _require_string(value, field)
     if normalized not in STATUS_LABELS:
-        allowed = ", ".join(sorted(STATUS_LABELS))
-        raise _schema_error(f"Field '{field}' has unsupported status '{normalized}' (allowed: {allowed}).")
+        raise _schema_error(
+            f"Field '{field}' has unsupported status '{normalized}' (allowed: {_ALLOWED_STATUSES_TEXT})."
+        )
     return normalized
 
 
@@ -66,7 +67,9 @@ def _require_string_list(value: object, field: str) -> list[str]:
         raise _schema_error(f"Field '{field}' must be a list of strings.")
     items: list[str] = []
     for index, raw in enumerate(value):
-        items.append(_require_string(raw, f"{field}[{index}]"))
+        # Well-formed entries skip building the per-item field path used only in error messages.
+        normalized = raw.strip() if type(raw) is str else ""
+        items.append(normalized or _require_string(raw, f"{field}[{index}]"))
     return items
 
 
@@ -186,13 +189,12 @@ def _pick_current_phase(status: dict) -> dict:
     return phases[0] if phases else {}
 
 
-def _render_list(title: str, items: list[str], empty_text: str) -> list[str]:
-    lines = [f"### {title}"]
+def _render_list(lines: list[str], title: str, items: list[str], empty_text: str) -> None:
+    lines.append(f"### {title}")
     if items:
-        lines.extend([f"- {item}" for item in items])
+        lines.extend(f"- {item}" for item in items)
     else:
         lines.append(f"- {empty_text}")
-    return lines
 
 
 def render_readme_status(status: dict) -> str:
@@ -208,29 +210,11 @@ def render_readme_status(status: dict) -> str:
         )
 
     lines.append("")
-    lines.extend(
-        _render_list(
-            "Done Recently",
-            current.get("done", []),
-            "No completed items recorded yet.",
-        )
-    )
+    _render_list(lines, "Done Recently", current.get("done", []), "No completed items recorded yet.")
     lines.append("")
-    lines.extend(
-        _render_list(
-            "Next Up",
-            current.get("next", []),
-            "No upcoming items recorded yet.",
-        )
-    )
+    _render_list(lines, "Next Up", current.get("next", []), "No upcoming items recorded yet.")
     lines.append("")
-    lines.extend(
-        _render_list(
-            "Current Blockers",
-            current.get("blockers", []),
-            "No blockers recorded.",
-        )
-    )
+    _render_list(lines, "Current Blockers", current.get("blockers", []), "No blockers recorded.")
     return "\n".join(lines)
 
 
@@ -248,19 +232,13 @@ def render_development_status(status: dict) -> str:
 
     current = _pick_current_phase(status)
     lines.append("")
-    lines.extend(
-        _render_list(
-            "Current Priorities",
-            current.get("next", []),
-            "No priorities recorded.",
-        )
-    )
+    _render_list(lines, "Current Priorities", current.get("next", []), "No priorities recorded.")
     lines.append("")
     risk_rows = status.get("high_risks", [])
     lines.append("### Active Risks")
     if risk_rows:
         lines.extend(
-            [f"- {entry.get('risk', 'Unnamed risk')} -> {entry.get('mitigation', 'No mitigation')}" for entry in risk_rows]
+            f"- {entry.get('risk', 'Unnamed risk')} -> {entry.get('mitigation', 'No mitigation')}" for entry in risk_rows
         )
     else:
         lines.append("- No active risks recorded.")
@@ -288,15 +266,20 @@ def render_aws_status(status: dict) -> str:
 def _replace_block(file_text: str, block_name: str, generated_body: str) -> str:
     start = f"<!-- AUTO-GEN:{block_name}:START -->"
     end = f"<!-- AUTO-GEN:{block_name}:END -->"
-    pattern = re.compile(
-        re.escape(start) + r"\n.*?\n" + re.escape(end),
-        flags=re.DOTALL,
-    )
-    replacement = f"{start}\n{generated_body.strip()}\n{end}"
-    updated_text, count = pattern.subn(replacement, file_text, count=1)
-    if count != 1:
-        raise SystemExit(f"Could not find block {block_name} in target document.")
-    return updated_text
+    end_line = f"\n{end}"
+    # Same match as START\n.*?\nEND: the first START directly followed by a newline, up to the
+    # nearest following "\nEND" that leaves at least that newline in between.
+    index = file_text.find(start)
+    while index >= 0:
+        body_start = index + len(start)
+        if file_text.startswith("\n", body_start):
+            end_index = file_text.find(end_line, body_start + 1)
+            if end_index < 0:
+                break
+            replacement = f"{start}\n{generated_body.strip()}\n{end}"
+            return file_text[:index] + replacement + file_text[end_index + len(end_line) :]
+        index = file_text.find(start, index + 1)
+    raise SystemExit(f"Could not find block {block_name} in target document.")
 
 
 def _sync_file(